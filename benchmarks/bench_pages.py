@@ -0,0 +1,183 @@
+"""
+Page-level performance benchmark for the Streamlit app.
+
+Drives every page through Streamlit's AppTest against the local DuckDB backend
+and reports, per page: warehouse round trips per rerun, rerun wall time,
+peak Python memory during a rerun and Cortex calls.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pages --clients 200 --weeks 12 --repeat 5
+    python -m benchmarks.bench_pages --pages "Workout Summary" --json bench.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from local_dev import FakeCortex, LocalSession, datagen, install
+
+APP_PATH = Path(__file__).resolve().parent.parent / 'streamlit_app' / 'app.py'
+
+# Page label -> page script registered with st.navigation (relative to the app directory)
+PAGE_FILES = {
+    "Home": "app_pages/home.py",
+    "Workout Generator": "app_pages/workout_generator.py",
+    "Record Exercise Results": "app_pages/exercise_results.py",
+    "Meal Plan Generator": "app_pages/meal_plan_generator.py",
+    "Workout Summary": "app_pages/workout_summary.py",
+    "Meal Plan Summary": "app_pages/meal_plan_summary.py",
+    "Schedule Board": "app_pages/schedule_board.py",
+    "Weight Tracking": "app_pages/weight_tracking.py",
+    "Client Profiles": "app_pages/client_profiles.py",
+    "Import History": "app_pages/data_import.py",
+    "Data Export": "app_pages/data_export.py",
+}
+PAGES = list(PAGE_FILES)
+
+def _click(label_prefix: str):
+    """Return an action that clicks the first button whose label starts with `label_prefix`"""
+    def action(at):
+        next(b for b in at.button if b.label.startswith(label_prefix)).click()
+    return action
+
+def _select_training_workout(at):
+    """Pick the first workout that has exercises (rest days have no set-entry form)"""
+    workout = at.selectbox(key="er_workout_select")
+    workout.set_value(next(o for o in workout.options if not o.endswith("| Rest Day"))).run()
+
+def _generate_with_ai(at):
+    """Switch the Workout Generator to AI mode (relabels the button), then generate"""
+    at.radio(key="workout_generation_mode").set_value("🤖 AI").run()
+    _click("🤖 Generate Full Week")(at)
+
+# Optional interactions measured in addition to a plain rerun of each page
+ACTIONS = {
+    "Workout Generator": [("instant", _click("⚡ Generate Full Week")), ("generate", _generate_with_ai)],
+    "Record Exercise Results": [("save", _click("✅ Save Exercise Results"))],
+    "Meal Plan Generator": [("generate", _click("📐 Build Meal Plan"))],
+    "Data Export": [("export", _click("📦 Export History"))],
+}
+
+# Untimed preparation run after opening a page, before any scenario is measured
+SETUP = {
+    "Record Exercise Results": _select_training_workout,
+}
+
+# ============================================================================
+# Driving the App
+# ============================================================================
+
+def open_page(page: str, timeout: float):
+    """Start a fresh AppTest session and navigate to `page`"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    at.run()
+    if page != PAGES[0]:
+        at.switch_page(PAGE_FILES[page]).run()
+    return at
+
+def wait_for_jobs(session: LocalSession, timeout: float):
+    """Block until no generation job is queued or running; returns the time waited"""
+    started = time.perf_counter()
+    while session.conn.execute(
+        "SELECT COUNT(*) FROM TRAINING_DB.PUBLIC.generation_jobs WHERE status IN ('QUEUED', 'RUNNING')"
+    ).fetchone()[0]:
+        if time.perf_counter() - started > timeout:
+            raise TimeoutError("Generation jobs did not finish")
+        time.sleep(0.01)
+    return time.perf_counter() - started
+
+def measure(session: LocalSession, at, action=None, repeat: int = 5, timeout: float = 120.0):
+    """Rerun the current page `repeat` times; returns timing, query and memory stats
+
+    Background generation jobs started by the rerun are waited for and counted
+    (queries, Cortex calls), but their run time is reported separately.
+    """
+    timings, background, queries, cortex_calls = [], [], [], []
+    for _ in range(repeat):
+        session.reset_stats()
+        if action:
+            action(at)
+        started = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - started)
+        background.append(wait_for_jobs(session, timeout))
+        queries.append(session.query_count)
+        cortex_calls.append(len(session.cortex.calls))
+
+    # Separate pass for memory: tracemalloc overhead would distort the timings
+    tracemalloc.start()
+    if action:
+        action(at)
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    wait_for_jobs(session, timeout)
+
+    return {
+        'queries_per_rerun': statistics.median(queries),
+        'cortex_calls_per_rerun': statistics.median(cortex_calls),
+        'rerun_ms_median': statistics.median(timings) * 1000,
+        'rerun_ms_max': max(timings) * 1000,
+        'background_ms_median': statistics.median(background) * 1000,
+        'peak_mib': peak / 2**20,
+        'errors': [str(e.message) for e in at.exception],
+    }
+
+def run(pages, clients: int, weeks: int, repeat: int, cortex_latency: float, timeout: float, seed: int):
+    session = install(LocalSession(cortex=FakeCortex(latency_s=cortex_latency)))
+    sizes = datagen.run(datagen.SessionSink(session), clients=clients, weeks=weeks, seed=seed)
+
+    results = []
+    for page in pages:
+        scenarios = [("view", None)]
+        scenarios.extend(ACTIONS.get(page, []))
+        for scenario, action in scenarios:
+            at = open_page(page, timeout)
+            if page in SETUP:
+                SETUP[page](at)
+            stats = measure(session, at, action=action, repeat=repeat, timeout=timeout)
+            results.append({'page': page, 'scenario': scenario, **stats})
+
+    return {'sizes': sizes, 'results': results}
+
+# ============================================================================
+# Reporting
+# ============================================================================
+
+def print_report(report: dict):
+    sizes = ', '.join(f"{k}={v}" for k, v in report['sizes'].items())
+    print(f"Data: {sizes}\n")
+    header = f"{'Page':<26}{'Scenario':<10}{'Queries':>8}{'Cortex':>8}{'Median ms':>11}{'Max ms':>9}{'Bg ms':>9}{'Peak MiB':>10}  Errors"
+    print(header)
+    print('-' * len(header))
+    for r in report['results']:
+        errors = '; '.join(e[:60] for e in r['errors']) or '-'
+        print(
+            f"{r['page']:<26}{r['scenario']:<10}{r['queries_per_rerun']:>8g}{r['cortex_calls_per_rerun']:>8g}"
+            f"{r['rerun_ms_median']:>11.1f}{r['rerun_ms_max']:>9.1f}{r['background_ms_median']:>9.1f}{r['peak_mib']:>10.1f}  {errors}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', nargs='*', default=PAGES, help="Pages to benchmark (default: all)")
+    parser.add_argument('--clients', type=int, default=20, help="Number of seeded clients")
+    parser.add_argument('--weeks', type=int, default=8, help="Weeks of history per client")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed reruns per page")
+    parser.add_argument('--cortex-latency', type=float, default=0.0, help="Simulated Cortex latency in seconds")
+    parser.add_argument('--timeout', type=float, default=120.0, help="AppTest per-run timeout in seconds")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', type=Path, help="Also write the report as JSON to this path")
+    args = parser.parse_args()
+
+    report = run(args.pages, args.clients, args.weeks, args.repeat, args.cortex_latency, args.timeout, args.seed)
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Cold-start measurement for the Streamlit app.
+
+Reports two things, each measured in a fresh interpreter so module caches are cold
+(as after a warehouse/container suspend):
+
+1. Import profile - everything the app imports on top of an already-warm Streamlit
+   runtime, from `python -X importtime`, aggregated per top-level package.
+2. Time to first render - the first full script run of the landing page, compared
+   with a warm rerun in the same process.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_startup --runs 3 --top 15
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+APP_PATH = REPO_ROOT / 'streamlit_app' / 'app.py'
+MARKER = '@@APP_START'
+
+CHILD = f"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+from local_dev import datagen, install
+
+session = install()
+datagen.run(datagen.SessionSink(session), clients=20, weeks=4)
+# Warm the Streamlit runtime itself so only app-attributable imports follow the marker
+AppTest.from_string("import streamlit as st\\nst.write('warm')").run()
+session.reset_stats()
+
+sys.stderr.write({MARKER!r} + "\\n")
+sys.stderr.flush()
+at = AppTest.from_file({str(APP_PATH)!r}, default_timeout=120)
+started = time.perf_counter()
+at.run()
+first = time.perf_counter() - started
+started = time.perf_counter()
+at.run()
+warm = time.perf_counter() - started
+print(json.dumps({{'first_render_s': first, 'warm_rerun_s': warm, 'queries': session.query_count,
+                  'errors': [str(e.message) for e in at.exception]}}))
+"""
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)')
+
+def parse_import_profile(stderr: str):
+    """Cumulative import time (ms) per top-level module imported after the marker"""
+    _, _, after = stderr.partition(MARKER)
+    totals = {}
+    for match in IMPORT_LINE.finditer(after):
+        _, cumulative, indent, module = match.groups()
+        if len(indent) == 1:  # top-level import (nested ones are included in its cumulative time)
+            package = module.split('.')[0]
+            totals[package] = totals.get(package, 0.0) + int(cumulative) / 1000
+    return totals
+
+def measure_once():
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['imports_ms'] = parse_import_profile(proc.stderr)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help="Cold processes to start")
+    parser.add_argument('--top', type=int, default=15, help="Packages to show in the import profile")
+    parser.add_argument('--json', type=Path, help="Also write the raw results as JSON to this path")
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+
+    packages = {p for r in runs for p in r['imports_ms']}
+    profile = sorted(
+        ((p, statistics.median(r['imports_ms'].get(p, 0.0) for r in runs)) for p in packages),
+        key=lambda item: item[1], reverse=True
+    )
+    print("Import profile (app imports on top of a warm Streamlit runtime, median ms)")
+    print('-' * 44)
+    for package, ms in profile[:args.top]:
+        print(f"{package:<32}{ms:>10.1f}")
+    print(f"{'TOTAL':<32}{sum(ms for _, ms in profile):>10.1f}\n")
+
+    first = statistics.median(r['first_render_s'] for r in runs) * 1000
+    warm = statistics.median(r['warm_rerun_s'] for r in runs) * 1000
+    print(f"Time to first render (cold):  {first:8.1f} ms")
+    print(f"Warm rerun:                   {warm:8.1f} ms")
+    print(f"Queries (first render + rerun): {runs[0]['queries']}")
+    errors = runs[0]['errors']
+    if errors:
+        print(f"Errors: {errors}")
+
+    if args.json:
+        args.json.write_text(json.dumps(runs, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+"""
+Local development backend for the AI Personal Trainer app.
+
+A DuckDB-backed stand-in for the Snowpark Session subset the app uses, the Stage 1
+DDL translated to DuckDB, a fake Cortex that replays recorded responses and a
+synthetic scale dataset generator (local_dev.datagen).
+Not deployed to Snowflake.
+"""
+
+from local_dev.cortex import FakeCortex
+from local_dev.snowpark import LocalSession, install
+
+__all__ = ['FakeCortex', 'LocalSession', 'install']
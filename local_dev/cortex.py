@@ -0,0 +1,33 @@
+"""
+Fake SNOWFLAKE.CORTEX.COMPLETE for the local backend.
+
+Returns recorded responses from fixtures/cortex_responses.json. Each fixture has a
+`match` substring that is looked for in the prompt; the first match wins.
+"""
+
+import json
+import time
+from pathlib import Path
+
+FIXTURES_PATH = Path(__file__).parent / 'fixtures' / 'cortex_responses.json'
+
+class FakeCortex:
+    """Deterministic stand-in for Cortex COMPLETE that replays recorded responses"""
+
+    def __init__(self, fixtures_path: Path = FIXTURES_PATH, latency_s: float = 0.0):
+        with open(fixtures_path) as f:
+            self.fixtures = json.load(f)
+        self.latency_s = latency_s
+        self.calls = []
+
+    def complete(self, model: str, prompt: str) -> str:
+        """Return the recorded response for the first fixture whose `match` occurs in the prompt"""
+        self.calls.append({'model': model, 'prompt': prompt})
+        if self.latency_s:
+            time.sleep(self.latency_s)
+
+        for fixture in self.fixtures:
+            if fixture['match'] in prompt:
+                response = fixture['response']
+                return response if isinstance(response, str) else json.dumps(response)
+        raise ValueError(f"No recorded Cortex response matches prompt: {prompt[:80]!r}")
@@ -0,0 +1,704 @@
+"""
+Synthetic scale dataset generator for the Stage 1 schema.
+
+Produces clients, years of generated_workouts (with Cortex-shaped EXERCISES payloads),
+per-set exercise_results, daily weigh_ins, weekly body_measurements and weekly
+meal_plans, with each generation prompt stored once in cortex_prompts, plus the
+exercises_library and recipes reference tables.
+
+Output is seeded and deterministic: every client draws from its own RNG derived from
+(seed, client index), so results do not depend on the chunk size. Clients are
+generated in chunks and each chunk is streamed to the sink before the next one is
+built, so memory is bounded by the chunk size rather than the dataset size.
+
+Usage (from the repository root):
+    python -m local_dev.datagen --clients 5000 --weeks 104 --out data/ --format parquet
+    python -m local_dev.datagen --clients 200 --format csv --out data/ --today 2026-10-19
+"""
+
+import argparse
+import binascii
+import hashlib
+import json
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+# ============================================================================
+# Schema
+# ============================================================================
+
+# Column order and types mirror sql/02_stage1_create_tables.sql. 'variant' columns
+# carry JSON text and are loaded with PARSE_JSON.
+TABLES = {
+    'exercises_library': [
+        ('exercise_id', 'str'), ('exercise_name', 'str'), ('category', 'str'),
+        ('target_muscles', 'variant'), ('equipment_required', 'variant'), ('difficulty_level', 'str'),
+        ('instructions', 'str'), ('variations', 'variant'),
+    ],
+    'recipes': [
+        ('recipe_id', 'str'), ('recipe_name', 'str'), ('servings', 'int'), ('total_calories', 'int'),
+        ('protein_g', 'float'), ('carbs_g', 'float'), ('fat_g', 'float'), ('ingredients', 'variant'),
+        ('instructions', 'str'), ('prep_time_min', 'int'), ('cook_time_min', 'int'), ('tags', 'variant'),
+    ],
+    'clients': [
+        ('client_id', 'str'), ('client_name', 'str'), ('age', 'int'), ('gender', 'str'),
+        ('current_weight_kg', 'float'), ('height_cm', 'int'), ('fitness_level', 'str'),
+        ('fitness_goals', 'variant'), ('available_equipment', 'variant'), ('days_per_week', 'int'),
+        ('workout_duration_min', 'int'), ('dietary_preferences', 'variant'), ('allergies', 'str'),
+        ('target_calories', 'int'), ('target_protein_g', 'int'), ('created_at', 'timestamp'),
+        ('updated_at', 'timestamp'),
+    ],
+    'weigh_ins': [
+        ('weigh_in_id', 'str'), ('client_id', 'str'), ('weigh_in_date', 'date'), ('weight_kg', 'float'),
+        ('body_fat_pct', 'float'), ('notes', 'str'), ('recorded_at', 'timestamp'),
+    ],
+    'body_measurements': [
+        ('measurement_id', 'str'), ('client_id', 'str'), ('measurement_date', 'date'),
+        ('neck_cm', 'float'), ('chest_cm', 'float'), ('waist_cm', 'float'), ('hip_cm', 'float'),
+        ('thigh_cm', 'float'), ('calf_cm', 'float'), ('recorded_at', 'timestamp'),
+    ],
+    'cortex_prompts': [
+        ('prompt_hash', 'str'), ('prompt_text', 'str'), ('model', 'str'), ('created_at', 'timestamp'),
+    ],
+    'generated_workouts': [
+        ('workout_id', 'str'), ('client_id', 'str'), ('workout_date', 'date'), ('generation_date', 'timestamp'),
+        ('workout_week', 'int'), ('workout_day', 'int'), ('workout_focus', 'str'), ('duration_min', 'int'),
+        ('warm_up', 'str'), ('exercises', 'variant'), ('cool_down', 'str'), ('notes', 'str'),
+        ('prompt_hash', 'str'), ('cortex_model', 'str'),
+    ],
+    'exercise_results': [
+        ('result_id', 'str'), ('client_id', 'str'), ('workout_id', 'str'), ('exercise_id', 'str'),
+        ('performed_date', 'date'), ('set_number', 'int'), ('reps', 'int'), ('weight_kg', 'float'),
+        ('rpe', 'float'), ('rest_seconds', 'int'), ('duration_seconds', 'int'), ('notes', 'str'),
+        ('recorded_at', 'timestamp'),
+    ],
+    'meal_plans': [
+        ('meal_plan_id', 'str'), ('client_id', 'str'), ('plan_start_date', 'date'), ('generation_date', 'timestamp'),
+        ('plan_week', 'int'), ('duration_days', 'int'), ('total_calories', 'int'), ('protein_g', 'int'),
+        ('carbs_g', 'int'), ('fat_g', 'int'), ('meal_plan_json', 'variant'), ('prompt_hash', 'str'),
+        ('cortex_model', 'str'),
+    ],
+}
+
+ARROW_TYPES = {
+    'str': pa.string(), 'variant': pa.string(), 'int': pa.int64(), 'float': pa.float64(),
+    'date': pa.date32(), 'timestamp': pa.timestamp('us'),
+}
+
+def arrow_schema(table: str) -> pa.Schema:
+    return pa.schema([(name, ARROW_TYPES[kind]) for name, kind in TABLES[table]])
+
+# ============================================================================
+# Domain Vocabulary
+# ============================================================================
+
+LEVELS = ['Beginner', 'Intermediate', 'Advanced']
+GOALS = ['Weight Loss', 'Muscle Gain', 'Endurance', 'Strength', 'General Fitness', 'Flexibility']
+EQUIPMENT_PROFILES = [
+    ['Dumbbells'],
+    ['Dumbbells', 'Resistance Bands'],
+    ['Barbell', 'Dumbbells'],
+    ['Barbell', 'Dumbbells', 'Gym Machine', 'Cardio Equipment'],
+    ['Gym Machine', 'Cardio Equipment'],
+    ['Bodyweight Only'],
+    ['Bodyweight Only', 'Resistance Bands'],
+]
+DIETS = ['None', 'Vegetarian', 'Vegan', 'Keto', 'Paleo', 'Mediterranean']
+ALLERGIES = [None, None, None, None, 'nuts', 'dairy', 'gluten', 'shellfish', 'nuts, dairy']
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Training weekdays (1 = Monday) and the focus rotation for each days_per_week
+DAY_PATTERNS = {
+    2: [1, 4], 3: [1, 3, 5], 4: [1, 2, 4, 5], 5: [1, 2, 3, 5, 6], 6: [1, 2, 3, 4, 5, 6],
+}
+SPLITS = {
+    2: ['Full Body', 'Full Body & Conditioning'],
+    3: ['Full Body', 'Easy Run', 'Full Body'],
+    4: ['Upper Body', 'Lower Body', 'Easy Run', 'Full Body'],
+    5: ['Upper Body Push', 'Lower Body', 'Easy Run', 'Upper Body Pull', 'Legs & Core'],
+    6: ['Upper Body Push', 'Lower Body', 'Upper Body Pull', 'Easy Run', 'Legs & Core', 'Full Body'],
+}
+FOCUS_MUSCLES = {
+    'Full Body': ['quads', 'chest', 'back', 'hamstrings', 'shoulders'],
+    'Full Body & Conditioning': ['quads', 'back', 'chest', 'core', 'cardio'],
+    'Upper Body': ['chest', 'back', 'shoulders', 'biceps', 'triceps'],
+    'Upper Body Push': ['chest', 'shoulders', 'chest', 'triceps', 'shoulders'],
+    'Upper Body Pull': ['back', 'back', 'biceps', 'shoulders', 'core'],
+    'Lower Body': ['quads', 'hamstrings', 'glutes', 'quads', 'calves'],
+    'Legs & Core': ['quads', 'glutes', 'hamstrings', 'core', 'core'],
+    'Easy Run': ['cardio'],
+}
+REP_SCHEMES = {'Beginner': (3, 10, 12, 60), 'Intermediate': (3, 8, 10, 90), 'Advanced': (4, 5, 8, 120)}
+DIET_TAGS = {
+    'None': None, 'Vegetarian': 'vegetarian', 'Vegan': 'vegan', 'Keto': 'keto',
+    'Paleo': 'paleo', 'Mediterranean': 'mediterranean',
+}
+MEAL_SLOTS = [('breakfast', 0.25), ('lunch', 0.30), ('dinner', 0.30), ('snacks', 0.15)]
+
+# ============================================================================
+# Vectorized Helpers
+# ============================================================================
+
+_DASHES = np.array([8, 13, 18, 23])
+
+def uuid4_strings(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Generate `n` random RFC 4122 v4 UUID strings in a single vectorized pass"""
+    raw = rng.integers(0, 256, size=(n, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    hexed = np.frombuffer(binascii.hexlify(raw.tobytes()), dtype=np.uint8).reshape(n, 32)
+    out = np.full((n, 36), ord('-'), dtype=np.uint8)
+    keep = np.ones(36, dtype=bool)
+    keep[_DASHES] = False
+    out[:, keep] = hexed
+    return out.view('S36').ravel().astype(str).astype(object)
+
+def _prompt_hash(prompt: str) -> str:
+    """SHA-256 hex of a prompt, as the app and SHA2(prompt, 256) compute it"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+def _offsets_within(counts: np.ndarray) -> np.ndarray:
+    """For repeat counts [2, 3] return [0, 1, 0, 1, 2]: each row's index within its group"""
+    total = counts.sum()
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total) - starts
+
+# ============================================================================
+# Reference Data and Payload Templates
+# ============================================================================
+
+class Catalog:
+    """Exercise and recipe reference data plus cached workout / meal plan payload templates"""
+
+    def __init__(self):
+        self.exercises = json.loads((FIXTURES / 'exercises_library.json').read_text())
+        self.recipes = json.loads((FIXTURES / 'recipes.json').read_text())
+        self.exercise_ids = np.array([e['exercise_id'] for e in self.exercises], dtype=object)
+        self.is_cardio = np.array([e['category'] == 'cardio' for e in self.exercises])
+        # Relative working weight per exercise (multiplied by the client's strength factor)
+        self.load_ratio = np.array([self._load_ratio(e) for e in self.exercises])
+
+        self._workout_templates = {}
+        self._template_rows = []
+        self._template_arrays = None
+        self.template_json = []
+        self.template_focus = []
+        self._meal_templates = {}
+
+    @staticmethod
+    def _load_ratio(exercise):
+        if exercise['category'] != 'strength' or exercise['equipment_required'] == ['Bodyweight Only']:
+            return 0.0
+        if 'Resistance Bands' in exercise['equipment_required']:
+            return 0.0
+        compound = {'Barbell Back Squat': 1.0, 'Front Squat': 0.8, 'Conventional Deadlift': 1.2,
+                    'Romanian Deadlift': 0.9, 'Barbell Hip Thrust': 1.1, 'Leg Press': 1.8,
+                    'Barbell Bench Press': 0.75, 'Barbell Row': 0.65, 'Overhead Press': 0.5}
+        name = exercise['exercise_name']
+        if name in compound:
+            return compound[name]
+        return 0.25 if 'Dumbbells' in exercise['equipment_required'] else 0.45
+
+    def workout_template(self, equipment: int, level: str, focus: str, variant: int) -> int:
+        """Return the id of a cached training-day template, building it on first use"""
+        key = (equipment, level, focus, variant)
+        if key in self._workout_templates:
+            return self._workout_templates[key]
+
+        rng = np.random.default_rng([equipment, LEVELS.index(level), len(focus), variant, sum(map(ord, focus))])
+        owned = set(EQUIPMENT_PROFILES[equipment]) | {'Bodyweight Only'}
+        sets, rep_lo, rep_hi, rest = REP_SCHEMES[level]
+        chosen, payload = [], []
+        for muscle in FOCUS_MUSCLES[focus]:
+            candidates = [
+                i for i, e in enumerate(self.exercises)
+                if muscle in e['target_muscles'] and set(e['equipment_required']) <= owned and i not in chosen
+                and (muscle == 'cardio' or e['category'] == 'strength')
+            ]
+            if not candidates:
+                continue
+            idx = int(rng.choice(candidates))
+            chosen.append(idx)
+            exercise = self.exercises[idx]
+            # Cortex rarely uses the canonical library name; emulate that naming drift
+            names = [exercise['exercise_name']] + exercise['variations']
+            name = names[int(rng.integers(len(names)))] if rng.random() < 0.35 else exercise['exercise_name']
+            if self.is_cardio[idx]:
+                payload.append({'name': name, 'sets': 1, 'reps': '30 min', 'rest_sec': 0, 'notes': 'Conversational pace'})
+            else:
+                payload.append({'name': name, 'sets': sets, 'reps': f"{rep_lo}-{rep_hi}", 'rest_sec': rest,
+                                'notes': exercise['instructions']})
+
+        template_id = len(self.template_json)
+        self._workout_templates[key] = template_id
+        self.template_json.append(json.dumps(payload))
+        self.template_focus.append(focus)
+        self._template_rows.append((chosen, [p['sets'] for p in payload], rep_lo, rep_hi, rest))
+        self._template_arrays = None
+        return template_id
+
+    def template_arrays(self):
+        """Padded per-template arrays used to expand performed workouts into set rows"""
+        if self._template_arrays is None:
+            width = max(len(row[0]) for row in self._template_rows)
+            n = len(self._template_rows)
+            ex = np.zeros((n, width), dtype=np.int64)
+            sets = np.zeros((n, width), dtype=np.int64)
+            count = np.zeros(n, dtype=np.int64)
+            rep_lo = np.zeros(n, dtype=np.int64)
+            rep_hi = np.zeros(n, dtype=np.int64)
+            rest = np.zeros(n, dtype=np.int64)
+            for t, (chosen, t_sets, lo, hi, rs) in enumerate(self._template_rows):
+                count[t] = len(chosen)
+                ex[t, :len(chosen)] = chosen
+                sets[t, :len(chosen)] = t_sets
+                rep_lo[t], rep_hi[t], rest[t] = lo, hi, rs
+            self._template_arrays = (ex, sets, count, rep_lo, rep_hi, rest)
+        return self._template_arrays
+
+    def meal_plan(self, diet: str, allergy: str, calories: int, protein: int, variant: int):
+        """Return (json, carbs, fat) for a cached 7-day meal plan template"""
+        key = (diet, allergy, calories, protein, variant)
+        if key in self._meal_templates:
+            return self._meal_templates[key]
+
+        rng = np.random.default_rng([DIETS.index(diet), calories, protein, variant])
+        diet_tag = DIET_TAGS[diet]
+        blocked = {f"contains:{a.strip()}" for a in (allergy or '').split(',') if a.strip()}
+        slot_tag = {'breakfast': 'breakfast', 'lunch': 'lunch', 'dinner': 'dinner', 'snacks': 'snack'}
+        days, carbs_total, fat_total = [], 0.0, 0.0
+        for day in range(1, 8):
+            meals = []
+            for slot, share in MEAL_SLOTS:
+                pool = [r for r in self.recipes if slot_tag[slot] in r['tags'] and not blocked & set(r['tags'])
+                        and (diet_tag is None or diet_tag in r['tags'])]
+                pool = pool or [r for r in self.recipes if slot_tag[slot] in r['tags']]
+                recipe = pool[int(rng.integers(len(pool)))]
+                scale = calories * share / recipe['total_calories']
+                carbs_total += recipe['carbs_g'] * scale
+                fat_total += recipe['fat_g'] * scale
+                meals.append({
+                    'meal_type': slot,
+                    'foods': [recipe['recipe_name']] + recipe['ingredients'][:2],
+                    'calories': int(round(calories * share)),
+                    'protein': int(round(protein * share)),
+                })
+            days.append({'day': day, 'meals': meals})
+
+        carbs, fat = int(round(carbs_total / 7)), int(round(fat_total / 7))
+        plan = {'weekly_totals': {'calories': calories, 'protein': protein, 'carbs': carbs, 'fat': fat}, 'days': days}
+        self._meal_templates[key] = (json.dumps(plan), carbs, fat)
+        return self._meal_templates[key]
+
+    def reference_tables(self):
+        """Arrow tables for exercises_library and recipes"""
+        def build(table, rows):
+            columns = {}
+            for name, kind in TABLES[table]:
+                values = [row.get(name) for row in rows]
+                columns[name] = [json.dumps(v) for v in values] if kind == 'variant' else values
+            return pa.table(columns, schema=arrow_schema(table))
+        return {'exercises_library': build('exercises_library', self.exercises),
+                'recipes': build('recipes', self.recipes)}
+
+# ============================================================================
+# Client Generation
+# ============================================================================
+
+WORKOUT_PROMPT = """You are an expert personal trainer creating a complete 7-day training program.
+
+=== CLIENT PROFILE ===
+- Fitness Level: {level}
+- Goals: {goals}
+- Available Equipment: {equipment}
+- Training Days per Week: {days}
+- Workout Duration: {duration} minutes per session
+
+=== CONTEXT FROM PREVIOUS TRAINING ===
+{context}
+
+=== IMPORTANT INSTRUCTIONS ===
+1. Create a diverse training program where each training day focuses on different muscle groups
+2. Include {days} training days and {rest} rest days
+3. ENSURE THE WORKOUTS ARE SIGNIFICANTLY DIFFERENT from the previous weeks shown above
+4. Vary the exercises, rep ranges, and training focus across the week
+5. Include at least 1 running day within the {days} training days
+6. On gym days, ensure to include at least 5 exercises
+7. Include proper warm-up and cool-down for each training day
+8. Space out muscle groups to allow for recovery (e.g., no back-to-back same muscle groups)
+9. Rest days should be labeled with recovery recommendations
+"""
+
+MEAL_PROMPT = """You are a sports nutritionist. Create a detailed 7-day meal plan for a client.
+
+Client Profile:
+- Target Daily Calories: {calories}
+- Target Protein: {protein}g
+- Dietary Preferences: {diet}
+- Allergies/Restrictions: {allergies}
+- Fitness Goals: {goals}
+"""
+
+def _generate_client(catalog: Catalog, index: int, seed: int, weeks: int, today: date, with_prompts: bool):
+    """Generate one client and all child rows as dicts of column arrays"""
+    rng = np.random.default_rng([seed, index])
+    this_monday = today - timedelta(days=today.weekday())
+
+    level = LEVELS[int(rng.choice(3, p=[0.35, 0.45, 0.20]))]
+    goals = [GOALS[i] for i in sorted(rng.choice(len(GOALS), size=int(rng.integers(1, 4)), replace=False))]
+    equipment = int(rng.integers(len(EQUIPMENT_PROFILES)))
+    days_per_week = int(rng.choice([2, 3, 4, 5, 6], p=[0.1, 0.3, 0.35, 0.15, 0.1]))
+    duration = int(rng.choice([30, 45, 60, 75, 90], p=[0.1, 0.3, 0.4, 0.1, 0.1]))
+    diet = DIETS[int(rng.choice(len(DIETS), p=[0.5, 0.15, 0.08, 0.09, 0.08, 0.1]))]
+    allergy = ALLERGIES[int(rng.integers(len(ALLERGIES)))]
+    gender = ['Male', 'Female', 'Other'][int(rng.choice(3, p=[0.48, 0.48, 0.04]))]
+    height = int(rng.normal(178 if gender == 'Male' else 165, 7))
+    weight = round(float(np.clip(rng.normal(0.45 * height - 3, 12), 45, 160)), 2)
+    calories = int(round((weight * 30 + (300 if 'Muscle Gain' in goals else -400 if 'Weight Loss' in goals else 0)) / 50) * 50)
+    protein = int(round(weight * (2.0 if 'Muscle Gain' in goals or 'Strength' in goals else 1.6) / 5) * 5)
+
+    history = int(rng.integers(max(1, weeks // 8), weeks + 1))
+    first_monday = this_monday - timedelta(weeks=history - 1)
+    created_at = np.datetime64(first_monday - timedelta(days=int(rng.integers(1, 10))), 'us') + np.timedelta64(int(rng.integers(8 * 3600, 20 * 3600)), 's')
+    client_id = uuid4_strings(rng, 1)[0]
+
+    client = {
+        'client_id': [client_id], 'client_name': [f"Client {index + 1:06d}"], 'age': [int(rng.integers(18, 71))],
+        'gender': [gender], 'current_weight_kg': [weight], 'height_cm': [height], 'fitness_level': [level],
+        'fitness_goals': [json.dumps(goals)], 'available_equipment': [json.dumps(EQUIPMENT_PROFILES[equipment])],
+        'days_per_week': [days_per_week], 'workout_duration_min': [duration], 'dietary_preferences': [json.dumps([diet])],
+        'allergies': [allergy], 'target_calories': [calories], 'target_protein_g': [protein],
+        'created_at': [created_at], 'updated_at': [created_at],
+    }
+
+    # --- generated_workouts: 7 rows per week, rest days included -------------
+    pattern = DAY_PATTERNS[days_per_week]
+    split = SPLITS[days_per_week]
+    n_workouts = history * 7
+    week_idx = np.repeat(np.arange(history), 7)
+    day_num = np.tile(np.arange(1, 8), history)
+    week_starts = np.datetime64(first_monday) + (week_idx * 7).astype('timedelta64[D]')
+    workout_dates = week_starts + (day_num - 1).astype('timedelta64[D]')
+    slot = np.full(7, -1)
+    slot[np.array(pattern) - 1] = np.arange(len(pattern))
+    day_slot = slot[day_num - 1]
+    is_training = day_slot >= 0
+
+    templates = np.full(n_workouts, -1, dtype=np.int64)
+    for i in np.flatnonzero(is_training):
+        templates[i] = catalog.workout_template(equipment, level, split[day_slot[i]], int(week_idx[i] % 4))
+
+    template_json = np.array(catalog.template_json + [json.dumps([])], dtype=object)
+    template_focus = np.array(catalog.template_focus + ['Rest Day'], dtype=object)
+    workout_ids = uuid4_strings(rng, n_workouts)
+    generation = np.repeat(
+        week_starts[::7].astype('datetime64[us]') - np.timedelta64(1, 'D')
+        + rng.integers(9 * 3600, 21 * 3600, size=history).astype('timedelta64[s]'),
+        7
+    )
+
+    meal_prompt = MEAL_PROMPT.format(calories=calories, protein=protein, diet=diet, allergies=allergy or 'None', goals=', '.join(goals))
+    if with_prompts:
+        prompts = [
+            WORKOUT_PROMPT.format(level=level, goals=', '.join(goals), equipment=', '.join(EQUIPMENT_PROFILES[equipment]),
+                                  days=days_per_week, rest=7 - days_per_week, duration=duration,
+                                  context=f"Previous Workouts: week {w} of program" if w else
+                                  "No previous workouts found. This will be the first training program.")
+            for w in range(history)
+        ]
+        # Stored once in cortex_prompts; the week's seven rows and the meal plans reference them by hash
+        hashes = [_prompt_hash(prompt) for prompt in prompts]
+        workout_hashes = np.repeat(np.array(hashes, dtype=object), 7)
+        meal_hash = _prompt_hash(meal_prompt)
+        cortex_prompts = {
+            'prompt_hash': np.array(hashes + [meal_hash], dtype=object),
+            'prompt_text': np.array(prompts + [meal_prompt], dtype=object),
+            'model': np.full(history + 1, 'mistral-7b', dtype=object),
+            'created_at': np.append(generation[::7], generation[0]),
+        }
+    else:
+        workout_hashes = np.full(n_workouts, None, dtype=object)
+        meal_hash = None
+        cortex_prompts = {
+            'prompt_hash': np.array([], dtype=object), 'prompt_text': np.array([], dtype=object),
+            'model': np.array([], dtype=object), 'created_at': np.array([], dtype='datetime64[us]'),
+        }
+
+    workouts = {
+        'workout_id': workout_ids, 'client_id': np.full(n_workouts, client_id, dtype=object),
+        'workout_date': workout_dates, 'generation_date': generation,
+        'workout_week': week_idx % 52 + 1, 'workout_day': day_num,
+        'workout_focus': template_focus[templates],
+        'duration_min': np.where(is_training, duration, 0),
+        'warm_up': np.where(is_training, '5 min easy cardio and dynamic mobility', 'Light walking and mobility work').astype(object),
+        'exercises': template_json[templates],
+        'cool_down': np.where(is_training, '5-10 min stretching', 'Focus on recovery').astype(object),
+        'notes': np.full(n_workouts, None, dtype=object),
+        'prompt_hash': workout_hashes,
+        'cortex_model': np.full(n_workouts, 'mistral-7b', dtype=object),
+    }
+
+    # --- exercise_results: expand performed workouts -> exercises -> sets ----
+    adherence = rng.uniform(0.6, 0.95)
+    performed = is_training & (workout_dates <= np.datetime64(today)) & (rng.random(n_workouts) < adherence)
+    perf_idx = np.flatnonzero(performed)
+    tmpl_ex, tmpl_sets, tmpl_count, tmpl_lo, tmpl_hi, tmpl_rest = catalog.template_arrays()
+    perf_templates = templates[perf_idx]
+
+    ex_counts = tmpl_count[perf_templates]
+    ex_workout = np.repeat(perf_idx, ex_counts)
+    ex_template = np.repeat(perf_templates, ex_counts)
+    ex_pos = _offsets_within(ex_counts)
+    ex_lib = tmpl_ex[ex_template, ex_pos]
+    set_counts = tmpl_sets[ex_template, ex_pos]
+
+    set_workout = np.repeat(ex_workout, set_counts)
+    set_template = np.repeat(ex_template, set_counts)
+    set_lib = np.repeat(ex_lib, set_counts)
+    set_number = _offsets_within(set_counts) + 1
+    n_sets = len(set_workout)
+
+    strength = rng.uniform(0.6, 1.4) * {'Beginner': 0.7, 'Intermediate': 1.0, 'Advanced': 1.3}[level] * weight
+    progression = 1 + rng.uniform(0.001, 0.006) * week_idx[set_workout]
+    raw_weight = strength * catalog.load_ratio[set_lib] * progression * rng.normal(1, 0.03, n_sets)
+    loaded = catalog.load_ratio[set_lib] > 0
+    cardio = catalog.is_cardio[set_lib]
+    reps = rng.integers(tmpl_lo[set_template], tmpl_hi[set_template] + 1)
+    rpe = np.clip(np.round((6.5 + 0.5 * set_number + rng.normal(0, 0.5, n_sets)) * 2) / 2, 5, 10)
+
+    results = {
+        'result_id': uuid4_strings(rng, n_sets),
+        'client_id': np.full(n_sets, client_id, dtype=object),
+        'workout_id': workout_ids[set_workout],
+        'exercise_id': catalog.exercise_ids[set_lib],
+        'performed_date': workout_dates[set_workout],
+        'set_number': set_number,
+        'reps': np.where(cardio, 1, reps),
+        'weight_kg': np.where(loaded, np.round(raw_weight / 1.25) * 1.25, np.nan),
+        'rpe': np.where(cardio, np.nan, rpe),
+        'rest_seconds': np.where(cardio, 0, tmpl_rest[set_template]),
+        'duration_seconds': np.where(cardio, 1800, np.nan),
+        'notes': np.full(n_sets, None, dtype=object),
+        'recorded_at': workout_dates[set_workout].astype('datetime64[us]') + np.timedelta64(18, 'h') + (set_number * 150).astype('timedelta64[s]'),
+    }
+
+    # --- weigh_ins: daily, with missed days -----------------------------------
+    days_tracked = (today - first_monday).days + 1
+    day_offsets = np.flatnonzero(rng.random(days_tracked) < 0.75)
+    trend = -0.02 if 'Weight Loss' in goals else 0.008 if 'Muscle Gain' in goals else 0.0
+    weigh_dates = np.datetime64(first_monday) + day_offsets.astype('timedelta64[D]')
+    n_weigh = len(day_offsets)
+    body_fat = rng.uniform(12, 32)
+    weigh_ins = {
+        'weigh_in_id': uuid4_strings(rng, n_weigh),
+        'client_id': np.full(n_weigh, client_id, dtype=object),
+        'weigh_in_date': weigh_dates,
+        'weight_kg': np.round(weight + trend * day_offsets + rng.normal(0, 0.4, n_weigh), 3),
+        'body_fat_pct': np.where(rng.random(n_weigh) < 0.3, np.round(body_fat - 0.005 * day_offsets + rng.normal(0, 0.3, n_weigh), 2), np.nan),
+        'notes': np.full(n_weigh, None, dtype=object),
+        'recorded_at': weigh_dates.astype('datetime64[us]') + np.timedelta64(7, 'h'),
+    }
+
+    # --- body_measurements: weekly --------------------------------------------
+    n_meas = int(np.sum(week_starts[::7] <= np.datetime64(today)))
+    meas_dates = week_starts[::7][:n_meas]
+    drift = np.arange(n_meas) * (-0.05 if 'Weight Loss' in goals else 0.02)
+    base = {'neck_cm': 0.2 * height, 'chest_cm': 0.55 * height, 'waist_cm': 0.45 * height,
+            'hip_cm': 0.55 * height, 'thigh_cm': 0.32 * height, 'calf_cm': 0.21 * height}
+    measurements = {
+        'measurement_id': uuid4_strings(rng, n_meas),
+        'client_id': np.full(n_meas, client_id, dtype=object),
+        'measurement_date': meas_dates,
+        **{k: np.round(v + drift + rng.normal(0, 0.3, n_meas), 2) for k, v in base.items()},
+        'recorded_at': meas_dates.astype('datetime64[us]') + np.timedelta64(7, 'h'),
+    }
+
+    # --- meal_plans: weekly -----------------------------------------------------
+    plans = [catalog.meal_plan(diet, allergy, calories, protein, w % 4) for w in range(history)]
+    meal_plans = {
+        'meal_plan_id': uuid4_strings(rng, history),
+        'client_id': np.full(history, client_id, dtype=object),
+        'plan_start_date': week_starts[::7],
+        'generation_date': generation[::7],
+        'plan_week': np.arange(history) % 52 + 1,
+        'duration_days': np.full(history, 7),
+        'total_calories': np.full(history, calories),
+        'protein_g': np.full(history, protein),
+        'carbs_g': np.array([p[1] for p in plans]),
+        'fat_g': np.array([p[2] for p in plans]),
+        'meal_plan_json': np.array([p[0] for p in plans], dtype=object),
+        'prompt_hash': np.full(history, meal_hash, dtype=object),
+        'cortex_model': np.full(history, 'mistral-7b', dtype=object),
+    }
+
+    return {
+        'clients': client, 'cortex_prompts': cortex_prompts, 'generated_workouts': workouts, 'exercise_results': results,
+        'weigh_ins': weigh_ins, 'body_measurements': measurements, 'meal_plans': meal_plans,
+    }
+
+def _to_arrow(table: str, parts) -> pa.Table:
+    columns = {}
+    for name, kind in TABLES[table]:
+        values = np.concatenate([np.asarray(p[name]) for p in parts]) if parts else []
+        arrow_type = ARROW_TYPES[kind]
+        if kind in ('date', 'timestamp'):
+            values = np.asarray(values).astype('datetime64[D]' if kind == 'date' else 'datetime64[us]')
+        columns[name] = pa.array(values, type=arrow_type, from_pandas=True)
+    return pa.table(columns, schema=arrow_schema(table))
+
+def generate(clients: int, weeks: int = 104, seed: int = 0, chunk_clients: int = 100,
+             today: date = None, with_prompts: bool = True):
+    """Yield {table: pyarrow.Table} chunks; reference tables come first in their own chunk"""
+    today = today or date.today()
+    catalog = Catalog()
+    yield catalog.reference_tables()
+
+    seen_prompts = set()
+    for start in range(0, clients, chunk_clients):
+        parts = [
+            _generate_client(catalog, i, seed, weeks, today, with_prompts)
+            for i in range(start, min(start + chunk_clients, clients))
+        ]
+        # Clients with the same profile share prompts; each is stored once across all chunks
+        for part in parts:
+            prompts = part['cortex_prompts']
+            keep = np.zeros(len(prompts['prompt_hash']), dtype=bool)
+            for i, digest in enumerate(prompts['prompt_hash']):
+                if digest not in seen_prompts:
+                    seen_prompts.add(digest)
+                    keep[i] = True
+            part['cortex_prompts'] = {name: values[keep] for name, values in prompts.items()}
+        yield {table: _to_arrow(table, [p[table] for p in parts]) for table in parts[0]}
+
+# ============================================================================
+# Sinks
+# ============================================================================
+
+class ParquetSink:
+    """Stream each table to <out>/<table>.parquet, one row group per chunk"""
+
+    suffix = 'parquet'
+
+    def __init__(self, out_dir: Path):
+        import pyarrow.parquet as pq
+        self._pq = pq
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.writers = {}
+
+    def write(self, table: str, data: pa.Table):
+        if table not in self.writers:
+            self.writers[table] = self._pq.ParquetWriter(self.out_dir / f"{table}.parquet", data.schema, compression='zstd')
+        self.writers[table].write_table(data)
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        write_load_script(self.out_dir, self.suffix, list(self.writers))
+
+class CsvSink(ParquetSink):
+    """Stream each table to <out>/<table>.csv with a single header row"""
+
+    suffix = 'csv'
+
+    def __init__(self, out_dir: Path):
+        import pyarrow.csv as pacsv
+        self._csv = pacsv
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.writers = {}
+
+    def write(self, table: str, data: pa.Table):
+        if table not in self.writers:
+            self.writers[table] = self._csv.CSVWriter(self.out_dir / f"{table}.csv", data.schema)
+        self.writers[table].write_table(data)
+
+class SessionSink:
+    """Bulk-load chunks through a Snowpark (or local) session: write_pandas into a
+    temporary landing table, then one INSERT ... SELECT with PARSE_JSON for VARIANTs"""
+
+    def __init__(self, session):
+        self.session = session
+
+    def write(self, table: str, data: pa.Table):
+        landing = f"{table.upper()}_LOAD"
+        self.session.write_pandas(
+            data.to_pandas(), landing, auto_create_table=True, table_type='temporary',
+            overwrite=True, quote_identifiers=False
+        )
+        columns = [name for name, _ in TABLES[table]]
+        select = [f"PARSE_JSON({name})" if kind == 'variant' else name for name, kind in TABLES[table]]
+        self.session.sql(f"""
+        INSERT INTO TRAINING_DB.PUBLIC.{table} ({', '.join(columns)})
+        SELECT {', '.join(select)} FROM {landing}
+        """).collect()
+
+    def close(self):
+        pass
+
+def write_load_script(out_dir: Path, suffix: str, tables):
+    """Write load_snowflake.sql with PUT + COPY INTO statements for the generated files"""
+    file_format = "TYPE = PARQUET" if suffix == 'parquet' else \
+        "TYPE = CSV SKIP_HEADER = 1 FIELD_OPTIONALLY_ENCLOSED_BY = '\"' NULL_IF = ('')"
+    lines = [
+        "-- Generated by local_dev/datagen.py: bulk-load the synthetic dataset",
+        "USE DATABASE TRAINING_DB;",
+        "USE SCHEMA PUBLIC;",
+        "CREATE STAGE IF NOT EXISTS datagen_stage;",
+        "",
+    ]
+    for table in tables:
+        columns = TABLES[table]
+        if suffix == 'parquet':
+            select = [f"PARSE_JSON($1:{n}::VARCHAR)" if k == 'variant' else f"$1:{n}" for n, k in columns]
+        else:
+            select = [f"PARSE_JSON(${i})" if k == 'variant' else f"${i}" for i, (n, k) in enumerate(columns, 1)]
+        lines += [
+            f"PUT file://{(out_dir / f'{table}.{suffix}').resolve()} @datagen_stage/{table}/ AUTO_COMPRESS = FALSE OVERWRITE = TRUE;",
+            f"COPY INTO {table} ({', '.join(n for n, _ in columns)})",
+            f"  FROM (SELECT {', '.join(select)} FROM @datagen_stage/{table}/)",
+            f"  FILE_FORMAT = ({file_format});",
+            "",
+        ]
+    (out_dir / 'load_snowflake.sql').write_text('\n'.join(lines))
+
+def run(sink, **kwargs):
+    """Generate the dataset into `sink`; returns row counts per table"""
+    counts = {}
+    try:
+        for chunk in generate(**kwargs):
+            for table, data in chunk.items():
+                sink.write(table, data)
+                counts[table] = counts.get(table, 0) + data.num_rows
+    finally:
+        sink.close()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=1000)
+    parser.add_argument('--weeks', type=int, default=104, help="Maximum weeks of history per client")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-clients', type=int, default=100, help="Clients generated per chunk (bounds memory)")
+    parser.add_argument('--today', type=date.fromisoformat, help="Pin 'today' for fully reproducible output")
+    parser.add_argument('--no-prompts', action='store_true', help="Leave prompt_hash NULL and cortex_prompts empty")
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet')
+    parser.add_argument('--out', type=Path, default=Path('data'))
+    args = parser.parse_args()
+
+    sink = ParquetSink(args.out) if args.format == 'parquet' else CsvSink(args.out)
+    started = time.perf_counter()
+    counts = run(sink, clients=args.clients, weeks=args.weeks, seed=args.seed, chunk_clients=args.chunk_clients,
+                 today=args.today, with_prompts=not args.no_prompts)
+    for table, count in counts.items():
+        print(f"{table:<20}{count:>14,}")
+    print(f"Done in {time.perf_counter() - started:.1f}s -> {args.out}/ (load with {args.out}/load_snowflake.sql)")
+
+if __name__ == '__main__':
+    main()
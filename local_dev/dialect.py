@@ -0,0 +1,141 @@
+"""
+Snowflake -> DuckDB SQL translation for the local backend.
+
+Only the constructs used by the app and by the Stage 1 DDL are handled. Everything
+else is passed through unchanged so DuckDB can reject anything we do not support.
+"""
+
+import re
+
+# ============================================================================
+# Statement Splitting
+# ============================================================================
+
+def split_statements(script: str):
+    """Split a SQL script into statements, dropping `--` comments outside string literals
+
+    `$$`-quoted bodies (stored procedures) are kept intact, semicolons included.
+    """
+    statements = []
+    current = []
+    in_quote = False
+    i = 0
+    while i < len(script):
+        ch = script[i]
+        if not in_quote and script.startswith('$$', i):
+            end = script.find('$$', i + 2)
+            end = len(script) if end == -1 else end + 2
+            current.append(script[i:end])
+            i = end
+            continue
+        if in_quote:
+            current.append(ch)
+            if ch == "'":
+                if script[i + 1:i + 2] == "'":
+                    current.append("'")
+                    i += 1
+                else:
+                    in_quote = False
+        elif ch == "'":
+            in_quote = True
+            current.append(ch)
+        elif script.startswith('--', i):
+            newline = script.find('\n', i)
+            i = len(script) if newline == -1 else newline
+            continue
+        elif ch == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+# ============================================================================
+# Function Call Rewriting
+# ============================================================================
+
+def _split_args(text: str):
+    """Split a function argument list on top-level commas"""
+    args, depth, in_quote, start = [], 0, False, 0
+    for i, ch in enumerate(text):
+        if ch == "'":
+            in_quote = not in_quote
+        elif in_quote:
+            continue
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            args.append(text[start:i].strip())
+            start = i + 1
+    args.append(text[start:].strip())
+    return args
+
+def rewrite_calls(sql: str, name: str, rewrite):
+    """Replace every `name(...)` call with `rewrite(args)`, matching parentheses properly"""
+    pattern = re.compile(r'\b' + re.escape(name) + r'\s*\(', re.IGNORECASE)
+    out, pos = [], 0
+    while True:
+        match = pattern.search(sql, pos)
+        if not match:
+            break
+        depth, in_quote, end = 1, False, match.end()
+        while end < len(sql) and depth:
+            ch = sql[end]
+            if ch == "'":
+                in_quote = not in_quote
+            elif not in_quote:
+                depth += (ch == '(') - (ch == ')')
+            end += 1
+        inner = rewrite_calls(sql[match.end():end - 1], name, rewrite)
+        out.append(sql[pos:match.start()])
+        out.append(rewrite(_split_args(inner)))
+        pos = end
+    out.append(sql[pos:])
+    return ''.join(out)
+
+# ============================================================================
+# Query Translation
+# ============================================================================
+
+def translate_query(sql: str) -> str:
+    """Translate a Snowflake query into DuckDB SQL"""
+    sql = re.sub(r'\bSNOWFLAKE\.CORTEX\.COMPLETE\s*\(', 'CORTEX_COMPLETE(', sql, flags=re.IGNORECASE)
+    sql = re.sub(r'\bOBJECT_CONSTRUCT\s*\(', 'json_object(', sql, flags=re.IGNORECASE)
+    # agg(x) WITHIN GROUP (ORDER BY k) -> agg(x ORDER BY k), for sort keys without parentheses
+    sql = re.sub(r'\)\s*WITHIN\s+GROUP\s*\(\s*(ORDER\s+BY\s+[^()]*)\)', r' \1)', sql, flags=re.IGNORECASE)
+    sql = rewrite_calls(sql, 'ARRAY_AGG', lambda a: f"to_json(array_agg({', '.join(a)}))")
+    sql = rewrite_calls(sql, 'DATEADD', lambda a: f"({a[2]} + INTERVAL ({a[1]}) {a[0]})")
+    return sql
+
+def translate_ddl(statement: str):
+    """Translate a CREATE TABLE / CREATE VIEW statement; returns None for anything else"""
+    if not re.match(r'CREATE\s+(OR\s+REPLACE\s+)?(TABLE|VIEW)\b', statement, re.IGNORECASE):
+        return None
+
+    ddl = re.sub(r"\s*COMMENT\s*=?\s*'(?:[^']|'')*'", '', statement, flags=re.IGNORECASE)
+    ddl = re.sub(r'TO_VARCHAR\(UUID_STRING\(\)\)', 'CAST(uuid() AS VARCHAR)', ddl, flags=re.IGNORECASE)
+    ddl = re.sub(r'\bVARIANT\b', 'JSON', ddl, flags=re.IGNORECASE)
+    ddl = re.sub(r'\bTIMESTAMP_LTZ\b', 'TIMESTAMP', ddl, flags=re.IGNORECASE)
+    ddl = re.sub(r'\bNUMBER\s*\(', 'DECIMAL(', ddl, flags=re.IGNORECASE)
+
+    if re.match(r'CREATE\s+(OR\s+REPLACE\s+)?TABLE\b', ddl, re.IGNORECASE):
+        # Snowflake does not enforce PRIMARY KEY / UNIQUE / FOREIGN KEY on standard
+        # tables, so drop them rather than letting DuckDB enforce semantics we lack.
+        open_paren = ddl.index('(')
+        close_paren = ddl.rindex(')')
+        columns = [
+            c for c in _split_args(ddl[open_paren + 1:close_paren])
+            if not re.match(r'(PRIMARY\s+KEY|FOREIGN\s+KEY|CONSTRAINT)\b', c, re.IGNORECASE)
+        ]
+        ddl = ddl[:open_paren + 1] + '\n  ' + ',\n  '.join(columns) + '\n)'
+
+    return translate_query(ddl)
@@ -0,0 +1,238 @@
+"""
+DuckDB-backed stand-in for the subset of the Snowpark Session API used by the app.
+
+Supported: Session.builder.getOrCreate(), session.sql(query, params).collect(),
+session.sql(query, params).to_pandas() and session.sql(query, params).to_pandas_batches(),
+with `params` bound to `?` placeholders. Results follow Snowflake conventions: upper-case
+column names, VARIANT/ARRAY values as JSON strings, DATE values as datetime.date.
+"""
+
+import json
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import duckdb
+import pyarrow as pa
+
+from local_dev.cortex import FakeCortex
+from local_dev.dialect import split_statements, translate_ddl, translate_query
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_FILES = [
+    'sql/01_stage1_setup.sql',
+    'sql/02_stage1_create_tables.sql',
+    'sql/07_create_exercise_progress_view.sql',
+    'sql/08_create_generation_jobs.sql',
+    'sql/13_create_adherence.sql',
+]
+
+# Rows per DataFrame from to_pandas_batches() (Snowflake sizes its result chunks itself)
+BATCH_ROWS = 10_000
+
+# Snowflake functions that map one-to-one onto DuckDB macros
+MACROS = [
+    "CREATE MACRO TO_VARCHAR(x) AS CAST(x AS VARCHAR)",
+    "CREATE MACRO PARSE_JSON(s) AS CAST(s AS JSON)",
+    "CREATE MACRO TRY_PARSE_JSON(s) AS TRY_CAST(s AS JSON)",
+    "CREATE MACRO UUID_STRING() AS CAST(uuid() AS VARCHAR)",
+]
+
+# ============================================================================
+# Rows and DataFrames
+# ============================================================================
+
+class Row(tuple):
+    """Snowpark-style row: indexable by position, column name or attribute"""
+
+    def __new__(cls, values, fields):
+        row = super().__new__(cls, values)
+        row._fields = fields
+        return row
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return super().__getitem__(self._fields.index(key.upper()))
+        return super().__getitem__(key)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except ValueError:
+            raise AttributeError(name) from None
+
+    def as_dict(self):
+        return dict(zip(self._fields, self))
+
+def _snowflake_arrow_to_pandas(table: pa.Table):
+    """Convert an Arrow result to pandas the way Snowpark's to_pandas() presents it"""
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        dtype = column.type
+        if isinstance(dtype, pa.ExtensionType):
+            column = column.cast(dtype.storage_type)
+            dtype = column.type
+        if pa.types.is_decimal(dtype):
+            column = column.cast(pa.int64() if dtype.scale == 0 and column.null_count == 0 else pa.float64())
+        elif pa.types.is_list(dtype) or pa.types.is_struct(dtype) or pa.types.is_map(dtype):
+            column = pa.array(
+                [None if v is None else json.dumps(v, default=str) for v in column.to_pylist()],
+                type=pa.string()
+            )
+        columns[name.upper()] = column
+    return pa.table(columns).to_pandas(date_as_object=True)
+
+class DataFrame:
+    """Lazy query handle; executes on collect() / to_pandas() like Snowpark"""
+
+    def __init__(self, session: 'LocalSession', query: str, params=None):
+        self._session = session
+        self._query = query
+        self._params = params
+
+    def collect(self):
+        table = self._session._execute(self._query, self._params)
+        fields = [name.upper() for name in table.column_names]
+        return [Row(tuple(values.values()), fields) for values in table.to_pylist()]
+
+    def to_pandas(self):
+        return _snowflake_arrow_to_pandas(self._session._execute(self._query, self._params))
+
+    def to_pandas_batches(self):
+        for batch in self._session._execute_batches(self._query, self._params):
+            yield _snowflake_arrow_to_pandas(pa.Table.from_batches([batch]))
+
+# ============================================================================
+# Session
+# ============================================================================
+
+class _Builder:
+    """Mirror of Session.builder; getOrCreate() returns the installed local session"""
+
+    def __init__(self, session_cls):
+        self._session_cls = session_cls
+
+    def configs(self, _options=None):
+        return self
+
+    def create(self):
+        return self._session_cls()
+
+    def getOrCreate(self):
+        if self._session_cls._default is None:
+            self._session_cls._default = self._session_cls()
+        return self._session_cls._default
+
+class LocalSession:
+    """In-memory TRAINING_DB.PUBLIC on DuckDB with the Stage 1 schema and a fake Cortex"""
+
+    _default = None
+
+    def __init__(self, cortex: FakeCortex = None, database: str = ':memory:'):
+        self.cortex = cortex or FakeCortex()
+        self.query_log = []
+        self._local = threading.local()
+        self.conn = duckdb.connect(database)
+        self.conn.execute("ATTACH ':memory:' AS TRAINING_DB")
+        self.conn.execute("CREATE SCHEMA IF NOT EXISTS TRAINING_DB.PUBLIC")
+        self.conn.execute("USE TRAINING_DB.PUBLIC")
+        for macro in MACROS:
+            self.conn.execute(macro)
+        self.conn.create_function(
+            'CORTEX_COMPLETE', self.cortex.complete,
+            ['VARCHAR', 'VARCHAR'], 'VARCHAR'
+        )
+        for path in SCHEMA_FILES:
+            self.run_script(REPO_ROOT / path)
+
+    def run_script(self, path: Path):
+        """Execute the CREATE TABLE / VIEW statements of a Snowflake SQL script"""
+        for statement in split_statements(Path(path).read_text()):
+            ddl = translate_ddl(statement)
+            if ddl:
+                self.conn.execute(ddl)
+
+    def sql(self, query: str, params=None):
+        """Like Session.sql: `params` are bound to the query's `?` placeholders"""
+        return DataFrame(self, query, params)
+
+    def write_pandas(self, df, table_name: str, *, database: str = None, schema: str = None,
+                     quote_identifiers: bool = True, auto_create_table: bool = False,
+                     overwrite: bool = False, table_type: str = '', **kwargs):
+        """Mirror of Session.write_pandas: append (or overwrite / create) a table from a DataFrame"""
+        target = f"{database}.{schema or 'PUBLIC'}.{table_name}" if database else table_name
+        temporary = 'TEMP ' if table_type.lower() in ('temp', 'temporary') else ''
+        cursor = self._cursor()
+        cursor.register('_write_pandas', df)
+        try:
+            if auto_create_table:
+                exists = 'OR REPLACE ' if overwrite else ''
+                cursor.execute(f"CREATE {exists}{temporary}TABLE {'' if exists else 'IF NOT EXISTS '}{target} AS SELECT * FROM _write_pandas WHERE false")
+            elif overwrite:
+                cursor.execute(f"DELETE FROM {target}")
+            cursor.execute(f"INSERT INTO {target} BY NAME SELECT * FROM _write_pandas")
+        finally:
+            cursor.unregister('_write_pandas')
+        return self.sql(f"SELECT * FROM {target}")
+
+    def _cursor(self):
+        """Per-thread DuckDB cursor, so background workers and script threads query concurrently"""
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self.conn.cursor()
+            cursor.execute("USE TRAINING_DB.PUBLIC")
+            self._local.cursor = cursor
+        return cursor
+
+    def _execute(self, query: str, params=None) -> pa.Table:
+        started = time.perf_counter()
+        result = self._cursor().execute(translate_query(query), params or None)
+        table = result.fetch_arrow_table() if result.description else pa.table({})
+        self.query_log.append({'query': query, 'elapsed_s': time.perf_counter() - started})
+        return table
+
+    def _execute_batches(self, query: str, params=None, rows: int = BATCH_ROWS):
+        """Stream a result as Arrow record batches on its own cursor, so other queries can
+        run while the stream is open"""
+        started = time.perf_counter()
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("USE TRAINING_DB.PUBLIC")
+            reader = cursor.execute(translate_query(query), params or None).fetch_record_batch(rows)
+            self.query_log.append({'query': query, 'elapsed_s': time.perf_counter() - started})
+            yield from reader
+        finally:
+            cursor.close()
+
+    @property
+    def query_count(self) -> int:
+        return len(self.query_log)
+
+    def reset_stats(self):
+        self.query_log.clear()
+        self.cortex.calls.clear()
+
+LocalSession.builder = _Builder(LocalSession)
+
+# ============================================================================
+# Module Installation
+# ============================================================================
+
+def install(session: LocalSession = None) -> LocalSession:
+    """Register `snowflake.snowpark` in sys.modules so the app picks up the local session"""
+    session = session or LocalSession()
+    LocalSession._default = session
+
+    snowflake = types.ModuleType('snowflake')
+    snowpark = types.ModuleType('snowflake.snowpark')
+    snowpark.Session = LocalSession
+    snowpark.Row = Row
+    snowflake.snowpark = snowpark
+
+    sys.modules.update({
+        'snowflake': snowflake,
+        'snowflake.snowpark': snowpark,
+    })
+    return session
@@ -102,6 +102,21 @@ COMMENT = 'Reference library of exercises for AI workout generation';
 --CREATE INDEX IF NOT EXISTS idx_exercises_category ON exercises_library (category);
 GRANT SELECT ON exercises_library TO ROLE TRAINING_APP_ROLE;
 
+-- ============================================================================
+-- Table 4b: CORTEX_PROMPTS - Prompts Sent to Cortex, Stored Once
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS cortex_prompts (
+  prompt_hash VARCHAR(64) NOT NULL COMMENT 'SHA-256 of prompt_text (lower-case hex, as SHA2(prompt_text, 256))',
+  prompt_text VARCHAR NOT NULL COMMENT 'Full prompt sent to Cortex',
+  model VARCHAR(100) COMMENT 'Cortex model the prompt was first sent to',
+  created_at TIMESTAMP_LTZ DEFAULT CURRENT_TIMESTAMP NOT NULL,
+  PRIMARY KEY (prompt_hash)
+)
+COMMENT = 'Each distinct generation prompt once; workouts and meal plans reference it by prompt_hash';
+
+GRANT SELECT, INSERT ON cortex_prompts TO ROLE TRAINING_APP_ROLE;
+
 -- ============================================================================
 -- Table 5: GENERATED_WORKOUTS - AI-Generated Workouts
 -- ============================================================================
@@ -119,8 +134,10 @@ CREATE OR REPLACE TABLE generated_workouts (
   exercises VARIANT NOT NULL COMMENT 'JSON array of exercises with sets/reps/rest',
   cool_down VARCHAR(1000) NOT NULL COMMENT 'Cool-down description',
   notes VARCHAR(2000) COMMENT 'Additional notes about the workout',
-  cortex_prompt VARCHAR(4000) COMMENT 'Prompt used for Cortex generation',
+  prompt_hash VARCHAR(64) COMMENT 'cortex_prompts row of the prompt used for Cortex generation',
   cortex_model VARCHAR(100) DEFAULT 'mistral-7b' COMMENT 'Cortex model used',
+  plan_status VARCHAR(20) DEFAULT 'ACTIVE' NOT NULL COMMENT 'ACTIVE, or DRAFT while a pre-generated plan awaits trainer review',
+  job_id VARCHAR(36) COMMENT 'generation_jobs row that produced this workout',
   PRIMARY KEY (workout_id),
   FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
 )
@@ -200,8 +217,10 @@ CREATE OR REPLACE TABLE meal_plans (
   carbs_g NUMBER(5,0) NOT NULL,
   fat_g NUMBER(5,0) NOT NULL,
   meal_plan_json VARIANT NOT NULL COMMENT 'Complete meal plan as JSON with daily breakdowns',
-  cortex_prompt VARCHAR(4000) COMMENT 'Prompt used for Cortex generation',
+  prompt_hash VARCHAR(64) COMMENT 'cortex_prompts row of the prompt used for Cortex generation',
   cortex_model VARCHAR(100) DEFAULT 'mistral-7b' COMMENT 'Cortex model used',
+  plan_status VARCHAR(20) DEFAULT 'ACTIVE' NOT NULL COMMENT 'ACTIVE, or DRAFT while a pre-generated plan awaits trainer review',
+  job_id VARCHAR(36) COMMENT 'generation_jobs row that produced this meal plan',
   PRIMARY KEY (meal_plan_id),
   FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
 )
@@ -210,6 +229,31 @@ COMMENT = 'AI-generated meal plans using Snowflake Cortex Prompt Complete';
 --CREATE INDEX IF NOT EXISTS idx_meal_plans_client_week ON meal_plans (client_id, plan_week);
 GRANT SELECT, INSERT, UPDATE, DELETE ON meal_plans TO ROLE TRAINING_APP_ROLE;
 
+-- ============================================================================
+-- Table 8: CLIENT_SNAPSHOT - Recent State per Client
+-- ============================================================================
+-- Kept current by the app's write paths; rows are rebuilt on read when missing
+
+CREATE TABLE IF NOT EXISTS client_snapshot (
+  client_id VARCHAR(36) NOT NULL,
+  last_workout_date DATE COMMENT 'Latest scheduled workout date (any plan status)',
+  current_week NUMBER(2,0) COMMENT 'Highest workout_week generated',
+  recent_workouts VARIANT COMMENT 'JSON array of {week, day, focus, duration_min}, newest version per week/day first (28 kept)',
+  last_meal_plan_start DATE COMMENT 'Start date of the latest meal plan',
+  meal_plan_week NUMBER(2,0) COMMENT 'Highest meal plan week generated',
+  latest_weigh_in_date DATE,
+  latest_weight_kg NUMBER(7,3),
+  latest_body_fat_pct NUMBER(5,2),
+  last_performed_date DATE COMMENT 'Latest date with a logged set',
+  sets_logged NUMBER(9,0) COMMENT 'Set results logged in total',
+  updated_at TIMESTAMP_LTZ DEFAULT CURRENT_TIMESTAMP NOT NULL,
+  PRIMARY KEY (client_id),
+  FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+)
+COMMENT = 'Per-client recent state kept current by the app write paths; rebuilt on read when missing';
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON client_snapshot TO ROLE TRAINING_APP_ROLE;
+
 -- ============================================================================
 -- Verification
 -- ============================================================================
@@ -66,7 +66,19 @@ CREATE STREAMLIT IF NOT EXISTS training_db.public.ai_personal_trainer
   FROM @ai_personal_trainer_repo/branches/main/streamlit_app
   MAIN_FILE = 'app.py'
   IMPORTS = ('@ai_personal_trainer_repo/branches/main/streamlit_app/environment.yml',
-             '@ai_personal_trainer_repo/branches/main/streamlit_app/app.py')
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/app.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/data_access.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/exercise_index.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/meal_planner.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/periodization.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/progression.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/export.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/history_import.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/generation.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/models.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/jobs.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/pregeneration.py',
+             '@ai_personal_trainer_repo/branches/main/streamlit_app/app_pages/')
   QUERY_WAREHOUSE = training_wh
   TITLE = 'AI Personal Trainer - Stage 1'
   COMMENT = 'Personalized Workout and Meal Plan Generation with Cortex Prompt Complete'
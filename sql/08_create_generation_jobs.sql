@@ -0,0 +1,140 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Background Generation Jobs
+-- Purpose: Queue Cortex workout / meal plan generations so they run outside the
+-- Streamlit script thread and survive page switches
+-- ============================================================================
+--
+-- Flow:
+--   1. The app builds the prompt and inserts a QUEUED row into generation_jobs.
+--   2. The app's in-process worker pool claims the row (QUEUED -> RUNNING), calls
+--      Cortex, saves the plan and marks the job SUCCEEDED / FAILED.
+--   3. TASK_PROCESS_GENERATION_JOBS sweeps workout jobs still QUEUED after a few
+--      minutes (e.g. the app container was suspended) and runs Cortex for them in one
+--      statement; finish_generation_jobs (the app's jobs.py) then decodes and validates
+--      each response, maps shortlist codes to library ids and saves the week exactly as
+--      the app's workers do, failing jobs whose response does not validate.
+--      Meal plans (the app's recipe planner, with its dietary and allergen rules) and
+--      rule-based weeks (cortex_model = 'periodization') are built by the app, so a
+--      stale job of either kind is failed for the trainer to request again rather
+--      than sent to Cortex.
+-- Claims are a conditional UPDATE on status, so a job is only ever run once.
+-- Jobs younger than the staleness window are left to the app's worker pool, except
+-- those of `run_origin`: pre-generation (sql/09) passes 'schedule' to run the batch
+-- it just queued, which the app never hands to its pool.
+-- Requires sql/03 (Git repository) for finish_generation_jobs' imports.
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+-- ============================================================================
+-- Table: GENERATION_JOBS - Queued / Running / Finished Generations
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS generation_jobs (
+  job_id VARCHAR(36) DEFAULT TO_VARCHAR(UUID_STRING()) NOT NULL,
+  client_id VARCHAR(36) NOT NULL,
+  job_kind VARCHAR(20) NOT NULL COMMENT 'workout_week, meal_plan',
+  plan_week NUMBER(2,0) NOT NULL COMMENT 'Week number in the plan',
+  start_date DATE NOT NULL COMMENT 'First day of the planned week',
+  status VARCHAR(20) DEFAULT 'QUEUED' NOT NULL COMMENT 'QUEUED, RUNNING, SUCCEEDED, FAILED',
+  prompt VARCHAR NOT NULL COMMENT 'Prompt sent to Cortex, built when the job was enqueued',
+  cortex_model VARCHAR(100) DEFAULT 'mistral-7b' NOT NULL COMMENT 'Cortex model used',
+  result VARIANT COMMENT 'Parsed Cortex output once the job succeeded',
+  error_message VARCHAR(2000) COMMENT 'Failure reason when status = FAILED',
+  worker VARCHAR(100) COMMENT 'Worker that claimed the job (app thread or task run)',
+  origin VARCHAR(20) DEFAULT 'app' NOT NULL COMMENT 'app (trainer request) or schedule (overnight pre-generation, saved as DRAFT)',
+  created_at TIMESTAMP_LTZ DEFAULT CURRENT_TIMESTAMP NOT NULL,
+  started_at TIMESTAMP_LTZ,
+  finished_at TIMESTAMP_LTZ,
+  PRIMARY KEY (job_id),
+  FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+)
+COMMENT = 'Queue of asynchronous Cortex generations for workouts and meal plans';
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON generation_jobs TO ROLE TRAINING_APP_ROLE;
+
+-- ============================================================================
+-- Procedure: Validate and Save Warehouse Completions
+-- ============================================================================
+
+ALTER GIT REPOSITORY ai_personal_trainer_repo FETCH;
+
+CREATE OR REPLACE PROCEDURE finish_generation_jobs(claim VARCHAR)
+RETURNS VARCHAR
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+PACKAGES = ('snowflake-snowpark-python', 'streamlit', 'pandas', 'numpy')
+IMPORTS = ('@ai_personal_trainer_repo/branches/main/streamlit_app/data_access.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/exercise_index.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/meal_planner.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/periodization.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/progression.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/generation.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/models.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/jobs.py')
+HANDLER = 'jobs.main'
+COMMENT = 'Decode, validate and save the Cortex responses process_generation_jobs stored for one claim'
+EXECUTE AS OWNER;
+
+-- ============================================================================
+-- Procedure: Run Stale Queued Jobs in the Warehouse
+-- ============================================================================
+
+-- Replaced by the two-argument version below
+DROP PROCEDURE IF EXISTS process_generation_jobs(NUMBER);
+
+CREATE OR REPLACE PROCEDURE process_generation_jobs(stale_after_minutes NUMBER, run_origin VARCHAR)
+RETURNS VARCHAR
+LANGUAGE SQL
+COMMENT = 'Claim jobs left QUEUED by the app, run Cortex and save the generated plans'
+AS
+$$
+DECLARE
+  claim VARCHAR DEFAULT 'task:' || UUID_STRING();
+  claimed NUMBER DEFAULT 0;
+BEGIN
+  UPDATE generation_jobs
+  SET status = 'FAILED', error_message = 'This plan is built by the app - request it again',
+      finished_at = CURRENT_TIMESTAMP
+  WHERE status = 'QUEUED'
+    AND (job_kind = 'meal_plan' OR cortex_model = 'periodization')
+    AND created_at <= DATEADD(MINUTE, -:stale_after_minutes, CURRENT_TIMESTAMP);
+
+  UPDATE generation_jobs
+  SET status = 'RUNNING', worker = :claim, started_at = CURRENT_TIMESTAMP
+  WHERE status = 'QUEUED'
+    AND job_kind = 'workout_week'
+    AND cortex_model <> 'periodization'
+    AND (origin = :run_origin OR created_at <= DATEADD(MINUTE, -:stale_after_minutes, CURRENT_TIMESTAMP));
+  claimed := SQLROWCOUNT;
+  IF (claimed = 0) THEN
+    RETURN 'No queued jobs';
+  END IF;
+
+  -- Same JSON extraction as the app: outermost {...} of the completion
+  UPDATE generation_jobs
+  SET result = TRY_PARSE_JSON(REGEXP_SUBSTR(SNOWFLAKE.CORTEX.COMPLETE(cortex_model, prompt), '\\{.*\\}', 1, 1, 's'))
+  WHERE worker = :claim;
+
+  -- Decoded, validated and saved by the app's own code (shortlist codes become library ids)
+  CALL finish_generation_jobs(:claim);
+
+  RETURN claimed || ' job(s) processed';
+END;
+$$;
+
+GRANT USAGE ON PROCEDURE process_generation_jobs(NUMBER, VARCHAR) TO ROLE TRAINING_APP_ADMIN;
+
+-- ============================================================================
+-- Task: Sweep Stale Queued Jobs (every 5 minutes)
+-- ============================================================================
+
+CREATE OR REPLACE TASK TASK_PROCESS_GENERATION_JOBS
+  WAREHOUSE = TRAINING_WH
+  SCHEDULE = '5 MINUTE'
+  COMMENT = 'Run generation jobs the app did not pick up within 5 minutes'
+AS
+CALL process_generation_jobs(5, NULL);
+
+ALTER TASK TASK_PROCESS_GENERATION_JOBS RESUME;
@@ -0,0 +1,80 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Overnight Pre-generation of Next Week's Plans
+-- Purpose: Generate next week's workouts / meal plans off-peak for clients whose
+-- current plan is about to end, saved as DRAFTs for trainer review
+-- ============================================================================
+--
+-- Flow:
+--   1. TASK_PREGENERATE_NEXT_WEEK runs nightly and calls pregenerate_next_week.
+--   2. The procedure (streamlit_app/pregeneration.py) finds clients whose latest
+--      workout / meal plan ends within the horizon and queues a schedule-origin
+--      job per client and kind in generation_jobs (sql/08), coalesced with any
+--      identical job already queued or succeeded.
+--   3. process_generation_jobs(5, 'schedule') runs the batch in the warehouse
+--      (jobs the app queued stay with its worker pool until stale) and
+--      finish_generation_jobs validates each week and resolves its exercise ids as
+--      the app does; plans from schedule-origin jobs are saved with
+--      plan_status = 'DRAFT'.
+--   4. The trainer approves (DRAFT -> ACTIVE) or discards drafts on the
+--      Workout / Meal Plan Generator pages.
+-- Requires sql/03 (Git repository) and sql/08 (generation_jobs).
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+-- ============================================================================
+-- Columns: Plan Status and Originating Job (existing deployments)
+-- ============================================================================
+
+ALTER TABLE generated_workouts ADD COLUMN IF NOT EXISTS
+  plan_status VARCHAR(20) DEFAULT 'ACTIVE' NOT NULL COMMENT 'ACTIVE, or DRAFT until a pre-generated plan is approved';
+ALTER TABLE generated_workouts ADD COLUMN IF NOT EXISTS
+  job_id VARCHAR(36) COMMENT 'generation_jobs row that produced this workout';
+
+ALTER TABLE meal_plans ADD COLUMN IF NOT EXISTS
+  plan_status VARCHAR(20) DEFAULT 'ACTIVE' NOT NULL COMMENT 'ACTIVE, or DRAFT until a pre-generated plan is approved';
+ALTER TABLE meal_plans ADD COLUMN IF NOT EXISTS
+  job_id VARCHAR(36) COMMENT 'generation_jobs row that produced this meal plan';
+
+ALTER TABLE generation_jobs ADD COLUMN IF NOT EXISTS
+  origin VARCHAR(20) DEFAULT 'app' NOT NULL COMMENT 'app (trainer request) or schedule (overnight pre-generation, saved as DRAFT)';
+
+-- ============================================================================
+-- Procedure: Queue and Run Next Week's Plans for Due Clients
+-- ============================================================================
+
+ALTER GIT REPOSITORY ai_personal_trainer_repo FETCH;
+
+CREATE OR REPLACE PROCEDURE pregenerate_next_week(horizon_days NUMBER)
+RETURNS VARIANT
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+PACKAGES = ('snowflake-snowpark-python', 'streamlit', 'pandas', 'numpy')
+IMPORTS = ('@ai_personal_trainer_repo/branches/main/streamlit_app/data_access.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/exercise_index.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/meal_planner.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/periodization.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/progression.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/generation.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/models.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/jobs.py',
+           '@ai_personal_trainer_repo/branches/main/streamlit_app/pregeneration.py')
+HANDLER = 'pregeneration.main'
+COMMENT = 'Queue and run next week''s workouts / meal plans as DRAFTs for clients whose plan ends within horizon_days'
+EXECUTE AS OWNER;
+
+GRANT USAGE ON PROCEDURE pregenerate_next_week(NUMBER) TO ROLE TRAINING_APP_ADMIN;
+
+-- ============================================================================
+-- Task: Nightly Pre-generation (02:00 UTC, off-peak)
+-- ============================================================================
+
+CREATE OR REPLACE TASK TASK_PREGENERATE_NEXT_WEEK
+  WAREHOUSE = TRAINING_WH
+  SCHEDULE = 'USING CRON 0 2 * * * UTC'
+  COMMENT = 'Pre-generate next week''s plans for clients whose plan ends within 3 days'
+AS
+CALL pregenerate_next_week(3);
+
+ALTER TASK TASK_PREGENERATE_NEXT_WEEK RESUME;
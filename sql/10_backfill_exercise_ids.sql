@@ -0,0 +1,33 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Backfill Library Exercise IDs on Results
+-- Purpose: Re-key exercise_results recorded against free-text exercise names
+-- onto exercises_library ids, so older history aggregates with results saved
+-- since generated exercises are resolved to library ids
+-- ============================================================================
+--
+-- The app resolves names with a fuzzy index (streamlit_app/exercise_index.py).
+-- This one-off backfill only re-keys names that match a library name or
+-- variation exactly, ignoring case, spaces and punctuation; anything else
+-- keeps its name. Safe to re-run.
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+UPDATE exercise_results r
+SET exercise_id = m.exercise_id
+FROM (
+  SELECT exercise_id, name_key
+  FROM (
+    SELECT exercise_id, REGEXP_REPLACE(LOWER(exercise_name), '[^a-z0-9]', '') AS name_key, 0 AS is_variation
+    FROM exercises_library
+    UNION ALL
+    SELECT l.exercise_id, REGEXP_REPLACE(LOWER(v.value::VARCHAR), '[^a-z0-9]', ''), 1
+    FROM exercises_library l,
+      LATERAL FLATTEN(input => l.variations) v
+  )
+  -- Canonical names win over another exercise's variation
+  QUALIFY ROW_NUMBER() OVER (PARTITION BY name_key ORDER BY is_variation, exercise_id) = 1
+) m
+WHERE REGEXP_REPLACE(LOWER(r.exercise_id), '[^a-z0-9]', '') = m.name_key
+  AND r.exercise_id NOT IN (SELECT exercise_id FROM exercises_library);
@@ -0,0 +1,60 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Data Export Stage
+-- Purpose: Internal stage the Data Export page writes history archives to, and
+-- hands out presigned download links from
+-- ============================================================================
+--
+-- The app streams each dataset into Parquet / CSV files in bounded batches, zips
+-- them and PUTs the archive under @export_stage/<archive name>/. Links expire after
+-- an hour; archives older than a week are removed by TASK_PURGE_EXPORTS.
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+-- Server-side encryption is required for GET_PRESIGNED_URL on an internal stage
+CREATE STAGE IF NOT EXISTS export_stage
+  ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
+  DIRECTORY = (ENABLE = true)
+  COMMENT = 'Client history exports (Parquet / CSV archives) from the Data Export page'
+;
+
+GRANT READ, WRITE ON STAGE export_stage TO ROLE TRAINING_APP_ROLE;
+GRANT READ, WRITE ON STAGE export_stage TO ROLE TRAINING_APP_ADMIN;
+
+-- ============================================================================
+-- Task: Purge Old Exports
+-- ============================================================================
+
+CREATE OR REPLACE PROCEDURE purge_exports(max_age_days NUMBER)
+RETURNS NUMBER
+LANGUAGE SQL
+AS
+$$
+DECLARE
+  removed NUMBER DEFAULT 0;
+  expired RESULTSET;
+BEGIN
+  -- PUTs do not update an internal stage's directory table on their own
+  ALTER STAGE export_stage REFRESH;
+  expired := (
+    SELECT relative_path
+    FROM DIRECTORY(@export_stage)
+    WHERE last_modified < DATEADD(day, -:max_age_days, CURRENT_TIMESTAMP())
+  );
+  FOR file IN expired DO
+    EXECUTE IMMEDIATE 'REMOVE @export_stage/' || file.relative_path;
+    removed := removed + 1;
+  END FOR;
+  RETURN removed;
+END;
+$$;
+
+CREATE OR REPLACE TASK TASK_PURGE_EXPORTS
+  WAREHOUSE = TRAINING_WH
+  SCHEDULE = 'USING CRON 0 3 * * * UTC'
+  COMMENT = 'Remove export archives older than 7 days'
+AS
+  CALL purge_exports(7);
+
+ALTER TASK TASK_PURGE_EXPORTS RESUME;
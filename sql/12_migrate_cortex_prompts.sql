@@ -0,0 +1,74 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Move Cortex Prompts into CORTEX_PROMPTS
+-- Purpose: Store each generation prompt once instead of a copy on every
+-- generated_workouts / meal_plans row (seven copies per workout week)
+-- ============================================================================
+--
+-- Upgrades only: 02_stage1_create_tables.sql already creates the new shape.
+-- Existing prompts are hashed with SHA2(..., 256), the same lower-case hex
+-- SHA-256 the app writes, copied into cortex_prompts once per distinct text and
+-- referenced through prompt_hash; the per-row cortex_prompt column is then
+-- dropped. Run once, when deploying the app files that write prompt_hash, and
+-- re-run 08_create_generation_jobs.sql so the task's procedure writes it too.
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+CREATE TABLE IF NOT EXISTS cortex_prompts (
+  prompt_hash VARCHAR(64) NOT NULL COMMENT 'SHA-256 of prompt_text (lower-case hex, as SHA2(prompt_text, 256))',
+  prompt_text VARCHAR NOT NULL COMMENT 'Full prompt sent to Cortex',
+  model VARCHAR(100) COMMENT 'Cortex model the prompt was first sent to',
+  created_at TIMESTAMP_LTZ DEFAULT CURRENT_TIMESTAMP NOT NULL,
+  PRIMARY KEY (prompt_hash)
+)
+COMMENT = 'Each distinct generation prompt once; workouts and meal plans reference it by prompt_hash';
+
+GRANT SELECT, INSERT ON cortex_prompts TO ROLE TRAINING_APP_ROLE;
+
+ALTER TABLE generated_workouts ADD COLUMN IF NOT EXISTS
+  prompt_hash VARCHAR(64) COMMENT 'cortex_prompts row of the prompt used for Cortex generation';
+ALTER TABLE meal_plans ADD COLUMN IF NOT EXISTS
+  prompt_hash VARCHAR(64) COMMENT 'cortex_prompts row of the prompt used for Cortex generation';
+
+-- ============================================================================
+-- Copy Each Distinct Prompt Once
+-- ============================================================================
+
+MERGE INTO cortex_prompts p
+USING (
+  SELECT SHA2(cortex_prompt, 256) AS prompt_hash,
+         ANY_VALUE(cortex_prompt) AS prompt_text,
+         ANY_VALUE(cortex_model) AS model,
+         MIN(generation_date) AS created_at
+  FROM (
+    SELECT cortex_prompt, cortex_model, generation_date FROM generated_workouts WHERE cortex_prompt IS NOT NULL
+    UNION ALL
+    SELECT cortex_prompt, cortex_model, generation_date FROM meal_plans WHERE cortex_prompt IS NOT NULL
+  )
+  GROUP BY 1
+) s
+ON p.prompt_hash = s.prompt_hash
+WHEN NOT MATCHED THEN INSERT (prompt_hash, prompt_text, model, created_at)
+  VALUES (s.prompt_hash, s.prompt_text, s.model, s.created_at);
+
+-- ============================================================================
+-- Reference Prompts by Hash and Drop the Copies
+-- ============================================================================
+
+UPDATE generated_workouts
+SET prompt_hash = SHA2(cortex_prompt, 256)
+WHERE cortex_prompt IS NOT NULL AND prompt_hash IS NULL;
+
+UPDATE meal_plans
+SET prompt_hash = SHA2(cortex_prompt, 256)
+WHERE cortex_prompt IS NOT NULL AND prompt_hash IS NULL;
+
+ALTER TABLE generated_workouts DROP COLUMN IF EXISTS cortex_prompt;
+ALTER TABLE meal_plans DROP COLUMN IF EXISTS cortex_prompt;
+
+-- Verification: prompts stored vs rows referencing them
+SELECT
+  (SELECT COUNT(*) FROM cortex_prompts) AS prompts_stored,
+  (SELECT COUNT(*) FROM generated_workouts WHERE prompt_hash IS NOT NULL) AS workout_rows,
+  (SELECT COUNT(*) FROM meal_plans WHERE prompt_hash IS NOT NULL) AS meal_plan_rows;
@@ -0,0 +1,216 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Weekly Adherence Rollup
+-- Purpose: Prescribed vs performed per client and week (sessions done / missed,
+-- set completion and rep volume) for every client in one set-based pass
+-- ============================================================================
+--
+-- Prescriptions are the exercises VARIANT of each day's active workout (the newest
+-- version when a day was regenerated), flattened with LATERAL FLATTEN and matched to
+-- exercise_results on client, date and exercise_id. A shortlist code saved in place
+-- of an id is mapped to its library id by prefix (as exercise_index.code_to_id does),
+-- and an exercise with neither is matched by its library name or a variation, as in
+-- sql/10. Only days up to today count, so a week fills in as it goes. A session is done when any set was logged that day.
+--
+-- refresh_adherence() is incremental: it recomputes only the (client, week) pairs
+-- with workouts generated or sets recorded since the previous run, plus the last 7
+-- days (so days that have since passed turn into missed sessions). The first run
+-- builds the whole history. TASK_REFRESH_ADHERENCE runs it hourly.
+-- Prescriptions carry no loads, so volume is compared in reps (sets x reps, a
+-- range such as '8-10' counting as its midpoint); performed kg volume is kept too.
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+-- ============================================================================
+-- Table: ADHERENCE_WEEKLY - Prescribed vs Performed per Client and Week
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS adherence_weekly (
+  client_id VARCHAR(36) NOT NULL,
+  week_start DATE NOT NULL COMMENT 'Monday of the week (DATE_TRUNC week)',
+  prescribed_sessions NUMBER(2,0) NOT NULL COMMENT 'Training days prescribed up to today',
+  completed_sessions NUMBER(2,0) NOT NULL COMMENT 'Prescribed days with at least one set logged',
+  missed_sessions NUMBER(2,0) NOT NULL COMMENT 'Prescribed days with nothing logged',
+  prescribed_sets NUMBER(5,0) NOT NULL,
+  completed_sets NUMBER(5,0) NOT NULL COMMENT 'Logged sets of prescribed exercises, capped at the prescribed sets',
+  completion_pct NUMBER(5,1) COMMENT 'completed_sets / prescribed_sets',
+  prescribed_reps NUMBER(7,0) COMMENT 'Sets x reps of exercises with a numeric rep target',
+  performed_reps NUMBER(7,0) COMMENT 'Reps logged for those exercises',
+  volume_delta_pct NUMBER(6,1) COMMENT '(performed_reps - prescribed_reps) / prescribed_reps',
+  performed_volume_kg NUMBER(12,1) COMMENT 'Sum of weight_kg x reps logged for prescribed exercises',
+  computed_at TIMESTAMP_LTZ NOT NULL COMMENT 'Start of the refresh that wrote the row',
+  PRIMARY KEY (client_id, week_start),
+  FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+)
+COMMENT = 'Weekly adherence per client, maintained incrementally by refresh_adherence()';
+
+GRANT SELECT ON adherence_weekly TO ROLE TRAINING_APP_ROLE;
+
+-- ============================================================================
+-- Procedure: Recompute Changed Client Weeks
+-- ============================================================================
+
+CREATE OR REPLACE PROCEDURE refresh_adherence()
+RETURNS VARCHAR
+LANGUAGE SQL
+COMMENT = 'Recompute adherence_weekly for client weeks with new workouts or sets since the last run'
+AS
+$$
+DECLARE
+  run_started TIMESTAMP_LTZ DEFAULT CURRENT_TIMESTAMP;
+  since TIMESTAMP_LTZ;
+  refreshed NUMBER DEFAULT 0;
+BEGIN
+  -- Rows written while the previous run was going have later timestamps than its start
+  since := (SELECT COALESCE(MAX(computed_at), '1970-01-01'::TIMESTAMP_LTZ) FROM adherence_weekly);
+
+  CREATE OR REPLACE TEMPORARY TABLE adherence_changed AS
+  SELECT client_id, DATE_TRUNC('week', workout_date) AS week_start
+  FROM generated_workouts
+  WHERE workout_date IS NOT NULL
+    AND (generation_date > :since OR workout_date BETWEEN DATEADD(DAY, -7, CURRENT_DATE) AND CURRENT_DATE)
+  UNION
+  SELECT client_id, DATE_TRUNC('week', performed_date)
+  FROM exercise_results
+  WHERE recorded_at > :since;
+
+  BEGIN TRANSACTION;
+
+  DELETE FROM adherence_weekly a
+  USING adherence_changed c
+  WHERE a.client_id = c.client_id AND a.week_start = c.week_start;
+
+  INSERT INTO adherence_weekly
+  (client_id, week_start, prescribed_sessions, completed_sessions, missed_sessions, prescribed_sets,
+   completed_sets, completion_pct, prescribed_reps, performed_reps, volume_delta_pct, performed_volume_kg,
+   computed_at)
+  WITH library_names AS (
+    -- Library names and variations, one exercise per normalised name (as in sql/10): canonical
+    -- names win over another exercise's variation, so a shared name cannot duplicate a prescription
+    SELECT name_key, exercise_id
+    FROM (
+      SELECT exercise_id, REGEXP_REPLACE(LOWER(exercise_name), '[^a-z0-9]', '') AS name_key, 0 AS is_variation
+      FROM exercises_library
+      UNION ALL
+      SELECT l.exercise_id, REGEXP_REPLACE(LOWER(v.value::VARCHAR), '[^a-z0-9]', ''), 1
+      FROM exercises_library l,
+        LATERAL FLATTEN(input => l.variations) v
+    )
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY name_key ORDER BY is_variation, exercise_id) = 1
+  ),
+  prescribed_days AS (
+    SELECT w.client_id, w.workout_date, w.exercises
+    FROM generated_workouts w
+    JOIN adherence_changed c
+      ON c.client_id = w.client_id AND c.week_start = DATE_TRUNC('week', w.workout_date)
+    WHERE w.plan_status = 'ACTIVE'
+      AND w.workout_date <= CURRENT_DATE
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY w.client_id, w.workout_date ORDER BY w.generation_date DESC) = 1
+  ),
+  prescribed_exercises AS (
+    SELECT d.client_id, d.workout_date, e.value AS exercise,
+           NULLIF(TRIM(COALESCE(e.value:exercise_id::VARCHAR, e.value:id::VARCHAR)), '') AS code
+    FROM prescribed_days d,
+      LATERAL FLATTEN(input => d.exercises) e
+  ),
+  code_ids AS (
+    -- Shortlist codes (the shortest unique library id prefix, 8+ characters) as saved by weeks
+    -- generated before ids were resolved at save time; a full id is its own prefix.
+    -- A prefix matching more than one library row is left unresolved.
+    SELECT p.code, ANY_VALUE(l.exercise_id) AS exercise_id
+    FROM (SELECT DISTINCT code FROM prescribed_exercises WHERE LENGTH(code) >= 8) p
+    JOIN exercises_library l
+      ON STARTSWITH(l.exercise_id, p.code)
+    GROUP BY p.code
+    HAVING COUNT(*) = 1
+  ),
+  prescribed AS (
+    SELECT
+      p.client_id,
+      p.workout_date,
+      COALESCE(c.exercise_id, l.exercise_id, p.code, p.exercise:name::VARCHAR) AS exercise_id,
+      GREATEST(COALESCE(TRY_TO_NUMBER(p.exercise:sets::VARCHAR), 3), 1) AS sets,
+      -- '8' -> 8, '8-10' -> 9; no number (e.g. 'AMRAP') -> NULL, left out of rep volume
+      COALESCE((TRY_TO_NUMBER(REGEXP_SUBSTR(p.exercise:reps::VARCHAR, '[0-9]+', 1, 1))
+                + TRY_TO_NUMBER(REGEXP_SUBSTR(p.exercise:reps::VARCHAR, '[0-9]+', 1, 2))) / 2,
+               TRY_TO_NUMBER(REGEXP_SUBSTR(p.exercise:reps::VARCHAR, '[0-9]+', 1, 1))) AS reps
+    FROM prescribed_exercises p
+    LEFT JOIN code_ids c
+      ON c.code = p.code
+    -- Same order as the app: a library id or code first, then the exercise name
+    LEFT JOIN library_names l
+      ON c.exercise_id IS NULL
+     AND l.name_key = REGEXP_REPLACE(LOWER(p.exercise:name::VARCHAR), '[^a-z0-9]', '')
+  ),
+  performed AS (
+    SELECT r.client_id, r.performed_date, r.exercise_id,
+           COUNT(*) AS sets, SUM(r.reps) AS reps, SUM(r.weight_kg * r.reps) AS volume_kg
+    FROM exercise_results r
+    JOIN adherence_changed c
+      ON c.client_id = r.client_id AND c.week_start = DATE_TRUNC('week', r.performed_date)
+    GROUP BY r.client_id, r.performed_date, r.exercise_id
+  ),
+  days AS (
+    SELECT
+      p.client_id,
+      p.workout_date,
+      SUM(p.sets) AS prescribed_sets,
+      SUM(LEAST(COALESCE(r.sets, 0), p.sets)) AS completed_sets,
+      SUM(IFF(p.reps IS NULL, NULL, p.sets * p.reps)) AS prescribed_reps,
+      SUM(IFF(p.reps IS NULL, NULL, COALESCE(r.reps, 0))) AS performed_reps,
+      SUM(r.volume_kg) AS performed_volume_kg
+    FROM prescribed p
+    LEFT JOIN performed r
+      ON r.client_id = p.client_id AND r.performed_date = p.workout_date AND r.exercise_id = p.exercise_id
+    GROUP BY p.client_id, p.workout_date
+  ),
+  logged_days AS (
+    SELECT DISTINCT client_id, performed_date FROM performed
+  )
+  SELECT
+    d.client_id,
+    DATE_TRUNC('week', d.workout_date) AS week_start,
+    COUNT(*) AS prescribed_sessions,
+    COUNT(l.performed_date) AS completed_sessions,
+    COUNT(*) - COUNT(l.performed_date) AS missed_sessions,
+    SUM(d.prescribed_sets),
+    SUM(d.completed_sets),
+    ROUND(100 * SUM(d.completed_sets) / NULLIF(SUM(d.prescribed_sets), 0), 1),
+    SUM(d.prescribed_reps),
+    SUM(d.performed_reps),
+    ROUND(100 * (SUM(d.performed_reps) - SUM(d.prescribed_reps)) / NULLIF(SUM(d.prescribed_reps), 0), 1),
+    ROUND(SUM(d.performed_volume_kg), 1),
+    :run_started
+  FROM days d
+  LEFT JOIN logged_days l
+    ON l.client_id = d.client_id AND l.performed_date = d.workout_date
+  GROUP BY d.client_id, DATE_TRUNC('week', d.workout_date);
+  refreshed := SQLROWCOUNT;
+
+  COMMIT;
+  RETURN refreshed || ' client week(s) refreshed';
+END;
+$$;
+
+GRANT USAGE ON PROCEDURE refresh_adherence() TO ROLE TRAINING_APP_ADMIN;
+
+-- ============================================================================
+-- Task: Hourly Refresh
+-- ============================================================================
+
+CREATE OR REPLACE TASK TASK_REFRESH_ADHERENCE
+  WAREHOUSE = TRAINING_WH
+  SCHEDULE = 'USING CRON 15 * * * * UTC'
+  COMMENT = 'Recompute adherence for client weeks changed since the last run'
+AS
+CALL refresh_adherence();
+
+ALTER TASK TASK_REFRESH_ADHERENCE RESUME;
+
+-- Initial build (the first run covers all history)
+CALL refresh_adherence();
+
+-- Verification
+SELECT COUNT(*) AS client_weeks, AVG(completion_pct) AS avg_completion_pct, SUM(missed_sessions) AS missed_sessions
+FROM adherence_weekly;
@@ -0,0 +1,40 @@
+-- ============================================================================
+-- AI Personal Trainer Stage 1 - Per-client Context Snapshot
+-- Purpose: One row per client with the recent state pages and prompt builders
+-- show (latest weigh-in, last workout / meal plan, current week, recent focus
+-- areas, logged sets), read with a single primary-key lookup
+-- ============================================================================
+--
+-- Upgrades only: 02_stage1_create_tables.sql already creates the table. Run it
+-- before re-running 08_create_generation_jobs.sql, whose procedure now clears the
+-- snapshots of clients it generated plans for.
+--
+-- The app's write paths (streamlit_app/data_access.py) update the row column by
+-- column as workouts, meal plans, weigh-ins and set results are saved. Writers that
+-- bypass them delete the row instead - history imports, discarded drafts and the
+-- warehouse job sweep (sql/08) - and the app rebuilds it from the base tables on the
+-- next read, as it does for clients that have no row yet. No backfill is needed.
+
+USE DATABASE TRAINING_DB;
+USE SCHEMA PUBLIC;
+USE WAREHOUSE TRAINING_WH;
+
+CREATE TABLE IF NOT EXISTS client_snapshot (
+  client_id VARCHAR(36) NOT NULL,
+  last_workout_date DATE COMMENT 'Latest scheduled workout date (any plan status)',
+  current_week NUMBER(2,0) COMMENT 'Highest workout_week generated',
+  recent_workouts VARIANT COMMENT 'JSON array of {week, day, focus, duration_min}, newest version per week/day first (28 kept)',
+  last_meal_plan_start DATE COMMENT 'Start date of the latest meal plan',
+  meal_plan_week NUMBER(2,0) COMMENT 'Highest meal plan week generated',
+  latest_weigh_in_date DATE,
+  latest_weight_kg NUMBER(7,3),
+  latest_body_fat_pct NUMBER(5,2),
+  last_performed_date DATE COMMENT 'Latest date with a logged set',
+  sets_logged NUMBER(9,0) COMMENT 'Set results logged in total',
+  updated_at TIMESTAMP_LTZ DEFAULT CURRENT_TIMESTAMP NOT NULL,
+  PRIMARY KEY (client_id),
+  FOREIGN KEY (client_id) REFERENCES clients(client_id) ON DELETE CASCADE
+)
+COMMENT = 'Per-client recent state kept current by the app write paths; rebuilt on read when missing';
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON client_snapshot TO ROLE TRAINING_APP_ROLE;
@@ -0,0 +1,66 @@
+"""
+Page: Client Profiles
+"""
+
+import streamlit as st
+
+from data_access import get_clients, variant_list
+
+def page_client_profiles():
+    st.title("👥 Client Profiles")
+    st.markdown("View and manage client profiles")
+    
+    clients_df = get_clients()
+    
+    if clients_df.empty:
+        st.info("No clients found. Create a new client to get started!")
+        return
+    
+    selected_client_name = st.selectbox(
+        "Select Client to View",
+        clients_df['CLIENT_NAME'].tolist(),
+        key="profile_client_select"
+    )
+    
+    selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+    
+    st.markdown(f"## {selected_client['CLIENT_NAME']}")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Age", f"{selected_client['AGE']} years")
+    col2.metric("Height", f"{selected_client['HEIGHT_CM']} cm")
+    col3.metric("Weight", f"{selected_client['CURRENT_WEIGHT_KG']:.2f} kg")
+    col4.metric("Fitness Level", selected_client['FITNESS_LEVEL'])
+    
+    st.divider()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### Goals & Preferences")
+        st.write(f"**Fitness Goals:**")
+        for goal in variant_list(selected_client['FITNESS_GOALS']):
+            st.write(f"• {goal}")
+        
+        st.write(f"**Equipment Available:**")
+        for eq in variant_list(selected_client['AVAILABLE_EQUIPMENT']):
+            st.write(f"• {eq}")
+    
+    with col2:
+        st.markdown("### Training & Nutrition Targets")
+        st.write(f"**Training Schedule:**")
+        st.write(f"• {selected_client['DAYS_PER_WEEK']} days per week")
+        st.write(f"• {selected_client['WORKOUT_DURATION_MIN']} minutes per session")
+        
+        st.write(f"**Nutrition Targets:**")
+        if selected_client.get('target_calories'):
+            st.write(f"• {selected_client['target_calories']} kcal/day")
+        if selected_client.get('target_protein_g'):
+            st.write(f"• {selected_client['target_protein_g']}g protein/day")
+        
+        if selected_client.get('allergies'):
+            st.write(f"**Allergies/Restrictions:**")
+            st.write(f"• {selected_client['allergies']}")
+
+
+page_client_profiles()
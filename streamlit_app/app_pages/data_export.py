@@ -0,0 +1,68 @@
+"""
+Page: Data Export
+"""
+
+import streamlit as st
+import tempfile
+import pandas as pd
+
+from data_access import get_clients
+from export import EXPORTS, FORMATS, URL_EXPIRY_SEC, build_export, publish_export
+
+ALL_CLIENTS = "All clients"
+
+def page_data_export():
+    st.title("📦 Data Export")
+    st.markdown("Export a client's full history (workouts, set results, weigh-ins, measurements and meal plans)")
+
+    clients_df = get_clients()
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        selected = st.selectbox("Client", [ALL_CLIENTS] + clients_df['CLIENT_NAME'].tolist(), key="export_client_select")
+    with col2:
+        fmt = st.radio("Format", FORMATS, format_func=str.upper, horizontal=True, key="export_format")
+
+    client_id = None
+    if selected != ALL_CLIENTS:
+        client_id = clients_df[clients_df['CLIENT_NAME'] == selected].iloc[0]['CLIENT_ID']
+
+    st.caption(f"One {fmt.upper()} file per dataset in a zip: {', '.join(EXPORTS)}. Workout exercises and "
+               "meals are flattened to one row each.")
+
+    if not st.button("📦 Export History", type="primary", use_container_width=True):
+        return
+
+    progress = st.progress(0.0, text="Starting export...")
+    with tempfile.TemporaryDirectory() as out_dir:
+        try:
+            archive, counts = build_export(
+                client_id, out_dir, fmt,
+                on_progress=lambda done, dataset: progress.progress(done, text=f"Exported {dataset}"),
+            )
+        except Exception as e:
+            st.error(f"Error exporting history: {str(e)}")
+            return
+
+        st.success(f"✅ Exported {sum(counts.values()):,} rows for {selected}")
+        st.dataframe(pd.DataFrame({'Dataset': list(counts), 'Rows': list(counts.values())}),
+                     hide_index=True, use_container_width=True)
+
+        try:
+            url = publish_export(archive)
+        except Exception as e:
+            # No export stage (e.g. not yet created, or running locally): hand the file over directly
+            st.warning(f"Export stage unavailable ({str(e)}); downloading through the app instead.")
+            with open(archive, 'rb') as f:
+                st.download_button("⬇️ Download Export", f, file_name=archive.name, mime="application/zip",
+                                   use_container_width=True)
+            return
+
+    st.link_button("⬇️ Download Export", url, use_container_width=True)
+    st.caption(f"The link is valid for {URL_EXPIRY_SEC // 60} minutes.")
+
+
+page_data_export()
@@ -0,0 +1,70 @@
+"""
+Page: Import History
+"""
+
+import streamlit as st
+
+from data_access import get_clients
+from history_import import IMPORTS, WEIGHT_UNITS, HistoryImportError, read_upload
+
+def page_data_import():
+    st.title("📥 Import History")
+    st.markdown("Load a client's set logs or weigh-ins from another app's CSV export")
+
+    clients_df = get_clients()
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        selected_client_name = st.selectbox("Client", clients_df['CLIENT_NAME'].tolist(), key="import_client_select")
+    with col2:
+        kind = st.radio("Data", list(IMPORTS), format_func=lambda k: IMPORTS[k][0], horizontal=True, key="import_kind")
+    with col3:
+        weight_unit = st.radio("Weights in", WEIGHT_UNITS, horizontal=True, key="import_weight_unit",
+                               help="Unit of a plain 'Weight' column; columns named in lb / lbs are always converted")
+    client_id = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]['CLIENT_ID']
+    label, normalize, load = IMPORTS[kind]
+
+    uploaded = st.file_uploader(f"{label} CSV", type=['csv', 'txt'], key="import_file")
+    if uploaded is None:
+        st.caption("Headers are matched by name (e.g. Date, Exercise Name, Set Order, Weight, Reps, RPE from Strong "
+                   "or Hevy exports). Rows that fail validation are listed and skipped; importing the same file "
+                   "again updates rows instead of duplicating them.")
+        return
+
+    try:
+        rows, rejected = normalize(read_upload(uploaded.getvalue()), weight_unit)
+    except HistoryImportError as e:
+        st.error(str(e))
+        return
+
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Rows Read", f"{len(rows) + len(rejected):,}")
+    c2.metric("Valid", f"{len(rows):,}")
+    c3.metric("Rejected", f"{len(rejected):,}")
+
+    unresolved = rows.attrs.get('unresolved', [])
+    if unresolved:
+        st.info(f"{len(unresolved)} exercise name(s) are not in the library and will be kept as named: "
+                f"{', '.join(unresolved[:10])}{'...' if len(unresolved) > 10 else ''}")
+    if not rejected.empty:
+        with st.expander(f"Rejected rows ({len(rejected):,})"):
+            st.dataframe(rejected.head(500), hide_index=True, use_container_width=True)
+    st.dataframe(rows.head(20), hide_index=True, use_container_width=True)
+
+    if st.button(f"📥 Import {len(rows):,} {label}", type="primary", use_container_width=True, disabled=rows.empty):
+        with st.spinner("Importing..."):
+            try:
+                counts = load(client_id, rows)
+            except Exception as e:
+                st.error(f"Error importing {label.lower()}: {str(e)}")
+                return
+        message = f"✅ {counts['inserted']:,} new, {counts['updated']:,} updated for {selected_client_name}"
+        if counts['duplicates']:
+            message += f" ({counts['duplicates']:,} repeated rows in the file merged)"
+        st.success(message)
+
+
+page_data_import()
@@ -0,0 +1,181 @@
+"""
+Page: Record Exercise Results
+"""
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from data_access import (
+    get_client_workouts,
+    get_clients,
+    get_exercise_1rm_trend,
+    get_exercise_progress,
+    insert_exercise_results,
+)
+from exercise_index import resolve_exercise_id
+from progression import clear_recommendations, describe_recommendation, get_recommendations
+
+@st.fragment
+def progress_panel(client_id: str, exercise_id: str):
+    """Aggregated metrics and weekly 1RM trend; only re-queried on a full rerun (e.g. after a save)"""
+    import plotly.express as px
+
+    progress = get_exercise_progress(client_id, exercise_id)
+    trend_df = get_exercise_1rm_trend(client_id, exercise_id, weeks=12)
+
+    with st.expander("Progress & Trend", expanded=True):
+        if progress:
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Estimated 1RM", f"{progress.get('estimated_1rm', 'N/A'):.1f}" if progress.get('estimated_1rm') else "N/A")
+            c2.metric("Max Weight", f"{progress.get('max_weight_kg', 'N/A'):.1f} kg" if progress.get('max_weight_kg') else "N/A")
+            c3.metric("Avg Reps", f"{progress.get('avg_reps', 'N/A'):.1f}" if progress.get('avg_reps') else "N/A")
+            c4.metric("Sessions", f"{progress.get('sessions_recorded', 0)}")
+
+            # Recent sets table (limit 8)
+            recent = progress.get('recent_sets') or []
+            if isinstance(recent, str):
+                recent = []
+
+            if recent:
+                recent_tbl = pd.DataFrame(recent)
+                if not recent_tbl.empty:
+                    st.markdown("**Recent Sets (most recent first)**")
+                    # show only a few columns for compact view
+                    cols_to_show = [c for c in ['performed_date', 'set_number', 'reps', 'weight_kg', 'rpe', 'rest_seconds'] if c in recent_tbl.columns]
+                    st.dataframe(recent_tbl[cols_to_show].head(8), use_container_width=True)
+        else:
+            st.info("No progress data available for this exercise yet.")
+
+        # Trend chart (weekly estimated 1RM)
+        if not trend_df.empty and 'estimated_1rm_max' in trend_df.columns:
+            fig = px.line(trend_df, x='week_start', y='estimated_1rm_max', markers=True, title='Weekly Estimated 1RM (Epley)')
+            fig.update_layout(xaxis_title='Week Start', yaxis_title='Estimated 1RM (kg)')
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Not enough historical data to plot a weekly 1RM trend. Record some sets to see trends.")
+
+@st.fragment
+def set_entry(client_id: str, workout_id: str, workout_date, exercise: dict, exercise_id: str, target=None,
+              key: str = "er"):
+    """Per-set entry grid; typing into the form runs no queries and all sets are saved in one insert.
+    `target` is the exercise's progression recommendation, used to pre-fill reps, weight and duration.
+    `key` prefixes the widget keys and must differ per workout and exercise, so values typed for one
+    exercise are never carried over to (and saved against) another."""
+    exercise_name = exercise.get('name')
+
+    saved_message = st.session_state.pop('er_saved_message', None)
+    if saved_message:
+        st.success(saved_message)
+
+    # Changing the number of sets only reruns this fragment
+    default_sets = exercise.get('sets', 3)
+    sets_to_record = st.number_input("Number of Sets to Record", min_value=1, max_value=20, value=default_sets, key=f"{key}_sets")
+
+    default_reps = exercise.get('reps', 0) if isinstance(exercise.get('reps'), int) else 10
+    default_weight = 0.0
+    default_duration = 0
+    if target is not None:
+        st.caption(f"🎯 Next target - {describe_recommendation(target, exercise_name)}")
+        default_reps = min(int(target['NEXT_REPS']), 100)
+        if pd.notna(target['NEXT_WEIGHT_KG']):
+            default_weight = float(target['NEXT_WEIGHT_KG'])
+        if pd.notna(target['NEXT_DURATION_SEC']):
+            default_duration = min(int(target['NEXT_DURATION_SEC']), 3600)
+
+    with st.form(f"{key}_sets_form", border=False):
+        performed_date = st.date_input("Performed Date", value=workout_date if workout_date else datetime.now().date(), key=f"{key}_date")
+
+        # Dynamic inputs for each set
+        set_entries = []
+        for s in range(1, sets_to_record + 1):
+            with st.expander(f"Set {s}", expanded=(s == 1)):
+                c1, c2, c3, c4 = st.columns(4)
+                reps = c1.number_input(f"Reps (Set {s})", min_value=0, max_value=100, value=default_reps, key=f"{key}_{s}_reps")
+                weight = c2.number_input(f"Weight (kg) (Set {s})", min_value=0.0, max_value=1000.0, value=default_weight, format="%.2f", key=f"{key}_{s}_weight")
+                rpe = c3.number_input(f"RPE (Set {s})", min_value=0.0, max_value=10.0, value=0.0, format="%.1f", key=f"{key}_{s}_rpe")
+                rest = c4.number_input(f"Rest sec (Set {s})", min_value=0, max_value=600, value=exercise.get('rest_sec', 60), key=f"{key}_{s}_rest")
+                duration = st.number_input(f"Duration sec (Set {s})", min_value=0, max_value=3600, value=default_duration, key=f"{key}_{s}_dur")
+                note = st.text_input(f"Notes (Set {s})", value="", key=f"{key}_{s}_notes")
+                set_entries.append({
+                    'set_number': s,
+                    'reps': int(reps),
+                    'weight_kg': float(weight) if weight != 0.0 else None,
+                    'rpe': float(rpe) if rpe != 0.0 else None,
+                    'rest_seconds': int(rest) if rest != 0 else None,
+                    'duration_seconds': int(duration) if duration != 0 else None,
+                    'notes': note if note else None
+                })
+
+        submitted = st.form_submit_button("✅ Save Exercise Results", use_container_width=True, type="primary")
+
+    if submitted:
+        saved = insert_exercise_results(client_id, workout_id, exercise_id, performed_date, set_entries)
+        if saved > 0:
+            clear_recommendations(client_id)
+            st.session_state['er_saved_message'] = f"✅ Saved {saved} set result(s) for {exercise_name}"
+            # Full rerun so the progress panel picks up the new sets
+            st.rerun()
+        else:
+            st.error("No results were saved. Check for errors above.")
+
+def page_exercise_results():
+    st.title("🏋️ Record Exercise Results")
+    st.markdown("Record per-set exercise results (weight, reps, RPE, rest, notes)")
+
+    clients_df = get_clients()
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+
+    selected_client_name = st.selectbox("Select Client", clients_df['CLIENT_NAME'].tolist(), key="er_client_select")
+    selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+    client_id = selected_client['CLIENT_ID']
+
+    st.divider()
+
+    # Choose a workout for this client
+    workouts_df = get_client_workouts(client_id)
+    if workouts_df.empty:
+        st.info("No workouts found for this client. Generate a workout first.")
+        return
+
+    # format workout display
+    workouts_df['DISPLAY'] = workouts_df.apply(lambda r: f"{r['WORKOUT_DATE']} | Week {r['WORKOUT_WEEK']} Day {r['WORKOUT_DAY']} | {r['WORKOUT_FOCUS']}", axis=1)
+    workout_choice = st.selectbox("Select Workout", workouts_df['DISPLAY'].tolist(), key="er_workout_select")
+    workout_row = workouts_df[workouts_df['DISPLAY'] == workout_choice].iloc[0]
+    workout_id = workout_row['WORKOUT_ID']
+    workout_date = workout_row.get('WORKOUT_DATE')
+
+    # Exercises come back decoded from get_client_workouts
+    exercises = workout_row.get('EXERCISES', [])
+
+    if not exercises:
+        st.info("No exercises found in the selected workout.")
+        return
+
+    st.markdown(f"**Workout:** {workout_choice}")
+
+    # Select exercise
+    exercise_names = [f"{i+1}. {ex.get('name','Unnamed')}" for i, ex in enumerate(exercises)]
+    ex_choice = st.selectbox("Select Exercise", exercise_names, key="er_ex_select")
+    ex_index = exercise_names.index(ex_choice)
+    exercise = exercises[ex_index]
+    exercise_name = exercise.get('name')
+
+    st.markdown(f"**Exercise:** {exercise_name}")
+
+    # Library id (or shortlist code) saved with the plan; older plans are resolved by name,
+    # unknown exercises keep the name
+    exercise_id = resolve_exercise_id(exercise_name, exercise.get('exercise_id') or exercise.get('id')) or exercise_name
+    progress_panel(client_id, exercise_id)
+
+    # Next load / reps from the client's recent sets (one query for every exercise, cached until a save)
+    recommendations_df = get_recommendations(client_id)
+    matches = recommendations_df[recommendations_df['EXERCISE_ID'] == exercise_id]
+    target = matches.iloc[0] if not matches.empty else None
+    set_entry(client_id, workout_id, workout_date, exercise, exercise_id, target,
+              key=f"er_{workout_id}_{workout_date}_{ex_index}")
+
+
+page_exercise_results()
@@ -0,0 +1,110 @@
+"""
+Page: Home / Client Management
+"""
+
+import streamlit as st
+
+from data_access import CACHE_STATS_HOURS, get_clients, get_result_cache_stats, insert_client
+
+def page_home():
+    st.title("🏋️ AI Personal Trainer - Stage 1")
+    st.markdown("**Personalized Workout and Meal Plan Generation with Cortex Prompt Complete**")
+    
+    tab1, tab2 = st.tabs(["Create New Client", "View Clients"])
+    
+    with tab1:
+        st.header("Create New Client Profile")
+        
+        with st.form("client_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                client_name = st.text_input("Client Name", placeholder="John Doe")
+                age = st.number_input("Age", min_value=18, max_value=100, value=30)
+                gender = st.selectbox("Gender", ["Male", "Female", "Other"])
+                current_weight_kg = st.number_input("Current Weight (kg)", min_value=30.0, max_value=300.0, value=75.0, format="%.2f")
+                height_cm = st.number_input("Height (cm)", min_value=100, max_value=250, value=180)
+            
+            with col2:
+                fitness_level = st.selectbox("Fitness Level", ["Beginner", "Intermediate", "Advanced"])
+                fitness_goals = st.multiselect(
+                    "Fitness Goals",
+                    ["Weight Loss", "Muscle Gain", "Endurance", "Strength", "General Fitness", "Flexibility"],
+                    default=["Muscle Gain"]
+                )
+                available_equipment = st.multiselect(
+                    "Available Equipment",
+                    ["Dumbbells", "Barbell", "Gym Machine", "Cardio Equipment", "Bodyweight Only", "Resistance Bands"],
+                    default=["Dumbbells"]
+                )
+                days_per_week = st.number_input("Days Available per Week", min_value=1, max_value=7, value=4)
+                workout_duration_min = st.number_input("Workout Duration (minutes)", min_value=15, max_value=180, value=60)
+            
+            st.divider()
+            
+            col3, col4 = st.columns(2)
+            
+            with col3:
+                dietary_preferences = st.multiselect(
+                    "Dietary Preferences",
+                    ["Vegetarian", "Vegan", "Keto", "Paleo", "Mediterranean", "None"],
+                    default=["None"]
+                )
+                allergies = st.text_area("Allergies / Restrictions", placeholder="e.g., nuts, dairy, gluten")
+            
+            with col4:
+                target_calories = st.number_input("Caloric Target (kcal/day)", min_value=1200, max_value=5000, value=2000)
+                target_protein_g = st.number_input("Protein Target (g/day)", min_value=50, max_value=300, value=150)
+            
+            if st.form_submit_button("✅ Create Client", use_container_width=True):
+                if not client_name:
+                    st.error("Please enter a client name")
+                else:
+                    client_data = {
+                        'CLIENT_NAME': client_name,
+                        'AGE': age,
+                        'GENDER': gender,
+                        'CURRENT_WEIGHT_KG': current_weight_kg,
+                        'HEIGHT_CM': height_cm,
+                        'FITNESS_LEVEL': fitness_level,
+                        'FITNESS_GOALS': fitness_goals,
+                        'AVAILABLE_EQUIPMENT': available_equipment,
+                        'DAYS_PER_WEEK': days_per_week,
+                        'WORKOUT_DURATION_MIN': workout_duration_min,
+                        'DIETARY_PREFERENCES': dietary_preferences,
+                        'allergies': allergies,
+                        'target_calories': target_calories,
+                        'target_protein_g': target_protein_g
+                    }
+                    
+                    client_id = insert_client(client_data)
+                    if client_id:
+                        st.success(f"✅ Client created successfully! ID: {client_id}")
+                        st.balloons()
+    
+    with tab2:
+        st.header("All Clients")
+        clients_df = get_clients()
+        
+        if not clients_df.empty:
+            st.dataframe(
+                clients_df[['CLIENT_ID', 'CLIENT_NAME', 'AGE', 'FITNESS_LEVEL', 'CURRENT_WEIGHT_KG', 'CREATED_AT']],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No clients found. Create a new client to get started!")
+
+        cache_stats = get_result_cache_stats()
+        if cache_stats:
+            with st.expander(f"Query result cache (last {CACHE_STATS_HOURS} h)"):
+                c1, c2, c3 = st.columns(3)
+                c1.metric("App Reads", f"{cache_stats['reads']:,}")
+                c2.metric("Served from Cache", f"{cache_stats['cache_hits']:,}")
+                hit_rate = cache_stats['hit_rate']
+                c3.metric("Hit Rate", f"{hit_rate:.0%}" if hit_rate is not None else "-")
+                st.caption("Cached reads use no warehouse compute; a repeat view within 24 hours hits "
+                           "the cache when the underlying tables have not changed.")
+
+
+page_home()
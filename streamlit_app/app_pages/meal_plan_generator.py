@@ -0,0 +1,105 @@
+"""
+Page: Meal Plan Generator
+"""
+
+import streamlit as st
+from datetime import timedelta
+
+from data_access import get_client_meal_plans, get_client_snapshot, get_clients, next_plan_defaults
+from jobs import draft_review, enqueue_job, job_status
+from models import MealPlan
+
+def render_meal_plan(meal_plan: MealPlan, job, key: str = None):
+    """Weekly totals and per-day meals for a generated meal plan"""
+    # Display meal plan
+    st.markdown("### 7-Day Meal Plan")
+    
+    totals = meal_plan.weekly_totals
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Calories", f"{totals.calories} kcal")
+    col2.metric("Protein", f"{totals.protein}g")
+    col3.metric("Carbs", f"{totals.carbs}g")
+    col4.metric("Fat", f"{totals.fat}g")
+    
+    st.divider()
+    
+    for day_plan in meal_plan.days:
+        st.markdown(f"#### Day {day_plan.day}")
+        
+        for meal in day_plan.meals:
+            with st.expander(f"{meal.meal_type.title()} - {meal.calories} kcal, {meal.protein}g protein"):
+                if meal.servings is not None:
+                    st.caption(f"{meal.servings:g} serving(s) · {meal.carbs}g carbs · {meal.fat}g fat")
+                for food in meal.foods:
+                    st.write(f"• {food}")
+
+def page_meal_plan_generator():
+    st.title("🍽️ Meal Plan Generator")
+    st.markdown("Build 7-day meal plans from the recipe library that hit each client's calorie and protein targets")
+    
+    clients_df = get_clients()
+    
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        selected_client_name = st.selectbox(
+            "Select Client",
+            clients_df['CLIENT_NAME'].tolist(),
+            key="meal_plan_client_select"
+        )
+        selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+        client_id = selected_client['CLIENT_ID']
+    snapshot = get_client_snapshot(client_id) or {}
+    
+    with col2:
+        st.metric("Target Calories", f"{selected_client.get('TARGET_CALORIES') or 2000} kcal")
+    
+    st.divider()
+    
+    tab1, tab2 = st.tabs(["Generate New Meal Plan", "View History"])
+    
+    with tab1:
+        draft_review(client_id, 'meal_plan', render_meal_plan)
+        
+        # Default to the week after the client's latest plan
+        last_start = snapshot.get('last_meal_plan_start')
+        next_week, next_start = next_plan_defaults(snapshot.get('meal_plan_week'),
+                                                   last_start + timedelta(days=6) if last_start else None)
+        col1, col2 = st.columns(2)
+        with col1:
+            week = st.number_input("Week Number", min_value=1, max_value=52, value=next_week, key="meal_plan_week")
+        with col2:
+            meal_start_date = st.date_input("Start Date (Monday of this week)", value=next_start, key="meal_plan_start_date")
+        
+        regenerate = st.checkbox(
+            "Generate a new version even if this week was already generated",
+            key="regenerate_meal_plan"
+        )
+        
+        if st.button("📐 Build Meal Plan from Recipes", use_container_width=True, type="primary"):
+            job_id, created = enqueue_job(client_id, 'meal_plan', selected_client.to_dict(), week, meal_start_date,
+                                          reuse_result=not regenerate)
+            if job_id:
+                st.toast("Meal plan built" if created else "Already generated or in progress - showing that result")
+
+        job_status(client_id, 'meal_plan', render_meal_plan)
+    
+    with tab2:
+        st.markdown("### Meal Plan History")
+        meal_plans_df = get_client_meal_plans(client_id)
+        
+        if not meal_plans_df.empty:
+            st.dataframe(
+                meal_plans_df[['MEAL_PLAN_ID', 'GENERATION_DATE', 'PLAN_WEEK', 'TOTAL_CALORIES', 'PROTEIN_G', 'PLAN_STATUS']],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No meal plans generated yet. Create one using the generator above!")
+
+
+page_meal_plan_generator()
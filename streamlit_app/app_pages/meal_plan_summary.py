@@ -0,0 +1,172 @@
+"""
+Page: Meal Plan Summary
+"""
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+
+from data_access import get_client_meal_plans_by_date_range, get_clients
+
+# Columns the detail expanders read
+DETAIL_COLUMNS = ['PLAN_START_DATE', 'PLAN_WEEK', 'DURATION_DAYS', 'TOTAL_CALORIES', 'PROTEIN_G', 'CARBS_G', 'FAT_G',
+                  'MEAL_PLAN_JSON']
+
+def page_meal_plan_summary():
+    import plotly.express as px
+
+    st.title("🍽️ Meal Plan Summary")
+    st.markdown("View meal plans for a selected date range")
+    
+    clients_df = get_clients()
+    
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        selected_client_name = st.selectbox(
+            "Select Client",
+            clients_df['CLIENT_NAME'].tolist(),
+            key="meal_summary_client"
+        )
+        selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+        client_id = selected_client['CLIENT_ID']
+    
+    with col2:
+        st.metric("Target Calories", f"{selected_client.get('target_calories', 2000)} kcal")
+    
+    st.divider()
+    
+    # Date range selector
+    col1, col2, col3 = st.columns([1, 1, 1])
+    
+    with col1:
+        date_range_option = st.radio("Select Date Range", ["This Week", "Next Week", "This Month", "Custom Range"], key="meal_date_range")
+    
+    with col2:
+        if date_range_option == "This Week":
+            today = datetime.now().date()
+            # Get Monday of this week
+            start_date = today - timedelta(days=today.weekday())
+            end_date = start_date + timedelta(days=6)
+            st.write(f"**Start:** {start_date}")
+        if date_range_option == "Next Week":
+            today = datetime.now().date()
+            # Get Monday of this week
+            start_date = today - timedelta(days=today.weekday()) + timedelta(days=7)
+            end_date = start_date + timedelta(days=13)
+            st.write(f"**Start:** {start_date}")
+        elif date_range_option == "This Month":
+            today = datetime.now().date()
+            start_date = today.replace(day=1)
+            if today.month == 12:
+                end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
+            else:
+                end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
+            st.write(f"**Start:** {start_date}")
+        else:
+            col_start, col_end = st.columns(2)
+            with col_start:
+                start_date = st.date_input("Start Date", value=datetime.now().date() - timedelta(days=7), key="meal_range_start")
+            with col_end:
+                end_date = st.date_input("End Date", value=datetime.now().date(), key="meal_range_end")
+            st.write(f"**Range:** {start_date} to {end_date}")
+    
+    with col3:
+        if date_range_option != "Custom Range":
+            if date_range_option == "This Month":
+                st.write(f"**End:** {end_date}")
+            else:
+                st.write(f"**End:** {end_date}")
+    
+    st.divider()
+    
+    # Fetch meal plans for the date range
+    meal_plans_df = get_client_meal_plans_by_date_range(client_id, start_date, end_date)
+    
+    if meal_plans_df.empty:
+        st.info(f"No meal plans found for {selected_client_name} in the selected date range.")
+    else:
+        # Summary statistics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        total_plans = len(meal_plans_df)
+        avg_calories = meal_plans_df['TOTAL_CALORIES'].mean()
+        avg_protein = meal_plans_df['PROTEIN_G'].mean()
+        total_days_covered = meal_plans_df['DURATION_DAYS'].sum()
+        
+        col1.metric("Meal Plans", total_plans)
+        col2.metric("Avg Calories", f"{int(avg_calories)} kcal")
+        col3.metric("Avg Protein", f"{int(avg_protein)}g")
+        col4.metric("Total Days Covered", int(total_days_covered))
+        
+        st.divider()
+        
+        # Display macro distribution
+        st.markdown("### Macronutrient Distribution")
+        macro_data = {
+            'Nutrient': ['Protein', 'Carbs', 'Fat'],
+            'Grams': [
+                meal_plans_df['PROTEIN_G'].mean(),
+                meal_plans_df['CARBS_G'].mean(),
+                meal_plans_df['FAT_G'].mean()
+            ]
+        }
+        macro_df = pd.DataFrame(macro_data)
+        fig = px.pie(macro_df, values='Grams', names='Nutrient', title="Average Macro Split")
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.divider()
+        
+        # Detailed meal plans
+        st.markdown("### Meal Plans by Date")
+        
+        # Plain dicts, converted column-wise in one go rather than a Series per row
+        for meal_plan in meal_plans_df[DETAIL_COLUMNS].to_dict('records'):
+            plan_start = meal_plan.get('PLAN_START_DATE', 'N/A')
+            plan_end = plan_start + timedelta(days=meal_plan['DURATION_DAYS'] - 1) if plan_start != 'N/A' else 'N/A'
+            week_num = meal_plan['PLAN_WEEK']
+            
+            with st.expander(f"📅 Week {week_num} ({plan_start} - {plan_end}) | {meal_plan['TOTAL_CALORIES']} kcal", expanded=False):
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Calories", meal_plan['TOTAL_CALORIES'])
+                col2.metric("Protein", f"{meal_plan['PROTEIN_G']}g")
+                col3.metric("Carbs", f"{meal_plan['CARBS_G']}g")
+                col4.metric("Fat", f"{meal_plan['FAT_G']}g")
+                
+                st.divider()
+                
+                # Decoded meal plan JSON; text that did not parse is skipped
+                meal_plan_json = meal_plan.get('MEAL_PLAN_JSON')
+                if isinstance(meal_plan_json, dict):
+                    days = meal_plan_json.get('days', [])
+                    for day in days:
+                        day_num = day.get('day', 0)
+                        st.markdown(f"**Day {day_num}**")
+                        
+                        meals = day.get('meals', [])
+                        for meal in meals:
+                            meal_type = meal.get('meal_type', 'meal').title()
+                            meal_cal = meal.get('calories', 0)
+                            meal_protein = meal.get('protein', 0)
+                            
+                            with st.expander(f"{meal_type} - {meal_cal} kcal, {meal_protein}g protein"):
+                                foods = meal.get('foods', [])
+                                for food in foods:
+                                    st.write(f"• {food}")
+        
+        st.divider()
+        
+        # Raw data table
+        st.markdown("### Raw Data")
+        st.dataframe(
+            meal_plans_df[['MEAL_PLAN_ID', 'GENERATION_DATE', 'PLAN_START_DATE', 'PLAN_WEEK', 'TOTAL_CALORIES', 'PROTEIN_G', 'CARBS_G', 'FAT_G']],
+            use_container_width=True,
+            hide_index=True
+        )
+
+
+page_meal_plan_summary()
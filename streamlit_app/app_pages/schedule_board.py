@@ -0,0 +1,79 @@
+"""
+Page: Schedule Board
+"""
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+
+from data_access import clear_week_schedule, get_week_schedule
+
+# Adherence rollup columns (sql/13, refreshed hourly) shown after the days
+ADHERENCE_COLUMNS = {
+    'COMPLETED_SESSIONS': "Done",
+    'MISSED_SESSIONS': "Missed",
+    'COMPLETION_PCT': "Sets Done %",
+    'VOLUME_DELTA_PCT': "Rep Volume Δ %",
+}
+
+def _cell_labels(sessions: pd.DataFrame):
+    """Grid text per workout: focus and minutes, 'Rest' for rest days, drafts marked 📝"""
+    minutes = sessions['DURATION_MIN'].fillna(0).astype(int)
+    labels = sessions['WORKOUT_FOCUS'].fillna('') + ' · ' + minutes.astype(str) + ' min'
+    labels = labels.where(minutes > 0, 'Rest')
+    return labels.where(sessions['PLAN_STATUS'] != 'DRAFT', '📝 ' + labels)
+
+def page_schedule_board():
+    st.title("🗓️ Schedule Board")
+    st.markdown("Every client's workouts for one week")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        picked = st.date_input("Week of", value=datetime.now().date(), key="schedule_week")
+        week_start = picked - timedelta(days=picked.weekday())
+    with col2:
+        name_filter = st.text_input("Filter clients", placeholder="Name contains...", key="schedule_filter")
+    with col3:
+        only_scheduled = st.checkbox("Only scheduled clients", key="schedule_only_scheduled")
+        if st.button("🔄 Refresh", use_container_width=True):
+            clear_week_schedule()
+
+    schedule_df = get_week_schedule(week_start)
+    if schedule_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+
+    days = [week_start + timedelta(days=i) for i in range(7)]
+    clients = schedule_df.drop_duplicates('CLIENT_ID')[['CLIENT_ID', 'CLIENT_NAME', *ADHERENCE_COLUMNS]]
+    sessions = schedule_df.dropna(subset=['WORKOUT_DATE']).copy()
+    sessions['DAY'] = pd.to_datetime(sessions['WORKOUT_DATE']).dt.date
+    sessions['CELL'] = _cell_labels(sessions)
+
+    # One row per client, one column per day (the query returns at most one workout per client and day)
+    grid = sessions.pivot(index='CLIENT_ID', columns='DAY', values='CELL')
+    grid = grid.reindex(index=clients['CLIENT_ID'], columns=days).fillna('')
+    grid.index = clients['CLIENT_NAME'].values
+    grid.columns = [day.strftime('%a %d %b') for day in days]
+    for column, label in ADHERENCE_COLUMNS.items():
+        grid[label] = pd.to_numeric(clients[column], errors='coerce').values
+
+    training = sessions['CELL'] != 'Rest'
+    scheduled = clients['CLIENT_ID'].isin(sessions['CLIENT_ID']).values
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.metric("Clients", f"{len(clients):,}")
+    c2.metric("Training Sessions", f"{int(training.sum()):,}")
+    c3.metric("Drafts Awaiting Review", f"{int((sessions['PLAN_STATUS'] == 'DRAFT').sum()):,}")
+    c4.metric("Nothing Scheduled", f"{int((~scheduled).sum()):,}")
+    c5.metric("Missed Sessions", f"{int(grid['Missed'].sum()):,}")
+
+    if only_scheduled:
+        grid = grid[scheduled]
+    if name_filter:
+        grid = grid[grid.index.str.contains(name_filter, case=False, regex=False)]
+
+    st.caption(f"Week of {week_start.strftime('%d %b %Y')} · 📝 draft awaiting review · "
+               "adherence covers days up to today and is refreshed hourly")
+    st.dataframe(grid, use_container_width=True, height=min(35 * (len(grid) + 1) + 3, 800))
+
+
+page_schedule_board()
@@ -0,0 +1,114 @@
+"""
+Page: Weight Tracking
+"""
+
+import streamlit as st
+from datetime import datetime
+
+from data_access import (
+    get_client_snapshot,
+    get_client_weight_history,
+    get_clients,
+    insert_body_measurements,
+    insert_weigh_in,
+)
+
+def page_weight_tracking():
+    import plotly.express as px
+
+    st.title("⚖️ Weight & Measurements Tracking")
+    st.markdown("Track client weight and body measurements over time")
+    
+    clients_df = get_clients()
+    
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+    
+    selected_client_name = st.selectbox(
+        "Select Client",
+        clients_df['CLIENT_NAME'].tolist(),
+        key="weight_tracking_client"
+    )
+    selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+    client_id = selected_client['CLIENT_ID']
+    snapshot = get_client_snapshot(client_id) or {}
+    latest_weight = snapshot.get('latest_weight_kg')
+    if latest_weight is not None:
+        st.caption(f"Latest weigh-in: {float(latest_weight):.1f} kg on {snapshot['latest_weigh_in_date']}")
+    
+    st.divider()
+    
+    tab1, tab2, tab3 = st.tabs(["Record Weigh-in", "Weight History", "Body Measurements"])
+    
+    with tab1:
+        st.markdown("### Record Weight Entry")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            weigh_in_date = st.date_input("Date", value=datetime.now())
+            weight_kg = st.number_input("Weight (kg)", min_value=30.0, max_value=300.0,
+                                        value=min(max(float(latest_weight or 75.0), 30.0), 300.0), format="%.2f")
+        
+        with col2:
+            body_fat_pct = st.number_input("Body Fat %", min_value=5.0, max_value=50.0, value=20.0, format="%.1f", help="Optional")
+            notes = st.text_area("Notes (optional)", placeholder="e.g., After workout, morning weigh-in, etc.")
+        
+        if st.button("✅ Record Weigh-in", use_container_width=True, type="primary"):
+            weigh_in_id = insert_weigh_in(client_id, weigh_in_date, weight_kg, body_fat_pct, notes)
+            if weigh_in_id:
+                st.success(f"✅ Weigh-in recorded! ID: {weigh_in_id}")
+    
+    with tab2:
+        st.markdown("### Weight History")
+        weight_history = get_client_weight_history(client_id)
+        
+        if not weight_history.empty:
+            # Chart
+            fig = px.line(
+                weight_history,
+                x='weigh_in_date',
+                y='weight_kg',
+                title="Weight Trend",
+                labels={'weigh_in_date': 'Date', 'weight_kg': 'Weight (kg)'},
+                markers=True
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Data table
+            st.dataframe(weight_history, use_container_width=True, hide_index=True)
+            
+            # Statistics
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Latest Weight", f"{weight_history['weight_kg'].iloc[-1]:.2f} kg")
+            col2.metric("Starting Weight", f"{weight_history['weight_kg'].iloc[0]:.2f} kg")
+            col3.metric("Total Change", f"{weight_history['weight_kg'].iloc[-1] - weight_history['weight_kg'].iloc[0]:+.2f} kg")
+        else:
+            st.info("No weight history recorded yet. Start tracking by recording a weigh-in!")
+    
+    with tab3:
+        st.markdown("### Record Body Measurements")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            measurement_date = st.date_input("Date", value=datetime.now(), key="measurement_date")
+            neck_cm = st.number_input("Neck (cm)", min_value=20.0, max_value=50.0, value=38.0, format="%.1f")
+            chest_cm = st.number_input("Chest (cm)", min_value=70.0, max_value=150.0, value=95.0, format="%.1f")
+        
+        with col2:
+            waist_cm = st.number_input("Waist (cm)", min_value=50.0, max_value=150.0, value=75.0, format="%.1f")
+            hip_cm = st.number_input("Hip (cm)", min_value=70.0, max_value=150.0, value=92.0, format="%.1f")
+            thigh_cm = st.number_input("Thigh (cm)", min_value=35.0, max_value=80.0, value=58.0, format="%.1f")
+            calf_cm = st.number_input("Calf (cm)", min_value=25.0, max_value=50.0, value=38.0, format="%.1f")
+        
+        if st.button("✅ Record Measurements", use_container_width=True, type="primary", key="save_measurements"):
+            measurement_id = insert_body_measurements(
+                client_id, measurement_date, neck_cm, chest_cm, waist_cm, hip_cm, thigh_cm, calf_cm
+            )
+            if measurement_id:
+                st.success(f"✅ Measurements recorded! ID: {measurement_id}")
+
+
+page_weight_tracking()
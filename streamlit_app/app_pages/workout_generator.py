@@ -0,0 +1,192 @@
+"""
+Page: Workout Generator
+"""
+
+import streamlit as st
+import pandas as pd
+
+from data_access import get_client_snapshot, get_client_workouts, get_clients, next_plan_defaults
+from models import DAY_NAMES, WeekPlan
+from generation import CORTEX_MODEL
+from jobs import draft_review, enqueue_job, job_status, regenerate_days
+from periodization import RULES_MODEL
+
+def render_week(week_plan: WeekPlan, job, key: str = None):
+    """Summary table and detailed daily workouts for a generated week, with day-level regeneration"""
+    # Display full week overview
+    st.markdown(f"### 📅 Week {job['PLAN_WEEK']} Training Program")
+    
+    incomplete_days = week_plan.incomplete_days()
+    if incomplete_days:
+        st.warning(f"⚠️ Missing or incomplete: {', '.join(DAY_NAMES[day - 1] for day in incomplete_days)}. "
+                   "Regenerate just those days below.")
+    
+    # Create a summary table
+    week_summary = []
+    for day_plan in week_plan.days:
+        if day_plan.is_rest_day:
+            week_summary.append({
+                'Day': day_plan.day_name,
+                'Type': '🔄 Rest',
+                'Focus': 'Recovery',
+                'Exercises': '-'
+            })
+        else:
+            week_summary.append({
+                'Day': day_plan.day_name,
+                'Type': '💪 Training',
+                'Focus': day_plan.focus,
+                'Exercises': len(day_plan.exercises)
+            })
+    
+    summary_df = pd.DataFrame(week_summary)
+    st.dataframe(summary_df, use_container_width=True, hide_index=True)
+    
+    st.divider()
+    
+    # Display each day
+    st.markdown("### Detailed Daily Workouts")
+    
+    for day_plan in week_plan.days:
+        if day_plan.is_rest_day:
+            with st.expander(f"📅 {day_plan.day_name} - 🔄 Rest Day", expanded=False):
+                st.info(f"Recovery Tips: {day_plan.recovery_tips}")
+        else:
+            with st.expander(f"📅 {day_plan.day_name} - 💪 {day_plan.focus}", expanded=day_plan.day==1):
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Warm-up", "5 min")
+                col2.metric("Main Workout", "~45 min")
+                col3.metric("Cool-down", "10 min")
+                
+                st.markdown("**Warm-up:**")
+                st.write(day_plan.warm_up or 'N/A')
+                
+                st.markdown("**Main Exercises:**")
+                for i, exercise in enumerate(day_plan.exercises, 1):
+                    with st.expander(f"Exercise {i}: {exercise.name}"):
+                        col1, col2, col3, col4 = st.columns(4)
+                        col1.metric("Sets", exercise.sets)
+                        col2.metric("Reps", exercise.reps)
+                        col3.metric("Rest (sec)", exercise.rest_sec)
+                        col4.metric("Notes", "See below")
+                        st.write(exercise.notes or 'Form cues TBD')
+                
+                st.markdown("**Cool-down:**")
+                st.write(day_plan.cool_down or 'N/A')
+    
+    if key:
+        regenerate_days_form(job, key, incomplete_days)
+
+def regenerate_days_form(job, key: str, incomplete_days: list):
+    """Pick days of a saved week to rewrite; only those days' workouts are regenerated and updated"""
+    with st.form(f"{key}_regenerate_days", border=False):
+        days = st.multiselect(
+            "Regenerate individual days",
+            options=list(range(1, 8)),
+            default=incomplete_days,
+            format_func=lambda day: DAY_NAMES[day - 1],
+            key=f"{key}_days",
+            help="Keeps the rest of the week and rewrites only the selected days"
+        )
+        if st.form_submit_button("🔁 Regenerate Selected Days", use_container_width=True):
+            if not days:
+                st.warning("Select at least one day to regenerate")
+            else:
+                with st.spinner(f"Regenerating {len(days)} day(s) with Cortex..."):
+                    replaced = regenerate_days(job['JOB_ID'], days)
+                if replaced:
+                    st.toast(f"Regenerated {', '.join(DAY_NAMES[day - 1] for day in replaced)}")
+                    st.rerun()
+
+def page_workout_generator():
+    st.title("💪 Workout Generator - Full Week Planning")
+    st.markdown("Generate a complete 7-day training program instantly from periodization rules, or with AI (Cortex Prompt Complete)")
+    
+    clients_df = get_clients()
+    
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+    
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    
+    with col1:
+        selected_client_name = st.selectbox(
+            "Select Client",
+            clients_df['CLIENT_NAME'].tolist()
+        )
+        selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+        client_id = selected_client['CLIENT_ID']
+    snapshot = get_client_snapshot(client_id) or {}
+    
+    with col2:
+        st.metric("Fitness Level", selected_client['FITNESS_LEVEL'])
+    
+    with col3:
+        st.metric("Training Days/Week", selected_client['DAYS_PER_WEEK'])
+    
+    with col4:
+        st.metric("Program Week", snapshot.get('current_week') or "-",
+                  help=f"Last scheduled workout: {snapshot.get('last_workout_date') or 'none'}")
+    
+    st.divider()
+    
+    tab1, tab2 = st.tabs(["Generate Full Week", "View History"])
+    
+    with tab1:
+        draft_review(client_id, 'workout_week', render_week)
+        
+        st.markdown("### Generate a Full 7-Day Training Program")
+        mode = st.radio(
+            "Generation mode",
+            ["⚡ Instant", "🤖 AI"],
+            horizontal=True,
+            key="workout_generation_mode",
+            help="Instant: split template, exercise rotation and 4-week progressive overload from the client's profile. "
+                 "AI: Cortex writes a new program from the last 4 weeks of training (takes 20-40 s)."
+        )
+        instant = mode == "⚡ Instant"
+        if instant:
+            st.info("⚡ Built from the client's split, equipment and level; exercises rotate every 4 weeks and load builds week to week.")
+        else:
+            st.info("💡 The AI will review your last 4 weeks of training and create a NEW program with varied exercises and focuses to prevent plateaus.")
+        
+        # Default to the week after the client's latest one
+        next_week, next_start = next_plan_defaults(snapshot.get('current_week'), snapshot.get('last_workout_date'))
+        col1, col2 = st.columns(2)
+        with col1:
+            week = st.number_input("Week Number", min_value=1, max_value=52, value=next_week, help="Which week of the program is this?")
+        with col2:
+            start_date = st.date_input("Start Date (Monday of this week)", value=next_start, help="First day of the workout week")
+        
+        regenerate = st.checkbox(
+            "Generate a new version even if this week was already generated",
+            key="regenerate_week"
+        )
+        
+        if st.button("⚡ Generate Full Week" if instant else "🤖 Generate Full Week with AI", use_container_width=True, type="primary"):
+            # AI weeks run in the background: the trainer can keep working or leave the page
+            job_id, created = enqueue_job(client_id, 'workout_week', selected_client.to_dict(), week, start_date,
+                                          reuse_result=not regenerate, model=RULES_MODEL if instant else CORTEX_MODEL)
+            if job_id and created:
+                st.toast("Week generated" if instant else "Week queued for generation")
+            elif job_id:
+                st.toast("Already generated or in progress - showing that result")
+
+        job_status(client_id, 'workout_week', render_week)
+    
+    with tab2:
+        st.markdown("### Workout History")
+        workouts_df = get_client_workouts(client_id)
+        
+        if not workouts_df.empty:
+            st.dataframe(
+                workouts_df[['WORKOUT_ID', 'WORKOUT_DATE', 'GENERATION_DATE', 'WORKOUT_WEEK', 'WORKOUT_DAY', 'WORKOUT_FOCUS', 'PLAN_STATUS']],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No workouts generated yet. Create a full week program using the generator above!")
+
+
+page_workout_generator()
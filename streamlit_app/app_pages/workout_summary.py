@@ -0,0 +1,160 @@
+"""
+Page: Workout Summary
+"""
+
+import streamlit as st
+from datetime import datetime, timedelta
+
+from data_access import get_client_workouts_by_date_range, get_clients
+
+# Columns the detail expanders read
+DETAIL_COLUMNS = ['WORKOUT_DATE', 'WORKOUT_FOCUS', 'DURATION_MIN', 'WARM_UP', 'COOL_DOWN', 'EXERCISES']
+
+def page_workout_summary():
+    import plotly.express as px
+
+    st.title("📊 Workout Summary")
+    st.markdown("View workouts for a selected date range")
+    
+    clients_df = get_clients()
+    
+    if clients_df.empty:
+        st.warning("No clients found. Please create a client first in the Home page.")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        selected_client_name = st.selectbox(
+            "Select Client",
+            clients_df['CLIENT_NAME'].tolist(),
+            key="workout_summary_client"
+        )
+        selected_client = clients_df[clients_df['CLIENT_NAME'] == selected_client_name].iloc[0]
+        client_id = selected_client['CLIENT_ID']
+    
+    with col2:
+        st.metric("Fitness Level", selected_client['FITNESS_LEVEL'])
+    
+    st.divider()
+    
+    # Date range selector
+    col1, col2, col3 = st.columns([1, 1, 1])
+    
+    with col1:
+        date_range_option = st.radio("Select Date Range", ["This Week", "Next Week", "This Month", "Custom Range"])
+    
+    with col2:
+        if date_range_option == "This Week":
+            today = datetime.now().date()
+            # Get Monday of this week
+            start_date = today - timedelta(days=today.weekday())
+            end_date = start_date + timedelta(days=6)
+            st.write(f"**Start:** {start_date}")
+        if date_range_option == "Next Week":
+            today = datetime.now().date()
+            # Get Monday of this week
+            start_date = today - timedelta(days=today.weekday()) + timedelta(days=7)
+            end_date = start_date + timedelta(days=13)
+            st.write(f"**Start:** {start_date}")
+        elif date_range_option == "This Month":
+            today = datetime.now().date()
+            start_date = today.replace(day=1)
+            if today.month == 12:
+                end_date = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
+            else:
+                end_date = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
+            st.write(f"**Start:** {start_date}")
+        else:
+            col_start, col_end = st.columns(2)
+            with col_start:
+                start_date = st.date_input("Start Date", value=datetime.now().date() - timedelta(days=7), key="workout_range_start")
+            with col_end:
+                end_date = st.date_input("End Date", value=datetime.now().date(), key="workout_range_end")
+            st.write(f"**Range:** {start_date} to {end_date}")
+    
+    with col3:
+        if date_range_option != "Custom Range":
+            if date_range_option == "This Month":
+                st.write(f"**End:** {end_date}")
+            else:
+                st.write(f"**End:** {end_date}")
+    
+    st.divider()
+    
+    # Fetch workouts for the date range
+    workouts_df = get_client_workouts_by_date_range(client_id, start_date, end_date)
+    
+    if workouts_df.empty:
+        st.info(f"No workouts found for {selected_client_name} in the selected date range.")
+    else:
+        # Summary statistics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        total_workouts = len(workouts_df[workouts_df['WORKOUT_FOCUS'] != 'Rest Day'])
+        rest_days = len(workouts_df[workouts_df['WORKOUT_FOCUS'] == 'Rest Day'])
+        total_duration = workouts_df[workouts_df['WORKOUT_FOCUS'] != 'Rest Day']['DURATION_MIN'].sum()
+        avg_duration = total_duration / total_workouts if total_workouts > 0 else 0
+        
+        col1.metric("Training Days", total_workouts)
+        col2.metric("Rest Days", rest_days)
+        col3.metric("Total Duration", f"{int(total_duration)} min")
+        col4.metric("Avg Duration", f"{int(avg_duration)} min")
+        
+        st.divider()
+        
+        # Display by focus
+        st.markdown("### Workouts by Focus Area")
+        focus_counts = workouts_df[workouts_df['WORKOUT_FOCUS'] != 'Rest Day']['WORKOUT_FOCUS'].value_counts()
+        if not focus_counts.empty:
+            fig = px.bar(focus_counts, title="Workout Focus Distribution", labels={'index': 'Focus Area', 'value': 'Count'})
+            st.plotly_chart(fig, use_container_width=True)
+        
+        st.divider()
+        
+        # Detailed workout list
+        st.markdown("### Detailed Workouts")
+        
+        # Plain dicts, converted column-wise in one go rather than a Series per row
+        for workout in workouts_df[DETAIL_COLUMNS].to_dict('records'):
+            workout_date = workout.get('WORKOUT_DATE', 'N/A')
+            focus = workout['WORKOUT_FOCUS']
+            
+            if focus == 'Rest Day':
+                with st.expander(f"📅 {workout_date} - 🔄 Rest Day"):
+                    st.info(workout.get('WARM_UP', 'Rest day - focus on recovery'))
+            else:
+                with st.expander(f"📅 {workout_date} - 💪 {focus} ({workout['DURATION_MIN']} min)"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown("**Warm-up:**")
+                        st.write(workout.get('WARM_UP', 'N/A'))
+                    with col2:
+                        st.markdown("**Cool-down:**")
+                        st.write(workout.get('COOL_DOWN', 'N/A'))
+                    
+                    st.markdown("**Exercises:**")
+                    exercises = workout.get('EXERCISES')
+                    # Lists once decoded; text that did not parse as JSON is skipped
+                    if isinstance(exercises, list) and exercises:
+                        for i, exercise in enumerate(exercises, 1):
+                            ex_col1, ex_col2, ex_col3 = st.columns([2, 1, 2])
+                            with ex_col1:
+                                st.write(f"**{exercise.get('name', 'N/A')}**")
+                            with ex_col2:
+                                st.write(f"{exercise.get('sets', 0)}x{exercise.get('reps', '0')}")
+                            with ex_col3:
+                                st.write(f"Rest: {exercise.get('rest_sec', 0)}s")
+        
+        st.divider()
+        
+        # Raw data table
+        st.markdown("### Raw Data")
+        st.dataframe(
+            workouts_df[['WORKOUT_ID', 'WORKOUT_DATE', 'GENERATION_DATE', 'WORKOUT_WEEK', 'WORKOUT_DAY', 'WORKOUT_FOCUS', 'DURATION_MIN']],
+            use_container_width=True,
+            hide_index=True
+        )
+
+
+page_workout_summary()
@@ -0,0 +1,847 @@
+"""
+Shared data access for the AI Personal Trainer app.
+
+All reads and writes against TRAINING_DB go through this module so pages only
+import what they query. The Snowpark session is created lazily on first use.
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import uuid
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is in environment.yml; plain json keeps local runs working without it
+    _json_loads = json.loads
+
+from models import DayPlan, MealPlan, WeekPlan
+
+# ============================================================================
+# Session and Utilities
+# ============================================================================
+
+@st.cache_resource
+def get_snowpark_session():
+    """Initialize and cache Snowpark session on first use"""
+    from snowflake.snowpark import Session
+    return Session.builder.getOrCreate()
+
+def _bind_value(value):
+    """A value the connector can bind: numpy scalars as Python ones, NaN / NaT as NULL"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return None
+    return value
+
+_WHITESPACE = re.compile(r'\s+')
+
+@lru_cache(maxsize=512)
+def canonical_sql(query: str):
+    """Statement text with each whitespace run outside string literals collapsed to one space
+
+    Snowflake's result cache only matches byte-identical text, so the same logical query
+    must not differ by indentation or line breaks between call sites.
+    """
+    parts = query.split("'")
+    parts[::2] = [_WHITESPACE.sub(' ', part) for part in parts[::2]]
+    return "'".join(parts).strip()
+
+def bind_sql(query: str, params=()):
+    """Snowpark DataFrame for a statement whose values are `?` bind parameters
+
+    Values are never formatted into the text, so a statement reads the same on every
+    call - Snowflake compiles it once and reuses the plan - and no value (a prompt, a
+    name with an apostrophe) can break it. Identifiers and LIMITs stay in the text,
+    which is sent in canonical form.
+    """
+    session = get_snowpark_session()
+    if not params:
+        return session.sql(canonical_sql(query))
+    return session.sql(canonical_sql(query), params=[_bind_value(value) for value in params])
+
+def lookback_start(weeks: int, align_week: bool = False):
+    """First date of a `weeks`-week lookback, resolved here instead of with CURRENT_DATE()
+
+    The date only moves at midnight (on Mondays with `align_week`), so repeated reads
+    send the same text and values and can be answered from the result cache.
+    """
+    start = date.today() - timedelta(weeks=int(weeks))
+    if align_week:
+        start -= timedelta(days=start.weekday())
+    return start
+
+def generate_uuid():
+    """Generate a UUID for database records"""
+    return str(uuid.uuid4())
+
+def variant_list(value):
+    """A VARIANT array as a list: JSON text from Snowflake, a list locally, or comma-separated text"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return [part.strip() for part in value.split(',') if part.strip()]
+    return [value] if isinstance(value, str) else list(value)
+
+def log_event(event_type: str, client_id: str = None, message: str = None, context: dict = None):
+    """Log events to the app_logs table"""
+    try:
+        log_id = generate_uuid()
+        context_json = json.dumps(context) if context else None
+        
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.app_logs 
+        (log_id, event_type, severity, client_id, message, context)
+        SELECT ?, ?, 'INFO', ?, ?, TRY_PARSE_JSON(?)
+        """, [log_id, event_type, client_id, message, context_json]).collect()
+    except Exception as e:
+        st.error(f"Logging error: {str(e)}")
+
+# ============================================================================
+# Batched Fetching
+# ============================================================================
+# Large results are pulled as the Arrow record batches the connector downloads,
+# each converted to pandas only when the loop reaches it, so a caller that
+# consumes batch by batch holds one batch in memory instead of the whole result.
+
+def fetch_batches(query: str, params=()):
+    """Yield a query's result as pandas DataFrames, one Arrow batch at a time"""
+    yield from bind_sql(query, params).to_pandas_batches()
+
+# ============================================================================
+# VARIANT Decoding
+# ============================================================================
+# Snowflake returns VARIANT columns as JSON text. Each value is parsed once and the
+# decoded object kept for the process under (table, primary key, update marker,
+# column), so reruns that fetch the same rows do no JSON work. Decoded objects are
+# shared between sessions: read them, never mutate them.
+
+# Decoded values kept; the least recently used are dropped beyond this many
+DECODED_VARIANTS_KEPT = 20_000
+
+@st.cache_resource
+def _decoded_variants():
+    """Process-wide LRU of decoded VARIANT values, and the lock guarding it"""
+    return OrderedDict(), threading.Lock()
+
+def decode_variant(value, key: tuple = None):
+    """A VARIANT value as Python objects, parsed at most once per `key` (the JSON text itself
+    when there is no key). Values that are not JSON text - lists from the local backend,
+    NULLs - come back unchanged, and so does text that does not parse."""
+    if not isinstance(value, str):
+        return value
+    cache, lock = _decoded_variants()
+    key = key or (value,)
+    with lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    try:
+        decoded = _json_loads(value)
+    except ValueError:
+        decoded = value
+    with lock:
+        cache[key] = decoded
+        while len(cache) > DECODED_VARIANTS_KEPT:
+            cache.popitem(last=False)
+    return decoded
+
+def decode_variant_columns(df: pd.DataFrame, table: str, pk_column: str, marker_column: str, columns):
+    """Decode the VARIANT `columns` of a fetched frame in place, keyed by each row's primary key
+    and update marker (a timestamp the table bumps whenever the row is rewritten)"""
+    for column in columns:
+        df[column] = pd.Series([
+            decode_variant(value, (table, pk, marker, column))
+            for value, pk, marker in zip(df[column], df[pk_column], df[marker_column])
+        ], index=df.index, dtype=object)
+    return df
+
+# ============================================================================
+# Clients
+# ============================================================================
+
+def get_clients():
+    """Fetch all clients from database"""
+    try:
+        df = bind_sql("SELECT * FROM TRAINING_DB.PUBLIC.clients ORDER BY created_at DESC").to_pandas()
+        return decode_variant_columns(df, 'clients', 'CLIENT_ID', 'UPDATED_AT',
+                                      ['FITNESS_GOALS', 'AVAILABLE_EQUIPMENT', 'DIETARY_PREFERENCES'])
+    except Exception as e:
+        st.error(f"Error fetching clients: {str(e)}")
+        return pd.DataFrame()
+
+def insert_client(client_data: dict):
+    """Insert a new client into the database"""
+    try:
+        client_id = generate_uuid()
+        
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.clients
+        (client_id, client_name, age, gender, current_weight_kg, height_cm, 
+         fitness_level, fitness_goals, available_equipment, days_per_week, 
+         workout_duration_min, dietary_preferences, allergies, target_calories, target_protein_g)
+        SELECT ?, ?, ?, ?, ?, ?, ?, TRY_PARSE_JSON(?), TRY_PARSE_JSON(?), ?, ?, PARSE_JSON(?), ?, ?, ?
+        """, [
+            client_id,
+            client_data['client_name'],
+            client_data['AGE'],
+            client_data['gender'],
+            client_data['CURRENT_WEIGHT_KG'],
+            client_data['HEIGHT_CM'],
+            client_data['FITNESS_LEVEL'],
+            json.dumps(client_data['FITNESS_GOALS']),
+            json.dumps(client_data['AVAILABLE_EQUIPMENT']),
+            client_data['DAYS_PER_WEEK'],
+            client_data['WORKOUT_DURATION_MIN'],
+            json.dumps(client_data['DIETARY_PREFERENCES']),
+            client_data['allergies'] or None,
+            client_data['target_calories'] or None,
+            client_data['target_protein_g'] or None,
+        ]).collect()
+        st.stop()
+        log_event("client_created", client_id=client_id, message=f"Client {client_data['client_name']} created")
+        return client_id
+    except Exception as e:
+        st.error(f"Error creating client: {str(e)}")
+        return None
+
+# ============================================================================
+# Client Snapshot
+# ============================================================================
+# One client_snapshot row per client (sql/14) holds the recent state pages and prompt
+# builders need, read with a single primary-key lookup. The write paths below update
+# it column by column; a client without a row (new, or invalidated by a bulk import,
+# a discarded draft or the warehouse job sweep) gets one built from the base tables on
+# the next read.
+
+# Newest week/day workouts kept for the previous-workouts prompt context (4 weeks)
+SNAPSHOT_RECENT_WORKOUTS = 28
+
+# recent_workouts computed from generated_workouts (one bind: client_id): the newest version
+# of each week/day, newest first. Writers recompute it in the same statement that stores it,
+# so concurrent saves (a job worker and a trainer) cannot drop each other's days.
+RECENT_WORKOUTS_SQL = f"""
+(SELECT ARRAY_AGG(OBJECT_CONSTRUCT('week', workout_week::INT, 'day', workout_day::INT,
+                                   'focus', workout_focus, 'duration_min', duration_min::INT))
+        WITHIN GROUP (ORDER BY generation_date DESC, workout_week DESC, workout_day)
+ FROM (
+    SELECT workout_week, workout_day, workout_focus, duration_min, generation_date
+    FROM TRAINING_DB.PUBLIC.generated_workouts
+    WHERE client_id = ?
+    QUALIFY ROW_NUMBER() OVER (PARTITION BY workout_week, workout_day ORDER BY generation_date DESC) = 1
+    ORDER BY generation_date DESC, workout_week DESC, workout_day
+    LIMIT {SNAPSHOT_RECENT_WORKOUTS}
+ ))
+"""
+
+def _build_client_snapshot(client_id: str):
+    """Compute a client's snapshot from the base tables and store it (unless another writer just did)"""
+    stats = bind_sql("""
+    SELECT
+      (SELECT MAX(workout_date) FROM TRAINING_DB.PUBLIC.generated_workouts WHERE client_id = ?) AS last_workout_date,
+      (SELECT MAX(workout_week) FROM TRAINING_DB.PUBLIC.generated_workouts WHERE client_id = ?) AS current_week,
+      (SELECT MAX(plan_start_date) FROM TRAINING_DB.PUBLIC.meal_plans WHERE client_id = ?) AS last_meal_plan_start,
+      (SELECT MAX(plan_week) FROM TRAINING_DB.PUBLIC.meal_plans WHERE client_id = ?) AS meal_plan_week,
+      (SELECT MAX(weigh_in_date) FROM TRAINING_DB.PUBLIC.weigh_ins WHERE client_id = ?) AS latest_weigh_in_date,
+      (SELECT MAX(performed_date) FROM TRAINING_DB.PUBLIC.exercise_results WHERE client_id = ?) AS last_performed_date,
+      (SELECT COUNT(*) FROM TRAINING_DB.PUBLIC.exercise_results WHERE client_id = ?) AS sets_logged
+    """, [client_id] * 7).to_pandas().iloc[0].to_dict()
+    weigh_in = bind_sql("""
+    SELECT weight_kg, body_fat_pct FROM TRAINING_DB.PUBLIC.weigh_ins
+    WHERE client_id = ? AND weigh_in_date = ?
+    """, [client_id, _bind_value(stats['LATEST_WEIGH_IN_DATE'])]).to_pandas().to_dict('records')
+
+    snapshot = {key.lower(): _bind_value(value) for key, value in stats.items()}
+    snapshot['latest_weight_kg'] = _bind_value(weigh_in[0]['WEIGHT_KG']) if weigh_in else None
+    snapshot['latest_body_fat_pct'] = _bind_value(weigh_in[0]['BODY_FAT_PCT']) if weigh_in else None
+
+    columns = list(snapshot)
+    bind_sql(f"""
+    INSERT INTO TRAINING_DB.PUBLIC.client_snapshot (client_id, {', '.join(columns)}, recent_workouts)
+    SELECT ?, {', '.join('?' * len(columns))}, {RECENT_WORKOUTS_SQL}
+    WHERE NOT EXISTS (SELECT 1 FROM TRAINING_DB.PUBLIC.client_snapshot WHERE client_id = ?)
+    """, [client_id, *(snapshot[column] for column in columns), client_id, client_id]).collect()
+    # The stored row, recent_workouts included (another writer's, if one got there first)
+    return _read_client_snapshot(client_id)
+
+def _read_client_snapshot(client_id: str):
+    """The stored snapshot row as a dict (lower-case keys), or None when the client has none"""
+    df = bind_sql("SELECT * FROM TRAINING_DB.PUBLIC.client_snapshot WHERE client_id = ?", [client_id]).to_pandas()
+    if df.empty:
+        return None
+    df = decode_variant_columns(df, 'client_snapshot', 'CLIENT_ID', 'UPDATED_AT', ['RECENT_WORKOUTS'])
+    snapshot = {key.lower(): _bind_value(value) for key, value in df.iloc[0].to_dict().items()}
+    snapshot['recent_workouts'] = snapshot['recent_workouts'] or []
+    return snapshot
+
+def get_client_snapshot(client_id: str):
+    """A client's recent state as a dict (lower-case keys), built on first read; None on error
+
+    Keys: last_workout_date, current_week, recent_workouts (list of {week, day, focus,
+    duration_min}, newest first), last_meal_plan_start, meal_plan_week, latest_weigh_in_date,
+    latest_weight_kg, latest_body_fat_pct, last_performed_date, sets_logged
+    """
+    try:
+        return _read_client_snapshot(client_id) or _build_client_snapshot(client_id)
+    except Exception as e:
+        st.warning(f"Could not fetch client snapshot: {str(e)}")
+        return None
+
+def next_plan_defaults(last_week, last_day):
+    """(week, start date) to offer for a client's next plan: the week after `last_week`, starting the
+    day after `last_day`, or today when that day has passed or there is no plan yet"""
+    today = date.today()
+    week = min(int(last_week or 0) + 1, 52)
+    if last_day is None or pd.Timestamp(last_day).date() < today:
+        return week, today
+    return week, pd.Timestamp(last_day).date() + timedelta(days=1)
+
+def invalidate_client_snapshot(client_id: str):
+    """Drop a client's snapshot after a write that bypasses the updates below; the next read rebuilds it"""
+    try:
+        bind_sql("DELETE FROM TRAINING_DB.PUBLIC.client_snapshot WHERE client_id = ?", [client_id]).collect()
+    except Exception as e:
+        st.warning(f"Could not refresh client snapshot: {str(e)}")
+
+def _update_client_snapshot(query: str, params: list):
+    """Apply a write path's snapshot UPDATE; a client without a row is left to be built on read"""
+    try:
+        bind_sql(query, params).collect()
+    except Exception as e:
+        st.warning(f"Could not update client snapshot: {str(e)}")
+
+def _snapshot_sets_logged(client_id: str, performed_date: datetime, count: int):
+    """Count `count` new sets logged on `performed_date` in the snapshot"""
+    day = performed_date.strftime('%Y-%m-%d')
+    _update_client_snapshot("""
+    UPDATE TRAINING_DB.PUBLIC.client_snapshot
+    SET last_performed_date = GREATEST(COALESCE(last_performed_date, ?), ?),
+        sets_logged = COALESCE(sets_logged, 0) + ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = ?
+    """, [day, day, int(count), client_id])
+
+def _snapshot_workouts_saved(client_id: str, week: int, last_date):
+    """Record saved workout days (up to `last_date`, in `week`) in the snapshot, in one statement"""
+    _update_client_snapshot(f"""
+    UPDATE TRAINING_DB.PUBLIC.client_snapshot
+    SET last_workout_date = GREATEST(COALESCE(last_workout_date, ?), ?),
+        current_week = GREATEST(COALESCE(current_week, ?), ?),
+        recent_workouts = {RECENT_WORKOUTS_SQL},
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = ?
+    """, [last_date, last_date, int(week), int(week), client_id, client_id])
+
+# ============================================================================
+# Writes: Workouts, Meal Plans, Tracking
+# ============================================================================
+
+def prompt_hash(prompt: str):
+    """SHA-256 of a prompt as lower-case hex, the same value as SHA2(prompt, 256) in Snowflake"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+def save_prompt(prompt: str, model: str = 'mistral-7b'):
+    """Store a prompt in cortex_prompts unless it is already there; returns the prompt_hash plans reference it by"""
+    digest = prompt_hash(prompt)
+    bind_sql("""
+    INSERT INTO TRAINING_DB.PUBLIC.cortex_prompts (prompt_hash, prompt_text, model)
+    SELECT ?, ?, ?
+    WHERE NOT EXISTS (SELECT 1 FROM TRAINING_DB.PUBLIC.cortex_prompts WHERE prompt_hash = ?)
+    """, [digest, prompt, model, digest]).collect()
+    return digest
+
+def save_workout(client_id: str, workout_data: dict, prompt: str, week: int = 1, day: int = 1):
+    """Save a single day's workout to database"""
+    try:
+        workout_id = generate_uuid()
+        digest = save_prompt(prompt)
+        
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.generated_workouts
+        (workout_id, client_id, workout_week, workout_day, workout_focus, duration_min,
+         warm_up, exercises, cool_down, prompt_hash, cortex_model)
+        SELECT ?, ?, ?, ?, ?, 60, ?, PARSE_JSON(?), ?, ?, 'mistral-7b'
+        """, [
+            workout_id,
+            client_id,
+            week,
+            day,
+            workout_data.get('focus', 'Generated Workout'),
+            workout_data.get('warm_up', ''),
+            json.dumps(workout_data.get('exercises', [])),
+            workout_data.get('cool_down', ''),
+            digest,
+        ]).collect()
+        log_event("workout_generated", client_id=client_id, message=f"Workout Day {day} Week {week} saved")
+        return workout_id
+    except Exception as e:
+        st.error(f"Error saving workout: {str(e)}")
+        return None
+
+def _workout_row_values(day_plan: DayPlan):
+    """(focus, duration_min, warm_up, exercises, cool_down) stored for one day; rest days keep their tips in warm_up"""
+    if day_plan.is_rest_day:
+        return 'Rest Day', 0, day_plan.recovery_tips, [], 'Focus on recovery'
+    exercises = [asdict(exercise) for exercise in day_plan.exercises]
+    return day_plan.focus, 60, day_plan.warm_up, exercises, day_plan.cool_down
+
+def save_weekly_workouts(client_id: str, week_plan: WeekPlan, prompt: str, start_date=None,
+                         job_id: str = None, plan_status: str = 'ACTIVE', model: str = 'mistral-7b'):
+    """Save all workouts from a full week to database (plan_status 'DRAFT' for plans awaiting review)"""
+    try:
+        saved_count = 0
+        
+        # If no start date provided, use today
+        if start_date is None:
+            start_date = datetime.now().date()
+        
+        # The week's prompt is stored once; every day row references it
+        digest = save_prompt(prompt, model)
+        
+        for day_plan in week_plan.days:
+            # Calculate workout date based on start date and day number
+            workout_date = start_date + timedelta(days=day_plan.day - 1)
+            workout_id = generate_uuid()
+            focus, duration, warm_up, exercises, cool_down = _workout_row_values(day_plan)
+            
+            bind_sql("""
+            INSERT INTO TRAINING_DB.PUBLIC.generated_workouts
+            (workout_id, client_id, workout_date, workout_week, workout_day, workout_focus, duration_min,
+             warm_up, exercises, cool_down, prompt_hash, cortex_model, plan_status, job_id)
+            SELECT ?, ?, ?, ?, ?, ?, ?, ?, PARSE_JSON(?), ?, ?, ?, ?, ?
+            """, [
+                workout_id, client_id, workout_date, week_plan.week, day_plan.day, focus, duration,
+                warm_up, json.dumps(exercises), cool_down, digest, model, plan_status, job_id,
+            ]).collect()
+            saved_count += 1
+        
+        if week_plan.days:
+            _snapshot_workouts_saved(client_id, week_plan.week,
+                                     start_date + timedelta(days=max(day_plan.day for day_plan in week_plan.days) - 1))
+        log_event("weekly_workouts_generated", client_id=client_id, 
+                 message=f"Week {week_plan.week} with {saved_count} days saved")
+        return saved_count
+    except Exception as e:
+        st.error(f"Error saving weekly workouts: {str(e)}")
+        return 0
+
+def update_workout_days(client_id: str, job_id: str, week_plan: WeekPlan, prompt: str, start_date,
+                        plan_status: str = 'ACTIVE'):
+    """Overwrite the days in `week_plan` of a saved week in place (days the week is missing are inserted); returns days saved"""
+    try:
+        digest = save_prompt(prompt)
+        missing_days = []
+        updated_days = []
+        
+        for day_plan in week_plan.days:
+            focus, duration, warm_up, exercises, cool_down = _workout_row_values(day_plan)
+            
+            updated = bind_sql("""
+            UPDATE TRAINING_DB.PUBLIC.generated_workouts
+            SET workout_focus = ?,
+                duration_min = ?,
+                warm_up = ?,
+                exercises = PARSE_JSON(?),
+                cool_down = ?,
+                prompt_hash = ?,
+                generation_date = CURRENT_TIMESTAMP
+            WHERE client_id = ? AND job_id = ? AND workout_day = ?
+            """, [focus, duration, warm_up, json.dumps(exercises), cool_down, digest,
+                  client_id, job_id, day_plan.day]).collect()
+            if not updated or updated[0][0] == 0:
+                missing_days.append(day_plan)
+            else:
+                updated_days.append(day_plan)
+        
+        saved_count = len(week_plan.days) - len(missing_days)
+        if updated_days:
+            _snapshot_workouts_saved(client_id, week_plan.week,
+                                     start_date + timedelta(days=max(day_plan.day for day_plan in updated_days) - 1))
+        if missing_days:
+            # Days the original completion left out have no row yet
+            saved_count += save_weekly_workouts(client_id, WeekPlan(week=week_plan.week, days=missing_days), prompt,
+                                                start_date=start_date, job_id=job_id, plan_status=plan_status)
+        return saved_count
+    except Exception as e:
+        st.error(f"Error updating workout days: {str(e)}")
+        return 0
+
+def save_meal_plan(client_id: str, meal_plan: MealPlan, prompt: str, week: int = 1, start_date=None,
+                   job_id: str = None, plan_status: str = 'ACTIVE', model: str = 'mistral-7b'):
+    """Save generated meal plan to database (plan_status 'DRAFT' for plans awaiting review)"""
+    try:
+        meal_plan_id = generate_uuid()
+        totals = meal_plan.weekly_totals
+        digest = save_prompt(prompt, model)
+        
+        # If no start date provided, use today
+        if start_date is None:
+            start_date = datetime.now().date()
+        
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.meal_plans
+        (meal_plan_id, client_id, plan_start_date, plan_week, duration_days, total_calories, protein_g, 
+         carbs_g, fat_g, meal_plan_json, prompt_hash, cortex_model, plan_status, job_id)
+        SELECT ?, ?, ?, ?, 7, ?, ?, ?, ?, PARSE_JSON(?), ?, ?, ?, ?
+        """, [
+            meal_plan_id, client_id, start_date, week,
+            totals.calories, totals.protein, totals.carbs, totals.fat,
+            json.dumps(meal_plan.to_dict()), digest, model, plan_status, job_id,
+        ]).collect()
+        _update_client_snapshot("""
+        UPDATE TRAINING_DB.PUBLIC.client_snapshot
+        SET last_meal_plan_start = GREATEST(COALESCE(last_meal_plan_start, ?), ?),
+            meal_plan_week = GREATEST(COALESCE(meal_plan_week, ?), ?),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE client_id = ?
+        """, [start_date, start_date, int(week), int(week), client_id])
+        log_event("meal_plan_generated", client_id=client_id, message="Meal plan generated and saved")
+        return meal_plan_id
+    except Exception as e:
+        st.error(f"Error saving meal plan: {str(e)}")
+        return None
+
+def insert_weigh_in(client_id: str, weigh_in_date: datetime, weight_kg: float, body_fat_pct: float = None, notes: str = None):
+    """Insert weigh-in record"""
+    try:
+        weigh_in_id = generate_uuid()
+        
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.weigh_ins
+        (weigh_in_id, client_id, weigh_in_date, weight_kg, body_fat_pct, notes)
+        SELECT ?, ?, ?, ?, ?, ?
+        """, [weigh_in_id, client_id, weigh_in_date.strftime("%Y-%m-%d"), weight_kg,
+              body_fat_pct or None, notes or None]).collect()
+        # A back-dated weigh-in leaves the latest one in place
+        day = weigh_in_date.strftime("%Y-%m-%d")
+        _update_client_snapshot("""
+        UPDATE TRAINING_DB.PUBLIC.client_snapshot
+        SET latest_weight_kg = CASE WHEN COALESCE(latest_weigh_in_date, ?) <= ? THEN ? ELSE latest_weight_kg END,
+            latest_body_fat_pct = CASE WHEN COALESCE(latest_weigh_in_date, ?) <= ? THEN ? ELSE latest_body_fat_pct END,
+            latest_weigh_in_date = GREATEST(COALESCE(latest_weigh_in_date, ?), ?),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE client_id = ?
+        """, [day, day, weight_kg, day, day, body_fat_pct or None, day, day, client_id])
+        log_event("weigh_in_recorded", client_id=client_id, message=f"Weigh-in recorded: {weight_kg}kg")
+        return weigh_in_id
+    except Exception as e:
+        st.error(f"Error saving weigh-in: {str(e)}")
+        return None
+
+def insert_exercise_result(client_id: str, workout_id: str, exercise_id: str, performed_date: datetime,
+                           set_number: int, reps: int, weight_kg: float = None, rpe: float = None,
+                           rest_seconds: int = None, duration_seconds: int = None, notes: str = None):
+    """Insert a single exercise set result into the exercise_results table"""
+    try:
+        result_id = generate_uuid()
+
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.exercise_results
+        (result_id, client_id, workout_id, exercise_id, performed_date, set_number, reps, weight_kg, rpe, rest_seconds, duration_seconds, notes)
+        SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        """, [result_id, client_id, workout_id, exercise_id, performed_date.strftime('%Y-%m-%d'), set_number, reps,
+              weight_kg, rpe, rest_seconds, duration_seconds, notes or None]).collect()
+        _snapshot_sets_logged(client_id, performed_date, 1)
+        log_event('exercise_result_recorded', client_id=client_id,
+                  message=f'Result recorded for workout {workout_id}, exercise {exercise_id}, set {set_number}')
+        return result_id
+    except Exception as e:
+        st.error(f"Error saving exercise result: {str(e)}")
+        return None
+
+def insert_exercise_results(client_id: str, workout_id: str, exercise_id: str, performed_date: datetime, sets: list):
+    """Insert several set results for one exercise in a single statement; returns the number of sets saved"""
+    if not sets:
+        return 0
+    try:
+        # One placeholder row per set, so there is one statement text per set count
+        params = []
+        for entry in sets:
+            params += [generate_uuid(), client_id, workout_id, exercise_id, performed_date.strftime('%Y-%m-%d'),
+                       entry['set_number'], entry['reps'], entry.get('weight_kg'), entry.get('rpe'),
+                       entry.get('rest_seconds'), entry.get('duration_seconds'), entry.get('notes')]
+        row = "SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?"
+        bind_sql(f"""
+        INSERT INTO TRAINING_DB.PUBLIC.exercise_results
+        (result_id, client_id, workout_id, exercise_id, performed_date, set_number, reps, weight_kg, rpe, rest_seconds, duration_seconds, notes)
+        {' UNION ALL '.join([row] * len(sets))}
+        """, params).collect()
+        _snapshot_sets_logged(client_id, performed_date, len(sets))
+        log_event('exercise_result_recorded', client_id=client_id,
+                  message=f'{len(sets)} result(s) recorded for workout {workout_id}, exercise {exercise_id}')
+        return len(sets)
+    except Exception as e:
+        st.error(f"Error saving exercise results: {str(e)}")
+        return 0
+
+def insert_body_measurements(client_id: str, measurement_date, neck_cm: float, chest_cm: float, waist_cm: float,
+                             hip_cm: float, thigh_cm: float, calf_cm: float):
+    """Insert a body measurements record"""
+    try:
+        measurement_id = generate_uuid()
+        bind_sql("""
+        INSERT INTO TRAINING_DB.PUBLIC.body_measurements
+        (measurement_id, client_id, measurement_date, neck_cm, chest_cm, waist_cm, hip_cm, thigh_cm, calf_cm)
+        SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?
+        """, [measurement_id, client_id, measurement_date, neck_cm, chest_cm, waist_cm, hip_cm, thigh_cm,
+              calf_cm]).collect()
+        return measurement_id
+    except Exception as e:
+        st.error(f"Error saving measurements: {str(e)}")
+        return None
+
+# ============================================================================
+# Reads: History and Progress
+# ============================================================================
+
+def get_exercise_progress(client_id: str, exercise_id: str):
+    """Fetch aggregated exercise progress for a client and exercise from the exercise_progress view.
+
+    Returns a dict with keys: client_id, exercise_id, max_weight_kg, avg_reps, avg_rpe,
+    sessions_recorded, estimated_1rm, recent_sets (list of JSON objects)
+    """
+    try:
+        df = bind_sql(
+            "SELECT * FROM TRAINING_DB.PUBLIC.exercise_progress WHERE client_id = ? AND exercise_id = ?",
+            [client_id, exercise_id]
+        ).to_pandas()
+        if df.empty:
+            return None
+
+        row = df.iloc[0].to_dict()
+
+        # The view has no update marker, so recent_sets is cached by its JSON text
+        recent_sets = decode_variant(row.get('RECENT_SETS'))
+
+        return {
+            'client_id': row.get('CLIENT_ID'),
+            'exercise_id': row.get('EXERCISE_ID'),
+            'max_weight_kg': row.get('MAX_WEIGHT_KG'),
+            'avg_reps': row.get('AVG_REPS'),
+            'avg_rpe': row.get('AVG_RPE'),
+            'sessions_recorded': int(row.get('SESSIONS_RECORDED')) if row.get('SESSIONS_RECORDED') is not None else 0,
+            'estimated_1rm': row.get('ESTIMATED_1RM'),
+            'recent_sets': recent_sets
+        }
+    except Exception as e:
+        st.warning(f"Could not fetch exercise progress: {str(e)}")
+        return None
+
+def get_exercise_1rm_trend(client_id: str, exercise_id: str, weeks: int = 12):
+    """Return a pandas DataFrame with weekly estimated 1RM (Epley) for the last `weeks` weeks.
+
+    Columns: week_start (date), estimated_1rm_max, avg_reps, total_sets, weekly_volume
+    """
+    try:
+        sql = """
+        SELECT
+          DATE_TRUNC('week', performed_date) AS week_start,
+          MAX(CASE WHEN weight_kg IS NOT NULL THEN weight_kg * (1 + reps / 30.0) ELSE NULL END) AS estimated_1rm_max,
+          AVG(reps) AS avg_reps,
+          COUNT(*) AS total_sets,
+          SUM(CASE WHEN weight_kg IS NOT NULL THEN weight_kg * reps ELSE 0 END) AS weekly_volume
+        FROM TRAINING_DB.PUBLIC.exercise_results
+        WHERE client_id = ?
+          AND exercise_id = ?
+          AND performed_date >= ?
+        GROUP BY week_start
+        ORDER BY week_start ASC
+        """
+
+        # Whole weeks from a Monday, matching the DATE_TRUNC('week') buckets
+        df = bind_sql(sql, [client_id, exercise_id, lookback_start(weeks, align_week=True)]).to_pandas()
+        if df.empty:
+            return pd.DataFrame(columns=['week_start', 'estimated_1rm_max', 'avg_reps', 'total_sets', 'weekly_volume'])
+
+        # Ensure proper dtypes
+        df['WEEK_START'] = pd.to_datetime(df['WEEK_START']).dt.date
+        df = df.rename(columns={
+            'WEEK_START': 'week_start',
+            'ESTIMATED_1RM_MAX': 'estimated_1rm_max',
+            'AVG_REPS': 'avg_reps',
+            'TOTAL_SETS': 'total_sets',
+            'WEEKLY_VOLUME': 'weekly_volume'
+        })
+
+        return df
+    except Exception as e:
+        st.warning(f"Could not fetch 1RM trend: {str(e)}")
+        return pd.DataFrame(columns=['week_start', 'estimated_1rm_max', 'avg_reps', 'total_sets', 'weekly_volume'])
+
+def get_client_workouts(client_id: str):
+    """Get all workouts for a client"""
+    try:
+        df = bind_sql("""
+        SELECT * FROM TRAINING_DB.PUBLIC.generated_workouts 
+        WHERE client_id = ?
+        ORDER BY generation_date DESC
+        """, [client_id]).to_pandas()
+        return decode_variant_columns(df, 'generated_workouts', 'WORKOUT_ID', 'GENERATION_DATE', ['EXERCISES'])
+    except Exception as e:
+        st.error(f"Error fetching workouts: {str(e)}")
+        return pd.DataFrame()
+
+def get_client_meal_plans(client_id: str):
+    """Get all meal plans for a client"""
+    try:
+        df = bind_sql("""
+        SELECT * FROM TRAINING_DB.PUBLIC.meal_plans 
+        WHERE client_id = ?
+        ORDER BY generation_date DESC
+        """, [client_id]).to_pandas()
+        return df
+    except Exception as e:
+        st.error(f"Error fetching meal plans: {str(e)}")
+        return pd.DataFrame()
+
+def get_client_weight_history(client_id: str):
+    """Get weight history for a client"""
+    try:
+        df = bind_sql("""
+        SELECT weigh_in_date, weight_kg, body_fat_pct
+        FROM TRAINING_DB.PUBLIC.weigh_ins 
+        WHERE client_id = ?
+        ORDER BY weigh_in_date ASC
+        """, [client_id]).to_pandas()
+        return df
+    except Exception as e:
+        st.error(f"Error fetching weight history: {str(e)}")
+        return pd.DataFrame()
+
+def get_client_workouts_by_date_range(client_id: str, start_date, end_date):
+    """Get workouts for a client within a date range (the columns the summary shows, not the prompt)"""
+    try:
+        df = bind_sql("""
+        SELECT workout_id, workout_date, generation_date, workout_week, workout_day, workout_focus,
+               duration_min, warm_up, exercises, cool_down
+        FROM TRAINING_DB.PUBLIC.generated_workouts
+        WHERE client_id = ?
+        AND workout_date >= ?
+        AND workout_date <= ?
+        ORDER BY workout_date ASC, workout_day ASC
+        """, [client_id, start_date, end_date]).to_pandas()
+        return decode_variant_columns(df, 'generated_workouts', 'WORKOUT_ID', 'GENERATION_DATE', ['EXERCISES'])
+    except Exception as e:
+        st.error(f"Error fetching workouts by date range: {str(e)}")
+        return pd.DataFrame()
+
+def get_client_meal_plans_by_date_range(client_id: str, start_date, end_date):
+    """Get meal plans for a client within a date range (the columns the summary shows, not the prompt)"""
+    try:
+        df = bind_sql("""
+        SELECT meal_plan_id, generation_date, plan_start_date, plan_week, duration_days,
+               total_calories, protein_g, carbs_g, fat_g, meal_plan_json
+        FROM TRAINING_DB.PUBLIC.meal_plans
+        WHERE client_id = ?
+        AND plan_start_date >= ?
+        AND plan_start_date <= ?
+        ORDER BY plan_start_date ASC
+        """, [client_id, start_date, end_date]).to_pandas()
+        return decode_variant_columns(df, 'meal_plans', 'MEAL_PLAN_ID', 'GENERATION_DATE', ['MEAL_PLAN_JSON'])
+    except Exception as e:
+        st.error(f"Error fetching meal plans by date range: {str(e)}")
+        return pd.DataFrame()
+
+# ============================================================================
+# Reads: Trainer Schedule
+# ============================================================================
+
+# Seconds a fetched week stays cached (the board's refresh button clears it sooner)
+SCHEDULE_CACHE_SEC = 300
+
+SCHEDULE_COLUMNS = ['CLIENT_ID', 'CLIENT_NAME', 'WORKOUT_DATE', 'WORKOUT_FOCUS', 'DURATION_MIN', 'PLAN_STATUS',
+                    'COMPLETED_SESSIONS', 'MISSED_SESSIONS', 'COMPLETION_PCT', 'VOLUME_DELTA_PCT']
+
+@st.cache_data(ttl=SCHEDULE_CACHE_SEC, show_spinner=False)
+def _fetch_week_schedule(week_start: date):
+    """Every client with their workouts and adherence for the 7 days from `week_start`, one query per week"""
+    # Only the board's columns (not exercises or the prompt) and only the week's dates are read;
+    # a day regenerated or awaiting review shows its active version, else the newest draft
+    return bind_sql("""
+    SELECT c.client_id, c.client_name, w.workout_date, w.workout_focus, w.duration_min, w.plan_status,
+           a.completed_sessions, a.missed_sessions, a.completion_pct, a.volume_delta_pct
+    FROM TRAINING_DB.PUBLIC.clients c
+    LEFT JOIN (
+        SELECT client_id, workout_date, workout_focus, duration_min, plan_status
+        FROM TRAINING_DB.PUBLIC.generated_workouts
+        WHERE workout_date BETWEEN ? AND ?
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY client_id, workout_date
+                                   ORDER BY plan_status = 'ACTIVE' DESC, generation_date DESC) = 1
+    ) w ON w.client_id = c.client_id
+    LEFT JOIN TRAINING_DB.PUBLIC.adherence_weekly a ON a.client_id = c.client_id AND a.week_start = ?
+    ORDER BY c.client_name, w.workout_date
+    """, [week_start, week_start + timedelta(days=6), week_start]).to_pandas()
+
+def get_week_schedule(week_start: date):
+    """All clients' workouts for a week (clients with nothing scheduled have one empty row)"""
+    try:
+        return _fetch_week_schedule(week_start)
+    except Exception as e:
+        st.error(f"Error fetching week schedule: {str(e)}")
+        return pd.DataFrame(columns=SCHEDULE_COLUMNS)
+
+def clear_week_schedule():
+    """Drop the cached weeks so the next read sees newly generated workouts"""
+    _fetch_week_schedule.clear()
+
+# ============================================================================
+# Query Result Cache
+# ============================================================================
+# A repeated read with identical text and binds within 24 hours is answered from
+# Snowflake's result cache without warehouse compute. Such queries report no bytes
+# scanned in QUERY_HISTORY, which is what the hit rate below counts. Only the app's
+# successful SELECTs are counted - not DML, DDL or the statistics query itself. A SELECT
+# answered from table metadata alone (an unfiltered COUNT(*) or MIN/MAX) also scans no
+# bytes; the app issues none, so the rate is not skewed by them.
+
+# Hours of query history the hit rate covers (the result cache keeps results 24 hours)
+CACHE_STATS_HOURS = 24
+
+# Seconds the hit rate stays cached, so Home reruns do not query QUERY_HISTORY each time
+CACHE_STATS_CACHE_SEC = 600
+
+@st.cache_data(ttl=CACHE_STATS_CACHE_SEC, show_spinner=False)
+def _fetch_result_cache_stats(hours: int):
+    """(reads, cache_hits) for the app's SELECTs over the last `hours` hours"""
+    row = bind_sql(f"""
+    SELECT
+      COUNT(*) AS reads,
+      COUNT_IF(bytes_scanned = 0) AS cache_hits
+    FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY(
+      END_TIME_RANGE_START => DATEADD(hour, -{int(hours)}, CURRENT_TIMESTAMP()),
+      RESULT_LIMIT => 10000))
+    WHERE query_type = 'SELECT'
+      AND execution_status = 'SUCCESS'
+      AND query_text ILIKE '%TRAINING_DB.PUBLIC.%'
+      AND query_text NOT ILIKE '%INFORMATION_SCHEMA.QUERY_HISTORY%'
+    """).collect()[0]
+    return int(row['READS']), int(row['CACHE_HITS'])
+
+def get_result_cache_stats(hours: int = CACHE_STATS_HOURS):
+    """App reads over the last `hours` hours and how many were served from the result cache
+
+    Returns a dict with keys: reads, cache_hits, hit_rate (None when there were no reads),
+    or None when QUERY_HISTORY is not available (e.g. running locally).
+    """
+    try:
+        reads, cache_hits = _fetch_result_cache_stats(int(hours))
+    except Exception:
+        return None
+    return {
+        'reads': reads,
+        'cache_hits': cache_hits,
+        'hit_rate': cache_hits / reads if reads else None,
+    }
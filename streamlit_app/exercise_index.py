@@ -0,0 +1,237 @@
+"""
+Exercise name resolver: maps generated exercise names to exercises_library ids.
+
+Cortex names exercises freely ("Back Squat", "Barbell Squat", "DB RDL"), so results
+keyed by name never aggregate. The index holds every library name and variation,
+normalised, plus a trigram inverted index over them. It is built once per process from
+exercises_library and resolves a name with an exact lookup (ignoring spaces, so
+"Lat Pull Down" finds "Lat Pulldown"), falling back to the most similar name by trigram
+overlap among library names whose every word appears in the generated one - "Seated
+Dumbbell Shoulder Press" matches "Dumbbell Shoulder Press", "Dumbbell Fly" does not
+match "Dumbbell Row".
+
+It also serves the retrieval stage of workout generation: library exercises are
+filtered by the client's equipment and fitness level, ranked per training focus by
+how much of their (TF-IDF weighted) target muscles the focus covers, and handed to the prompt as a shortlist of
+short codes that the model copies into "exercise_id" (see `code_to_id`).
+"""
+
+import streamlit as st
+import re
+import threading
+import numpy as np
+from collections import OrderedDict, defaultdict
+
+from data_access import bind_sql, variant_list
+
+# Spellings folded together before matching
+TOKEN_ALIASES = {
+    'db': 'dumbbell', 'bb': 'barbell', 'kb': 'kettlebell',
+    'ups': 'up', 'pushup': 'push up', 'pullup': 'pull up', 'chinup': 'chin up',
+}
+
+# Trigram (Dice) similarity a fuzzy match needs; high enough that one extra word that
+# changes the movement ("Squat Jump" vs "Squat") is rejected
+MIN_SIMILARITY = 0.72
+
+# Target-muscle query per training focus, for ranking the prompt shortlist
+SHORTLIST_FOCUSES = {
+    'Legs': 'quads glutes hamstrings calves',
+    'Push': 'chest shoulders triceps',
+    'Pull': 'back biceps',
+    'Core': 'core',
+    'Cardio': 'cardio',
+    'Mobility': 'hips flexibility',
+}
+SHORTLIST_PER_FOCUS = 5
+
+# Hardest library exercises each fitness level may be given
+LEVEL_RANK = {'Beginner': 0, 'Intermediate': 1, 'Advanced': 2}
+
+# Exercise codes are the shortest exercise_id prefix (at least this long) that is unique
+SHORT_CODE_LEN = 8
+
+# Resolved names remembered per index; the least recently used are dropped beyond this many
+RESOLVED_NAMES_KEPT = 5_000
+
+def normalize_name(name: str):
+    """Lower-case, punctuation-free, singular tokens: 'DB Push-Ups' -> 'dumbbell push up'"""
+    tokens = []
+    for token in re.sub(r'[^a-z0-9]+', ' ', str(name).lower()).split():
+        token = TOKEN_ALIASES.get(token, token)
+        # Plurals: curls -> curl, raises -> raise, stretches -> stretch (but keep press)
+        if len(token) > 4 and token.endswith(('ches', 'shes', 'sses', 'xes')):
+            token = token[:-2]
+        elif len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return ' '.join(tokens)
+
+def _trigrams(normalized: str):
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class ExerciseIndex:
+    """Normalised-name and trigram index over exercise names and their variations"""
+
+    def __init__(self, exercises):
+        """`exercises`: exercises_library rows as dicts (exercise_id, exercise_name, variations and,
+        for shortlists, category, target_muscles, equipment_required, difficulty_level)"""
+        self.exact = {}
+        self.ids = []
+        self.tokens = []
+        self.grams = []
+        self.postings = defaultdict(list)
+        self._resolved = OrderedDict()
+        self._resolved_lock = threading.Lock()
+        self._shortlists = {}
+
+        self.library = [dict(exercise) for exercise in exercises]
+        # Canonical names first, so a variation never shadows another exercise's name
+        aliases = [(exercise['exercise_id'], exercise['exercise_name']) for exercise in self.library]
+        aliases += [(exercise['exercise_id'], variation)
+                    for exercise in self.library for variation in variant_list(exercise.get('variations'))]
+        for exercise_id, alias in aliases:
+            normalized = normalize_name(alias)
+            compact = normalized.replace(' ', '')
+            if not compact or compact in self.exact:
+                continue
+            self.exact[compact] = exercise_id
+            entry = len(self.ids)
+            self.ids.append(exercise_id)
+            self.tokens.append(frozenset(normalized.split()))
+            grams = _trigrams(normalized)
+            self.grams.append(len(grams))
+            for gram in grams:
+                self.postings[gram].append(entry)
+
+        self._build_codes()
+        self._build_muscle_vectors()
+
+    def _build_codes(self):
+        library_ids = [exercise['exercise_id'] for exercise in self.library]
+        length = SHORT_CODE_LEN
+        while len({exercise_id[:length] for exercise_id in library_ids}) < len(library_ids) and length < 36:
+            length += 1
+        self.codes = [exercise_id[:length] for exercise_id in library_ids]
+        self.code_ids = dict(zip(self.codes, library_ids))
+        self.code_ids.update({exercise_id: exercise_id for exercise_id in library_ids})
+
+    def _build_muscle_vectors(self):
+        """L2-normalised TF-IDF rows over each exercise's target muscles (listed order = weight) and category"""
+        documents = [[(muscle.lower(), 1 / (position + 1))
+                      for position, muscle in enumerate(variant_list(exercise.get('target_muscles')))]
+                     + [(str(exercise.get('category') or '').lower(), 0.5)] for exercise in self.library]
+        self.vocabulary = {term: i for i, term in enumerate(sorted({term for document in documents for term, _ in document if term}))}
+        counts = np.zeros((len(documents), len(self.vocabulary)))
+        for row, document in enumerate(documents):
+            for term, weight in document:
+                if term in self.vocabulary:
+                    counts[row, self.vocabulary[term]] += weight
+        idf = np.log((1 + len(documents)) / (1 + (counts > 0).sum(axis=0))) + 1
+        self.muscle_vectors = self._normalize(counts * idf)
+        # Unweighted focus queries: a score is how much of an exercise's vector the focus covers
+        self.focus_queries = np.array([[term in query.split() for term in self.vocabulary]
+                                       for query in SHORTLIST_FOCUSES.values()], dtype=float).reshape(len(SHORTLIST_FOCUSES), -1)
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def resolve(self, name: str, min_similarity: float = MIN_SIMILARITY):
+        """Canonical exercise_id for a free-text exercise name, or None if nothing is similar enough"""
+        normalized = normalize_name(name)
+        with self._resolved_lock:
+            if normalized in self._resolved:
+                self._resolved.move_to_end(normalized)
+                return self._resolved[normalized]
+
+        exercise_id = self.exact.get(normalized.replace(' ', ''))
+        if exercise_id is None and normalized:
+            grams = _trigrams(normalized)
+            tokens = set(normalized.split())
+            shared = defaultdict(int)
+            for gram in grams:
+                for entry in self.postings.get(gram, ()):
+                    shared[entry] += 1
+            best_score = 0.0
+            for entry, count in shared.items():
+                if not self.tokens[entry] <= tokens:
+                    continue
+                score = 2 * count / (len(grams) + self.grams[entry])
+                if score > best_score:
+                    best_score, exercise_id = score, self.ids[entry]
+            if best_score < min_similarity:
+                exercise_id = None
+
+        with self._resolved_lock:
+            self._resolved[normalized] = exercise_id
+            while len(self._resolved) > RESOLVED_NAMES_KEPT:
+                self._resolved.popitem(last=False)
+        return exercise_id
+
+    def code_to_id(self, code):
+        """Library exercise_id for a shortlist code (or a full id), None if it is not one"""
+        return self.code_ids.get(str(code).strip()) if code else None
+
+    def shortlist(self, equipment, fitness_level: str, per_focus: int | None = SHORTLIST_PER_FOCUS):
+        """{focus: [(code, exercise_name)]} of exercises the client can do, best target-muscle match first
+
+        Exercises needing equipment outside `equipment` (bodyweight is always allowed) or above
+        the client's level are dropped. Each remaining exercise is listed once, under the focus
+        it matches best.
+        """
+        owned = frozenset(equipment) | {'Bodyweight Only'}
+        max_rank = LEVEL_RANK.get(fitness_level, max(LEVEL_RANK.values()))
+        key = (owned, max_rank, per_focus)
+        if key in self._shortlists:
+            return self._shortlists[key]
+
+        allowed = np.array([
+            set(variant_list(exercise.get('equipment_required'))) <= owned
+            and LEVEL_RANK.get(exercise.get('difficulty_level'), 0) <= max_rank
+            for exercise in self.library
+        ], dtype=bool)
+        scores = self.focus_queries @ self.muscle_vectors.T
+        best_focus = scores.argmax(axis=0) if self.library else np.array([], dtype=int)
+
+        result = {}
+        for f, focus in enumerate(SHORTLIST_FOCUSES):
+            candidates = np.flatnonzero(allowed & (best_focus == f) & (scores[f] > 0))
+            ranked = candidates[np.argsort(-scores[f, candidates], kind='stable')][:per_focus]
+            if len(ranked):
+                result[focus] = [(self.codes[i], self.library[i]['exercise_name']) for i in ranked]
+
+        self._shortlists[key] = result
+        return result
+
+@st.cache_resource
+def get_exercise_index():
+    """Process-wide index over exercises_library, built on first use"""
+    rows = bind_sql("""
+    SELECT exercise_id, exercise_name, category, target_muscles, equipment_required, difficulty_level, variations
+    FROM TRAINING_DB.PUBLIC.exercises_library
+    ORDER BY exercise_name
+    """).collect()
+    return ExerciseIndex({key.lower(): value for key, value in row.as_dict().items()} for row in rows)
+
+def exercise_shortlist(client_data: dict, per_focus: int = SHORTLIST_PER_FOCUS):
+    """Prompt shortlist for a client row: {focus: [(code, exercise_name)]}"""
+    return get_exercise_index().shortlist(
+        variant_list(client_data.get('AVAILABLE_EQUIPMENT')), client_data.get('FITNESS_LEVEL'), per_focus
+    )
+
+def resolve_exercise_id(name: str, exercise_id: str = None):
+    """Library exercise_id for a generated exercise: its shortlist code or id if it carries one,
+    otherwise matched by name (None when it is not in the library)"""
+    index = get_exercise_index()
+    return index.code_to_id(exercise_id) or index.resolve(name)
+
+def resolve_week_exercises(week_plan):
+    """Set every exercise of a WeekPlan to its library exercise_id (mapping shortlist codes back to ids)"""
+    index = get_exercise_index()
+    for day_plan in week_plan.days:
+        for exercise in day_plan.exercises:
+            exercise.exercise_id = index.code_to_id(exercise.exercise_id) or index.resolve(exercise.name)
+    return week_plan
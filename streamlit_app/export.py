@@ -0,0 +1,287 @@
+"""
+Bulk export of client history to Parquet or CSV.
+
+Each dataset is read with data_access.fetch_batches() and written batch by batch, so
+memory is bounded by one result batch rather than by the length of a client's history.
+VARIANT columns are flattened on the way: workout exercises become one row per
+exercise, meal plans one row per meal, and JSON arrays (goals, equipment, foods)
+'; '-separated text. Every batch is cast to the dataset's fixed column types, so a
+file never changes type part-way through.
+
+The files are zipped and put on the export stage (sql/11_create_export_stage.sql),
+which hands out a presigned download link instead of streaming the archive through
+the app.
+"""
+
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from data_access import bind_sql, fetch_batches, get_snowpark_session, variant_list
+
+EXPORT_STAGE = 'TRAINING_DB.PUBLIC.export_stage'
+
+# Presigned download links stay valid this long
+URL_EXPIRY_SEC = 3600
+
+FORMATS = ('parquet', 'csv')
+
+ARROW_TYPES = {
+    'str': pa.string(),
+    'int': pa.int64(),
+    'float': pa.float64(),
+    'date': pa.date32(),
+    'timestamp': pa.timestamp('us', tz='UTC'),
+}
+
+# ============================================================================
+# VARIANT Flattening
+# ============================================================================
+
+def _json(value):
+    """Parsed VARIANT value: JSON text from to_pandas(), or an already-parsed value"""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    return value
+
+def _objects(value):
+    """JSON objects in a VARIANT array (anything else is dropped)"""
+    value = _json(value)
+    return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+def _text_list(value):
+    return '; '.join(str(item) for item in variant_list(value)) or None
+
+def _explode(batch: pd.DataFrame, column: str, fields: dict, number_column: str = None):
+    """One row per object in the VARIANT array `column`, with `fields` (object key -> output
+    column) pulled out and numbered from 1 within each source row. Rows whose array is
+    empty are kept once, with the object columns empty."""
+    batch = batch.assign(**{column: batch[column].map(_objects)}).explode(column)
+    if number_column:
+        batch[number_column] = (batch.groupby(level=0).cumcount() + 1).where(batch[column].notna())
+    batch = batch.reset_index(drop=True)
+    objects = [item if isinstance(item, dict) else {} for item in batch.pop(column)]
+    details = pd.DataFrame.from_records(objects, columns=list(fields)).rename(columns=fields)
+    return pd.concat([batch, details], axis=1)
+
+def _flatten_clients(batch: pd.DataFrame):
+    for column in ('FITNESS_GOALS', 'AVAILABLE_EQUIPMENT', 'DIETARY_PREFERENCES'):
+        batch[column] = batch[column].map(_text_list)
+    return batch
+
+def _flatten_workouts(batch: pd.DataFrame):
+    return _explode(batch, 'EXERCISES', {
+        'exercise_id': 'EXERCISE_ID', 'name': 'EXERCISE_NAME', 'sets': 'SETS', 'reps': 'REPS',
+        'rest_sec': 'REST_SEC', 'notes': 'EXERCISE_NOTES',
+    }, 'EXERCISE_NUMBER')
+
+def _flatten_meal_plans(batch: pd.DataFrame):
+    plans = batch.pop('MEAL_PLAN_JSON').map(_json)
+    batch['DAYS'] = plans.map(lambda plan: plan.get('days') if isinstance(plan, dict) else None)
+    batch = _explode(batch, 'DAYS', {'day': 'PLAN_DAY', 'meals': 'MEALS'})
+    batch = _explode(batch, 'MEALS', {
+        'meal_type': 'MEAL_TYPE', 'foods': 'FOODS', 'calories': 'MEAL_CALORIES', 'protein': 'MEAL_PROTEIN_G',
+        'carbs': 'MEAL_CARBS_G', 'fat': 'MEAL_FAT_G', 'recipe_id': 'RECIPE_ID', 'servings': 'SERVINGS',
+    }, 'MEAL_NUMBER')
+    batch['FOODS'] = batch['FOODS'].map(_text_list)
+    return batch
+
+# ============================================================================
+# Datasets
+# ============================================================================
+
+# Dataset -> query ({where} is the client filter, bound as a parameter), flattening and output columns
+EXPORTS = {
+    'clients': {
+        'query': """
+        SELECT client_id, client_name, age, gender, current_weight_kg, height_cm, fitness_level,
+               fitness_goals, available_equipment, days_per_week, workout_duration_min,
+               dietary_preferences, allergies, target_calories, target_protein_g, created_at, updated_at
+        FROM TRAINING_DB.PUBLIC.clients {where}
+        ORDER BY client_name
+        """,
+        'flatten': _flatten_clients,
+        'columns': [
+            ('client_id', 'str'), ('client_name', 'str'), ('age', 'int'), ('gender', 'str'),
+            ('current_weight_kg', 'float'), ('height_cm', 'int'), ('fitness_level', 'str'),
+            ('fitness_goals', 'str'), ('available_equipment', 'str'), ('days_per_week', 'int'),
+            ('workout_duration_min', 'int'), ('dietary_preferences', 'str'), ('allergies', 'str'),
+            ('target_calories', 'int'), ('target_protein_g', 'int'), ('created_at', 'timestamp'),
+            ('updated_at', 'timestamp'),
+        ],
+    },
+    'workouts': {
+        'query': """
+        SELECT workout_id, client_id, workout_date, workout_week, workout_day, workout_focus, duration_min,
+               warm_up, exercises, cool_down, notes, cortex_model, plan_status, generation_date
+        FROM TRAINING_DB.PUBLIC.generated_workouts {where}
+        ORDER BY client_id, workout_week, workout_day, generation_date
+        """,
+        'flatten': _flatten_workouts,
+        'columns': [
+            ('workout_id', 'str'), ('client_id', 'str'), ('workout_date', 'date'), ('workout_week', 'int'),
+            ('workout_day', 'int'), ('workout_focus', 'str'), ('duration_min', 'int'), ('plan_status', 'str'),
+            ('exercise_number', 'int'), ('exercise_id', 'str'), ('exercise_name', 'str'), ('sets', 'int'),
+            ('reps', 'str'), ('rest_sec', 'int'), ('exercise_notes', 'str'), ('warm_up', 'str'),
+            ('cool_down', 'str'), ('notes', 'str'), ('cortex_model', 'str'), ('generation_date', 'timestamp'),
+        ],
+    },
+    'exercise_results': {
+        'query': """
+        SELECT result_id, client_id, workout_id, exercise_id, performed_date, set_number, reps, weight_kg,
+               rpe, rest_seconds, duration_seconds, notes, recorded_at
+        FROM TRAINING_DB.PUBLIC.exercise_results {where}
+        ORDER BY client_id, performed_date, exercise_id, set_number
+        """,
+        'flatten': None,
+        'columns': [
+            ('result_id', 'str'), ('client_id', 'str'), ('workout_id', 'str'), ('exercise_id', 'str'),
+            ('performed_date', 'date'), ('set_number', 'int'), ('reps', 'int'), ('weight_kg', 'float'),
+            ('rpe', 'float'), ('rest_seconds', 'int'), ('duration_seconds', 'int'), ('notes', 'str'),
+            ('recorded_at', 'timestamp'),
+        ],
+    },
+    'weigh_ins': {
+        'query': """
+        SELECT weigh_in_id, client_id, weigh_in_date, weight_kg, body_fat_pct, notes, recorded_at
+        FROM TRAINING_DB.PUBLIC.weigh_ins {where}
+        ORDER BY client_id, weigh_in_date
+        """,
+        'flatten': None,
+        'columns': [
+            ('weigh_in_id', 'str'), ('client_id', 'str'), ('weigh_in_date', 'date'), ('weight_kg', 'float'),
+            ('body_fat_pct', 'float'), ('notes', 'str'), ('recorded_at', 'timestamp'),
+        ],
+    },
+    'body_measurements': {
+        'query': """
+        SELECT measurement_id, client_id, measurement_date, neck_cm, chest_cm, waist_cm, hip_cm, thigh_cm,
+               calf_cm, recorded_at
+        FROM TRAINING_DB.PUBLIC.body_measurements {where}
+        ORDER BY client_id, measurement_date
+        """,
+        'flatten': None,
+        'columns': [
+            ('measurement_id', 'str'), ('client_id', 'str'), ('measurement_date', 'date'), ('neck_cm', 'float'),
+            ('chest_cm', 'float'), ('waist_cm', 'float'), ('hip_cm', 'float'), ('thigh_cm', 'float'),
+            ('calf_cm', 'float'), ('recorded_at', 'timestamp'),
+        ],
+    },
+    'meal_plans': {
+        'query': """
+        SELECT meal_plan_id, client_id, plan_start_date, plan_week, plan_status, total_calories, protein_g,
+               carbs_g, fat_g, meal_plan_json, cortex_model, generation_date
+        FROM TRAINING_DB.PUBLIC.meal_plans {where}
+        ORDER BY client_id, plan_week, generation_date
+        """,
+        'flatten': _flatten_meal_plans,
+        'columns': [
+            ('meal_plan_id', 'str'), ('client_id', 'str'), ('plan_start_date', 'date'), ('plan_week', 'int'),
+            ('plan_status', 'str'), ('total_calories', 'int'), ('protein_g', 'int'), ('carbs_g', 'int'),
+            ('fat_g', 'int'), ('plan_day', 'int'), ('meal_number', 'int'), ('meal_type', 'str'), ('foods', 'str'),
+            ('meal_calories', 'int'), ('meal_protein_g', 'int'), ('meal_carbs_g', 'int'), ('meal_fat_g', 'int'),
+            ('recipe_id', 'str'), ('servings', 'float'), ('cortex_model', 'str'), ('generation_date', 'timestamp'),
+        ],
+    },
+}
+
+def _schema(columns: list):
+    return pa.schema([(name, ARROW_TYPES[kind]) for name, kind in columns])
+
+def _text(value):
+    if value is None or value is pd.NA or (isinstance(value, float) and pd.isna(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _to_arrow(batch: pd.DataFrame, columns: list):
+    """Cast a flattened batch to the dataset's fixed schema (missing columns are all null)"""
+    arrays = []
+    for name, kind in columns:
+        values = batch[name.upper()] if name.upper() in batch else pd.Series(None, index=batch.index, dtype=object)
+        if kind == 'str':
+            try:
+                arrays.append(pa.Array.from_pandas(values, type=pa.string()))
+                continue
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed or numeric values (e.g. reps given as 8 or "8-10")
+                values = values.map(_text).astype(object)
+        elif kind == 'int':
+            values = pd.to_numeric(values, errors='coerce').round().astype('Int64')
+        elif kind == 'float':
+            values = pd.to_numeric(values, errors='coerce').astype('float64')
+        elif kind == 'date':
+            values = pd.to_datetime(values, errors='coerce')
+            arrays.append(pa.Array.from_pandas(values).cast(pa.date32()))
+            continue
+        else:
+            values = pd.to_datetime(values, errors='coerce', utc=True)
+        arrays.append(pa.Array.from_pandas(values, type=ARROW_TYPES[kind]))
+    return pa.Table.from_arrays(arrays, schema=_schema(columns))
+
+# ============================================================================
+# Export
+# ============================================================================
+
+def _writer(path: Path, schema: pa.Schema, fmt: str):
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(path, schema, compression='zstd')
+    import pyarrow.csv as pacsv
+    return pacsv.CSVWriter(path, schema)
+
+def export_dataset(dataset: str, client_id: str | None, out_dir: Path, fmt: str = 'parquet'):
+    """Stream one dataset to <out_dir>/<dataset>.<fmt>; returns the number of rows written"""
+    spec = EXPORTS[dataset]
+    where, params = ("WHERE client_id = ?", [client_id]) if client_id else ("", [])
+    path = Path(out_dir) / f"{dataset}.{fmt}"
+    rows = 0
+    writer = _writer(path, _schema(spec['columns']), fmt)
+    try:
+        for batch in fetch_batches(spec['query'].format(where=where), params):
+            if spec['flatten']:
+                batch = spec['flatten'](batch)
+            table = _to_arrow(batch, spec['columns'])
+            writer.write_table(table)
+            rows += table.num_rows
+    finally:
+        writer.close()
+    return rows
+
+def build_export(client_id: str | None, out_dir: Path, fmt: str = 'parquet', on_progress=None):
+    """Export every dataset for one client (or all clients when `client_id` is None) and zip
+    them; returns (archive path, {dataset: rows})"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    out_dir = Path(out_dir)
+    counts = {}
+    for i, dataset in enumerate(EXPORTS):
+        counts[dataset] = export_dataset(dataset, client_id, out_dir, fmt)
+        if on_progress:
+            on_progress((i + 1) / len(EXPORTS), dataset)
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    archive = out_dir / f"history_{client_id or 'all_clients'}_{stamp}.zip"
+    # Parquet is already compressed; CSV shrinks a lot
+    compression = zipfile.ZIP_STORED if fmt == 'parquet' else zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(archive, 'w', compression=compression) as zf:
+        for dataset in EXPORTS:
+            zf.write(out_dir / f"{dataset}.{fmt}", arcname=f"{dataset}.{fmt}")
+    return archive, counts
+
+def publish_export(archive: Path):
+    """Put an export archive on the export stage; returns a presigned download URL"""
+    session = get_snowpark_session()
+    folder = archive.stem
+    session.file.put(str(archive), f"@{EXPORT_STAGE}/{folder}", auto_compress=False, overwrite=True)
+    return bind_sql(f"""
+    SELECT GET_PRESIGNED_URL(@{EXPORT_STAGE}, ?, ?)
+    """, [f"{folder}/{archive.name}", URL_EXPIRY_SEC]).collect()[0][0]
@@ -0,0 +1,285 @@
+"""
+Cortex Prompt Complete generation for workouts and meal plans.
+"""
+
+import streamlit as st
+import json
+import re
+
+from data_access import bind_sql, get_client_snapshot
+from exercise_index import exercise_shortlist, get_exercise_index
+from models import DAY_NAMES, WeekPlan, decode_meal_plan, decode_week
+from progression import describe_recommendation, get_recommendations
+
+# ============================================================================
+# Prompt Context
+# ============================================================================
+
+def get_exercise_shortlist_context(client_data: dict):
+    """Library exercises the client can do, per focus, as 'code Name' lines for the prompt"""
+    try:
+        shortlist = exercise_shortlist(client_data)
+    except Exception as e:
+        st.error(f"Error building exercise shortlist: {str(e)}")
+        shortlist = {}
+    if not shortlist:
+        return "No exercise library available - use standard exercise names and leave exercise_id empty."
+    return "\n".join(
+        f"- {focus}: " + '; '.join(f"{code} {name}" for code, name in exercises)
+        for focus, exercises in shortlist.items()
+    )
+
+def get_recent_loads_context(client_id: str, limit: int = 12):
+    """Last load and next target for the client's most recently trained exercises"""
+    try:
+        recommendations_df = get_recommendations(client_id)
+        names = {exercise['exercise_id']: exercise['exercise_name'] for exercise in get_exercise_index().library}
+    except Exception as e:
+        st.warning(f"Could not compute recent loads: {str(e)}")
+        return "No recent loads available."
+    if recommendations_df.empty:
+        return "No logged sets yet - prescribe conservative starting loads."
+    recommendations_df = recommendations_df.sort_values('LAST_DATE', ascending=False).head(limit)
+    return "\n".join(
+        f"- {describe_recommendation(row, names.get(row['EXERCISE_ID']))}" for row in recommendations_df.to_dict('records')
+    )
+
+def get_previous_workouts_context(client_id: str, weeks: int = 4):
+    """Get previous workouts to provide context for AI generation (from the client snapshot)"""
+    snapshot = get_client_snapshot(client_id)
+    if snapshot is None:
+        return "No previous workouts available."
+    # The snapshot keeps the latest version of each week/day, newest first
+    recent = snapshot['recent_workouts'][:int(weeks) * 7]
+    if not recent:
+        return "No previous workouts found. This will be the first training program."
+    
+    # Summarize previous workouts, newest week first
+    context_lines = ["Previous Workouts (Last 4 Weeks):"]
+    recent = sorted(recent, key=lambda entry: (entry['week'], entry['day']), reverse=True)[:16]  # Last 4 weeks
+    context_lines += [
+        f"- Week {entry['week']}, Day {entry['day']}: {entry['focus']} ({entry['duration_min']}min)"
+        for entry in recent
+    ]
+    
+    return "\n".join(context_lines)
+
+# ============================================================================
+# Cortex Generation
+# ============================================================================
+
+CORTEX_MODEL = 'mistral-7b'
+
+def complete_json(prompt: str, model: str = CORTEX_MODEL):
+    """Run Cortex Prompt Complete and parse the JSON object in the response; raises on failure"""
+    # The prompt is a bind parameter: one statement text for every completion
+    result = bind_sql("SELECT SNOWFLAKE.CORTEX.COMPLETE(?, ?) AS response", [model, prompt]).collect()
+    response_text = result[0][0]
+    
+    # Parse JSON from response
+    json_match = re.search(r'\{[\s\S]*\}', response_text)
+    if json_match:
+        return json.loads(json_match.group())
+    return json.loads(response_text)
+
+def build_full_week_prompt(client_id: str, client_data: dict, week: int = 1):
+    """Build the full-week program prompt, including the previous-workouts context"""
+    # Get context from previous workouts
+    previous_context = get_previous_workouts_context(client_id, weeks=4)
+    shortlist_context = get_exercise_shortlist_context(client_data)
+    loads_context = get_recent_loads_context(client_id)
+    
+    # Build prompt from client data
+    fitness_goals = ', '.join(client_data['FITNESS_GOALS']) if isinstance(client_data['FITNESS_GOALS'], list) else client_data['FITNESS_GOALS']
+    equipment = ', '.join(client_data['AVAILABLE_EQUIPMENT']) if isinstance(client_data['AVAILABLE_EQUIPMENT'], list) else client_data['AVAILABLE_EQUIPMENT']
+    
+    prompt = f"""You are an expert personal trainer creating a complete 7-day training program.
+
+=== CLIENT PROFILE ===
+- Fitness Level: {client_data['FITNESS_LEVEL']}
+- Goals: {fitness_goals}
+- Available Equipment: {equipment}
+- Training Days per Week: {client_data['DAYS_PER_WEEK']}
+- Workout Duration: {client_data['WORKOUT_DURATION_MIN']} minutes per session
+
+=== CONTEXT FROM PREVIOUS TRAINING ===
+{previous_context}
+
+=== RECENT LOADS (last -> next target) ===
+{loads_context}
+
+=== EXERCISE SHORTLIST (code name) ===
+{shortlist_context}
+
+=== IMPORTANT INSTRUCTIONS ===
+1. Create a diverse training program where each training day focuses on different muscle groups
+2. Include {client_data['DAYS_PER_WEEK']} training days and {7 - client_data['DAYS_PER_WEEK']} rest days
+3. ENSURE THE WORKOUTS ARE SIGNIFICANTLY DIFFERENT from the previous weeks shown above
+4. Vary the exercises, rep ranges, and training focus across the week
+5. Include at least 1 running day within the {client_data['DAYS_PER_WEEK']} training days
+6. On gym days, ensure to include at least 5 exercises
+7. Include proper warm-up and cool-down for each training day
+8. Space out muscle groups to allow for recovery (e.g., no back-to-back same muscle groups)
+9. Rest days should be labeled with recovery recommendations
+10. Choose exercises only from the shortlist and put each one's code in "exercise_id"
+11. Where an exercise has a recent load, base its reps and notes on the next target (e.g. "Aim for 102.5 kg x 5")
+
+Format EXACTLY as this JSON (no extra text):
+{{
+  "week": {week},
+  "days": [
+    {{"day": 1, "day_name": "Monday", "is_rest_day": false, "focus": "Upper Body", "warm_up": "5 min", "exercises": [{{"exercise_id": "a1b2c3d4", "name": "Ex1", "sets": 3, "reps": "8-10", "rest_sec": 90, "notes": "notes"}}], "cool_down": "stretch"}},
+    {{"day": 2, "day_name": "Tuesday", "is_rest_day": true, "recovery_tips": "Light activity"}}
+  ]
+}}"""
+    return prompt
+
+def generate_full_week_workouts_cortex(client_id: str, client_data: dict, week: int = 1):
+    """Generate a full week of workouts (7 days including rest days) using Cortex Prompt Complete"""
+    try:
+        prompt = build_full_week_prompt(client_id, client_data, week)
+        return decode_week(complete_json(prompt), week), prompt
+    except Exception as e:
+        st.error(f"Error generating weekly workout with Cortex: {str(e)}")
+        return None, None
+
+def build_day_regeneration_prompt(client_data: dict, week_plan: WeekPlan, days: list):
+    """Build a prompt that rewrites only `days` of an existing week, with the other days as context"""
+    fitness_goals = ', '.join(client_data['FITNESS_GOALS']) if isinstance(client_data['FITNESS_GOALS'], list) else client_data['FITNESS_GOALS']
+    equipment = ', '.join(client_data['AVAILABLE_EQUIPMENT']) if isinstance(client_data['AVAILABLE_EQUIPMENT'], list) else client_data['AVAILABLE_EQUIPMENT']
+    
+    # Summarise the days being kept so the new ones fit around them
+    kept_lines = []
+    for day_plan in week_plan.days:
+        if day_plan.day in days:
+            continue
+        if day_plan.is_rest_day:
+            kept_lines.append(f"- Day {day_plan.day} ({DAY_NAMES[day_plan.day - 1]}): Rest day")
+        else:
+            exercise_names = ', '.join(exercise.name for exercise in day_plan.exercises)
+            kept_lines.append(f"- Day {day_plan.day} ({DAY_NAMES[day_plan.day - 1]}): {day_plan.focus} - {exercise_names}")
+    kept_context = "\n".join(kept_lines) if kept_lines else "No other days in this week yet."
+    shortlist_context = get_exercise_shortlist_context(client_data)
+    replace_list = ', '.join(f"Day {day_num} ({DAY_NAMES[day_num - 1]})" for day_num in sorted(days))
+    
+    prompt = f"""You are an expert personal trainer. Rewrite only the days listed below of an existing 7-day training program.
+
+=== CLIENT PROFILE ===
+- Fitness Level: {client_data['FITNESS_LEVEL']}
+- Goals: {fitness_goals}
+- Available Equipment: {equipment}
+- Training Days per Week: {client_data['DAYS_PER_WEEK']}
+- Workout Duration: {client_data['WORKOUT_DURATION_MIN']} minutes per session
+
+=== REST OF THE WEEK (keep as is) ===
+{kept_context}
+
+=== DAYS TO REWRITE ===
+{replace_list}
+
+=== EXERCISE SHORTLIST (code name) ===
+{shortlist_context}
+
+=== IMPORTANT INSTRUCTIONS ===
+1. Return ONLY the days to rewrite, keeping the week at {client_data['DAYS_PER_WEEK']} training days in total
+2. Do not train the same muscle groups as the neighbouring days
+3. On gym days, ensure to include at least 5 exercises
+4. Include proper warm-up and cool-down for each training day
+5. Rest days should be labeled with recovery recommendations
+6. Choose exercises only from the shortlist and put each one's code in "exercise_id"
+
+Format EXACTLY as this JSON (no extra text):
+{{
+  "days": [
+    {{"day": 3, "day_name": "Wednesday", "is_rest_day": false, "focus": "Lower Body", "warm_up": "5 min", "exercises": [{{"exercise_id": "a1b2c3d4", "name": "Ex1", "sets": 3, "reps": "8-10", "rest_sec": 90, "notes": "notes"}}], "cool_down": "stretch"}}
+  ]
+}}"""
+    return prompt
+
+def build_workout_prompt(client_data: dict):
+    """Build the single-day workout prompt"""
+    # Build prompt from client data
+    fitness_goals = ', '.join(client_data['FITNESS_GOALS']) if isinstance(client_data['FITNESS_GOALS'], list) else client_data['FITNESS_GOALS']
+    equipment = ', '.join(client_data['AVAILABLE_EQUIPMENT']) if isinstance(client_data['AVAILABLE_EQUIPMENT'], list) else client_data['AVAILABLE_EQUIPMENT']
+    
+    prompt = f"""You are an expert personal trainer. Generate a detailed workout plan for a client.
+
+Client Profile:
+- Fitness Level: {client_data['FITNESS_LEVEL']}
+- Goals: {fitness_goals}
+- Available Equipment: {equipment}
+- Days Available per Week: {client_data['DAYS_PER_WEEK']}
+- Preferred Duration: {client_data['WORKOUT_DURATION_MIN']} minutes
+
+Generate a complete {client_data['WORKOUT_DURATION_MIN']}-minute workout including:
+1. Warm-up (5 minutes)
+2. Main exercises with sets, reps, and rest periods (appropriate to their fitness level)
+3. Cool-down (5-10 minutes)
+
+Format EXACTLY as this JSON structure (no extra text before or after):
+{{
+  "warm_up": "description here",
+  "exercises": [
+    {{"name": "Exercise Name", "sets": 3, "reps": "8-10", "rest_sec": 60, "notes": "form cues"}},
+    {{"name": "Exercise Name", "sets": 3, "reps": "8-10", "rest_sec": 60, "notes": "form cues"}}
+  ],
+  "cool_down": "description here"
+}}"""
+    return prompt
+
+def generate_workout_cortex(client_id: str, client_data: dict):
+    """Generate workout using Cortex Prompt Complete (Legacy - single day)"""
+    try:
+        prompt = build_workout_prompt(client_data)
+        return complete_json(prompt), prompt
+    except Exception as e:
+        st.error(f"Error generating workout with Cortex: {str(e)}")
+        return None, None
+
+def build_meal_plan_prompt(client_data: dict):
+    """Build the 7-day meal plan prompt"""
+    fitness_goals = ', '.join(client_data['FITNESS_GOALS']) if isinstance(client_data['FITNESS_GOALS'], list) else client_data['FITNESS_GOALS']
+    dietary_prefs = ', '.join(client_data['DIETARY_PREFERENCES']) if isinstance(client_data['DIETARY_PREFERENCES'], list) else client_data['DIETARY_PREFERENCES']
+    
+    target_calories = client_data.get('TARGET_CALORIES') or 2000
+    target_protein = client_data.get('TARGET_PROTEIN_G') or 150
+    
+    prompt = f"""You are a sports nutritionist. Create a detailed 7-day meal plan for a client.
+
+Client Profile:
+- Target Daily Calories: {target_calories}
+- Target Protein: {target_protein}g
+- Dietary Preferences: {dietary_prefs}
+- Allergies/Restrictions: {client_data.get('ALLERGIES') or 'None'}
+- Fitness Goals: {fitness_goals}
+
+Generate a complete 7-day meal plan with:
+1. Daily meals (breakfast, lunch, dinner, snacks)
+2. Macronutrient targets per day
+3. Specific recipes or foods
+
+Format EXACTLY as this JSON structure (no extra text before or after):
+{{
+  "weekly_totals": {{"calories": {target_calories}, "protein": {target_protein}, "carbs": 200, "fat": 70}},
+  "days": [
+    {{
+      "day": 1,
+      "meals": [
+        {{"meal_type": "breakfast", "foods": ["food 1", "food 2"], "calories": 500, "protein": 30}},
+        {{"meal_type": "lunch", "foods": ["food 1", "food 2"], "calories": 600, "protein": 40}},
+        {{"meal_type": "dinner", "foods": ["food 1", "food 2"], "calories": 650, "protein": 45}},
+        {{"meal_type": "snacks", "foods": ["snack"], "calories": 250, "protein": 35}}
+      ]
+    }}
+  ]
+}}"""
+    return prompt
+
+def generate_meal_plan_cortex(client_data: dict):
+    """Generate meal plan using Cortex Prompt Complete"""
+    try:
+        prompt = build_meal_plan_prompt(client_data)
+        return decode_meal_plan(complete_json(prompt)), prompt
+    except Exception as e:
+        st.error(f"Error generating meal plan with Cortex: {str(e)}")
+        return None, None
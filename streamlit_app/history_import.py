@@ -0,0 +1,255 @@
+"""
+Bulk import of historical set logs and weigh-ins from CSV exports of other apps.
+
+An upload is read once, its headers are mapped onto our columns through the aliases
+below (so Strong / Hevy / spreadsheet exports load without editing), and every row is
+validated and normalized with vectorized pandas operations. Rows that fail validation
+are returned with a reason instead of being loaded. Exercise names are resolved to
+library ids once per distinct name; names the library does not know keep the name,
+as sets recorded on the Record Exercise Results page do.
+
+Loading is one write_pandas into a temporary landing table (Snowflake stages the
+frame as Parquet and runs COPY INTO) and one MERGE on the table's unique key, so a
+50k-row file is a handful of round trips, and importing the same file again updates
+rows instead of duplicating them.
+
+Imported sets have no generated workout. They are keyed to one "imported session"
+workout_id per client and date, derived from both, so re-imports hit the same keys.
+"""
+
+import io
+import re
+import uuid
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from data_access import generate_uuid, get_snowpark_session, invalidate_client_snapshot, log_event
+from exercise_index import resolve_exercise_id
+from progression import clear_recommendations
+
+LB_TO_KG = 0.45359237
+
+# Imported sessions' workout_id = uuid5(IMPORT_NAMESPACE, '<client_id>:<date>')
+IMPORT_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_OID, 'ai-personal-trainer/imported-session')
+
+# Dates accepted from an upload
+EARLIEST_DATE = pd.Timestamp('1990-01-01')
+
+WEIGHT_UNITS = ('kg', 'lb')
+
+# Our column -> header spellings seen in other apps' exports (compared lower-cased,
+# with anything but letters and digits turned into '_')
+RESULT_ALIASES = {
+    'performed_date': ['performed_date', 'date', 'workout_date', 'start_time', 'datetime', 'day'],
+    'exercise': ['exercise', 'exercise_name', 'exercise_title', 'exercise_id', 'movement', 'lift'],
+    'set_number': ['set_number', 'set', 'set_order', 'set_index', 'set_no'],
+    'reps': ['reps', 'repetitions', 'rep_count'],
+    'weight_kg': ['weight_kg', 'weight', 'load', 'load_kg', 'kg'],
+    'weight_lb': ['weight_lb', 'weight_lbs', 'lbs', 'lb', 'load_lb'],
+    'rpe': ['rpe'],
+    'rest_seconds': ['rest_seconds', 'rest_sec', 'rest', 'rest_time'],
+    'duration_seconds': ['duration_seconds', 'duration_sec', 'duration', 'seconds'],
+    'notes': ['notes', 'note', 'comments', 'comment'],
+}
+WEIGH_IN_ALIASES = {
+    'weigh_in_date': ['weigh_in_date', 'date', 'datetime', 'measured_at', 'day'],
+    'weight_kg': ['weight_kg', 'weight', 'body_weight', 'bodyweight', 'kg'],
+    'weight_lb': ['weight_lb', 'weight_lbs', 'lbs', 'lb'],
+    'body_fat_pct': ['body_fat_pct', 'body_fat', 'bodyfat', 'body_fat_percent', 'fat_pct'],
+    'notes': ['notes', 'note', 'comments', 'comment'],
+}
+
+class HistoryImportError(ValueError):
+    """An upload that cannot be imported at all (unreadable, or a required column is missing)"""
+
+# ============================================================================
+# Reading and Normalizing
+# ============================================================================
+
+def read_upload(data) -> pd.DataFrame:
+    """All columns of a CSV upload as text; the delimiter (',', ';', tab) is detected"""
+    if isinstance(data, bytes):
+        data = io.BytesIO(data)
+    try:
+        return pd.read_csv(data, sep=None, engine='python', dtype=str, keep_default_na=False,
+                           na_values=[''], encoding='utf-8-sig')
+    except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+        raise HistoryImportError(f"Could not read the file as CSV: {e}") from None
+
+def _map_columns(raw: pd.DataFrame, aliases: dict, required: list):
+    """Rename the upload's columns onto ours; the first matching alias wins"""
+    headers = {raw_name: re.sub(r'[^a-z0-9]+', '_', str(raw_name).lower()).strip('_') for raw_name in raw.columns}
+    renames = {}
+    for column, spellings in aliases.items():
+        for spelling in spellings:
+            match = next((raw_name for raw_name, header in headers.items()
+                          if header == spelling and raw_name not in renames), None)
+            if match is not None:
+                renames[match] = column
+                break
+    missing = [column for column in required if column not in renames.values()]
+    if missing:
+        raise HistoryImportError(f"Missing column(s): {', '.join(missing)}. Found: {', '.join(map(str, raw.columns))}")
+    frame = raw[list(renames)].rename(columns=renames).reset_index(drop=True)
+    for column in aliases:
+        if column not in frame:
+            frame[column] = None
+    return frame
+
+def _numbers(values: pd.Series):
+    """Numeric column from text; decimal commas and unit suffixes ('80 kg', '2,5') are accepted"""
+    text = values.astype('string').str.strip().str.replace(',', '.', regex=False)
+    return pd.to_numeric(text.str.extract(r'^([-+]?\d*\.?\d+)', expand=False), errors='coerce')
+
+def _dates(values: pd.Series):
+    return pd.to_datetime(values, errors='coerce', format='mixed').dt.normalize()
+
+def _weights(frame: pd.DataFrame, weight_unit: str):
+    """Weight in kg from the weight column (in `weight_unit`) or an explicit pounds column"""
+    weight = _numbers(frame['weight_kg'])
+    if weight_unit == 'lb':
+        weight = weight * LB_TO_KG
+    return weight.fillna(_numbers(frame['weight_lb']) * LB_TO_KG).round(3)
+
+def _split_rejected(frame: pd.DataFrame, checks: dict):
+    """(valid rows, rejected rows with their CSV line and the first failed check as the reason)"""
+    masks = [np.asarray(mask.fillna(False), dtype=bool) for mask in checks.values()]
+    reasons = pd.Series(np.select(masks, list(checks), default=''), index=frame.index)
+    failed = reasons != ''
+    # Line 1 is the header
+    rejected = pd.DataFrame({'line': frame.index[failed] + 2, 'reason': reasons[failed].to_numpy()})
+    return frame[~failed], rejected
+
+def normalize_results(raw: pd.DataFrame, weight_unit: str = 'kg'):
+    """Validated exercise_results rows from an upload: (rows, rejected)"""
+    frame = _map_columns(raw, RESULT_ALIASES, ['performed_date', 'exercise'])
+    today = pd.Timestamp(date.today())
+    out = pd.DataFrame({
+        'performed_date': _dates(frame['performed_date']),
+        'exercise': frame['exercise'].astype('string').str.strip(),
+        'set_number': _numbers(frame['set_number']),
+        'reps': _numbers(frame['reps']),
+        'weight_kg': _weights(frame, weight_unit),
+        'rpe': _numbers(frame['rpe']),
+        'rest_seconds': _numbers(frame['rest_seconds']),
+        'duration_seconds': _numbers(frame['duration_seconds']),
+        'notes': frame['notes'].astype('string').str.strip().replace('', pd.NA),
+    })
+    # Timed sets (runs, holds) without reps count as one rep, like the app's own cardio entries
+    out.loc[out['reps'].isna() & out['duration_seconds'].notna(), 'reps'] = 1
+
+    rows, rejected = _split_rejected(out, {
+        'invalid date': out['performed_date'].isna(),
+        'date out of range': (out['performed_date'] < EARLIEST_DATE) | (out['performed_date'] > today),
+        'missing exercise': out['exercise'].isna() | (out['exercise'] == ''),
+        'missing reps': out['reps'].isna(),
+        'reps out of range': (out['reps'] < 0) | (out['reps'] > 1000),
+        'weight out of range': (out['weight_kg'] < 0) | (out['weight_kg'] > 1000),
+        'rpe out of range': (out['rpe'] < 0) | (out['rpe'] > 10),
+    })
+    rows = rows.copy()
+    # Sets numbered in file order when the export has no set column; 0-based set indexes shifted to 1
+    sets = rows.groupby(['performed_date', 'exercise'], sort=False)
+    rows['set_number'] = rows['set_number'].fillna(sets.cumcount() + 1)
+    rows['set_number'] += (sets['set_number'].transform('min') == 0).astype(int)
+
+    # One resolution per distinct name; names the library does not know are kept as they are
+    names = rows['exercise'].unique()
+    resolved = {name: resolve_exercise_id(name, name) or name for name in names}
+    rows['exercise_id'] = rows.pop('exercise').map(resolved)
+    rows.attrs['unresolved'] = sorted(name for name, exercise_id in resolved.items() if exercise_id == name)
+    return rows, rejected
+
+def normalize_weigh_ins(raw: pd.DataFrame, weight_unit: str = 'kg'):
+    """Validated weigh_ins rows from an upload: (rows, rejected)"""
+    frame = _map_columns(raw, WEIGH_IN_ALIASES, ['weigh_in_date'])
+    today = pd.Timestamp(date.today())
+    out = pd.DataFrame({
+        'weigh_in_date': _dates(frame['weigh_in_date']),
+        'weight_kg': _weights(frame, weight_unit),
+        'body_fat_pct': _numbers(frame['body_fat_pct']).round(2),
+        'notes': frame['notes'].astype('string').str.strip().replace('', pd.NA),
+    })
+    return _split_rejected(out, {
+        'invalid date': out['weigh_in_date'].isna(),
+        'date out of range': (out['weigh_in_date'] < EARLIEST_DATE) | (out['weigh_in_date'] > today),
+        'missing weight': out['weight_kg'].isna(),
+        'weight out of range': (out['weight_kg'] < 20) | (out['weight_kg'] > 400),
+        'body fat out of range': (out['body_fat_pct'] < 1) | (out['body_fat_pct'] > 70),
+    })
+
+# ============================================================================
+# Loading
+# ============================================================================
+
+def _merge(table: str, id_column: str, keys: list, rows: pd.DataFrame):
+    """Land `rows` in a temporary table with write_pandas, then MERGE them on `keys`;
+    returns {'inserted': n, 'updated': n, 'duplicates': n}. Rows repeating a key within
+    the upload count as duplicates, and the last one wins."""
+    deduped = rows.drop_duplicates(keys, keep='last')
+    duplicates = len(rows) - len(deduped)
+    session = get_snowpark_session()
+    landing = f"IMPORT_{table}_{uuid.uuid4().hex[:8]}".upper()
+    rows = deduped.assign(**{id_column: [generate_uuid() for _ in range(len(deduped))]})
+    rows.columns = [column.upper() for column in rows.columns]
+    columns = [column.lower() for column in rows.columns]
+    session.write_pandas(rows, landing, auto_create_table=True, table_type='temporary', overwrite=True,
+                         quote_identifiers=False)
+    try:
+        on = ' AND '.join(f"t.{key} = s.{key}" for key in keys)
+        updated = session.sql(f"""
+        SELECT COUNT(*) FROM {landing} s JOIN TRAINING_DB.PUBLIC.{table} t ON {on}
+        """).collect()[0][0]
+        changed = [column for column in columns if column not in keys and column != id_column]
+        session.sql(f"""
+        MERGE INTO TRAINING_DB.PUBLIC.{table} t
+        USING {landing} s
+        ON {on}
+        WHEN MATCHED THEN UPDATE SET {', '.join(f"{column} = s.{column}" for column in changed)}
+        WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({', '.join(f"s.{column}" for column in columns)})
+        """).collect()
+    finally:
+        session.sql(f"DROP TABLE IF EXISTS {landing}").collect()
+    return {'inserted': len(rows) - int(updated), 'updated': int(updated), 'duplicates': duplicates}
+
+def import_exercise_results(client_id: str, rows: pd.DataFrame):
+    """Merge normalized set rows into exercise_results on (client, workout, exercise, set)"""
+    if rows.empty:
+        return {'inserted': 0, 'updated': 0, 'duplicates': 0}
+    rows = rows.copy()
+    dates = rows['performed_date'].dt.date
+    sessions = {day: str(uuid.uuid5(IMPORT_NAMESPACE, f"{client_id}:{day}")) for day in dates.unique()}
+    rows.insert(0, 'workout_id', dates.map(sessions))
+    rows.insert(0, 'client_id', client_id)
+    rows['performed_date'] = dates
+    for column in ('set_number', 'reps', 'rest_seconds', 'duration_seconds'):
+        rows[column] = rows[column].round().astype('Int64')
+    keys = ['client_id', 'workout_id', 'exercise_id', 'set_number']
+    counts = _merge('exercise_results', 'result_id', keys, rows)
+    invalidate_client_snapshot(client_id)
+    clear_recommendations(client_id)
+    log_event('exercise_results_imported', client_id=client_id,
+              message=f"{counts['inserted']} set(s) imported, {counts['updated']} updated")
+    return counts
+
+def import_weigh_ins(client_id: str, rows: pd.DataFrame):
+    """Merge normalized weigh-in rows into weigh_ins on (client, date)"""
+    if rows.empty:
+        return {'inserted': 0, 'updated': 0, 'duplicates': 0}
+    rows = rows.copy()
+    rows.insert(0, 'client_id', client_id)
+    rows['weigh_in_date'] = rows['weigh_in_date'].dt.date
+    keys = ['client_id', 'weigh_in_date']
+    counts = _merge('weigh_ins', 'weigh_in_id', keys, rows)
+    invalidate_client_snapshot(client_id)
+    log_event('weigh_ins_imported', client_id=client_id,
+              message=f"{counts['inserted']} weigh-in(s) imported, {counts['updated']} updated")
+    return counts
+
+# Upload kind -> (label, normalizer, loader)
+IMPORTS = {
+    'exercise_results': ("Set logs", normalize_results, import_exercise_results),
+    'weigh_ins': ("Weigh-ins", normalize_weigh_ins, import_weigh_ins),
+}
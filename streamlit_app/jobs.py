@@ -0,0 +1,411 @@
+"""
+Background generation jobs for workouts and meal plans.
+
+Pages enqueue a row in generation_jobs and return immediately. A worker claims the
+job, runs Cortex, saves the plan and records the outcome; pages poll the row and show
+the result whenever it lands, so a page switch neither blocks on nor loses the work.
+The worker is an in-process thread pool; TASK_PROCESS_GENERATION_JOBS (sql/08) runs
+anything left queued in the warehouse and hands the responses back to finish_warehouse_jobs.
+"""
+
+import streamlit as st
+import pandas as pd
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from data_access import (bind_sql, generate_uuid, invalidate_client_snapshot, log_event, save_meal_plan,
+                         save_weekly_workouts, update_workout_days)
+from exercise_index import resolve_week_exercises
+from meal_planner import PLANNER_MODEL, describe_plan, plan_meals
+from periodization import RULES_MODEL, build_week, describe_program
+from progression import get_recommendations
+from generation import CORTEX_MODEL, build_day_regeneration_prompt, build_full_week_prompt, complete_json
+from models import PLAN_DECODERS, PlanValidationError, WeekPlan, decode_week
+
+JOB_KINDS = ('workout_week', 'meal_plan')
+PENDING_STATUSES = ('QUEUED', 'RUNNING')
+
+# Threads available to run Cortex generations in the app process (0 = leave all jobs to the task)
+JOB_WORKERS = 2
+POLL_INTERVAL_S = 2
+
+# Single-flight guard: one enqueue at a time per (client_id, kind, week, start_date, model) in this process
+_key_locks = {}
+_key_locks_guard = threading.Lock()
+
+# ============================================================================
+# Queue
+# ============================================================================
+
+def _pending_key(client_id: str, kind: str):
+    return f"jobs_pending_{kind}_{client_id}"
+
+def _focus_key(client_id: str, kind: str):
+    return f"jobs_focus_{kind}_{client_id}"
+
+def _key_lock(key: tuple):
+    with _key_locks_guard:
+        return _key_locks.setdefault(key, threading.Lock())
+
+def _same_job_sql(client_id: str, kind: str, week: int, start_date, model: str, statuses):
+    """Condition matching the same job in one of `statuses`, and its bind parameters"""
+    return f"""
+    client_id = ? AND job_kind = ? AND plan_week = ? AND start_date = ?
+    AND cortex_model = ? AND status IN ({', '.join('?' * len(statuses))})
+    """, [client_id, kind, int(week), str(start_date), model, *statuses]
+
+def find_job(client_id: str, kind: str, week: int, start_date, model: str,
+             statuses=PENDING_STATUSES + ('SUCCEEDED',)):
+    """Id of the newest job for the same client, kind, week, start date and model in one of `statuses`"""
+    same_job, params = _same_job_sql(client_id, kind, week, start_date, model, statuses)
+    rows = bind_sql(f"""
+    SELECT job_id
+    FROM TRAINING_DB.PUBLIC.generation_jobs
+    WHERE {same_job}
+    ORDER BY created_at DESC
+    LIMIT 1
+    """, params).collect()
+    return rows[0][0] if rows else None
+
+@st.cache_resource
+def get_job_executor():
+    """Process-wide worker pool shared by all sessions"""
+    return ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='generation-job')
+
+def create_job(client_id: str, kind: str, client_data: dict, week: int, start_date,
+               reuse_result: bool = True, origin: str = 'app', model: str = CORTEX_MODEL):
+    """Insert a QUEUED job unless an identical one exists; returns (job_id, created)
+
+    Requests are coalesced on (client_id, kind, week, start_date, model): while an identical job
+    is queued or running - or has already succeeded, unless `reuse_result` is False - its
+    id is returned instead of paying for another Cortex call and save. `model` is the
+    Cortex model, or RULES_MODEL for a rule-based (instant) workout week; meal plans are
+    always built by the recipe planner and recorded as PLANNER_MODEL.
+    """
+    if kind == 'meal_plan':
+        model = PLANNER_MODEL
+    statuses = PENDING_STATUSES + (('SUCCEEDED',) if reuse_result else ())
+    with _key_lock((client_id, kind, int(week), str(start_date), model)):
+        job_id = find_job(client_id, kind, week, start_date, model, statuses)
+        if job_id:
+            return job_id, False
+
+        if kind == 'workout_week' and model == RULES_MODEL:
+            prompt = describe_program(client_data, week)
+        elif kind == 'workout_week':
+            prompt = build_full_week_prompt(client_id, client_data, week)
+        else:
+            prompt = describe_plan(client_data)
+
+        # Conditional insert so app instances racing on the same key still queue one job
+        new_job_id = generate_uuid()
+        same_job, params = _same_job_sql(client_id, kind, week, start_date, model, statuses)
+        bind_sql(f"""
+        INSERT INTO TRAINING_DB.PUBLIC.generation_jobs
+        (job_id, client_id, job_kind, plan_week, start_date, status, prompt, cortex_model, origin)
+        SELECT ?, ?, ?, ?, ?, 'QUEUED', ?, ?, ?
+        WHERE NOT EXISTS (
+            SELECT 1 FROM TRAINING_DB.PUBLIC.generation_jobs
+            WHERE {same_job}
+        )
+        """, [new_job_id, client_id, kind, int(week), str(start_date), prompt, model, origin, *params]).collect()
+        job_id = find_job(client_id, kind, week, start_date, model, statuses)
+        return job_id, job_id == new_job_id
+
+def enqueue_job(client_id: str, kind: str, client_data: dict, week: int, start_date, reuse_result: bool = True,
+                model: str = CORTEX_MODEL):
+    """Queue a generation for the trainer and hand it to the worker pool; returns (job_id, created)"""
+    try:
+        job_id, created = create_job(client_id, kind, client_data, week, start_date, reuse_result=reuse_result,
+                                     model=model)
+        if created and (kind == 'meal_plan' or model == RULES_MODEL):
+            # Built locally in well under a second (recipe planner / periodization), so run now rather than queue
+            run_job(job_id)
+        elif created and JOB_WORKERS:
+            get_job_executor().submit(run_job, job_id)
+
+        st.session_state[_pending_key(client_id, kind)] = True
+        st.session_state[_focus_key(client_id, kind)] = job_id
+        return job_id, created
+    except Exception as e:
+        st.error(f"Error queueing generation: {str(e)}")
+        return None, False
+
+def get_client_jobs(client_id: str, kind: str, limit: int = 5, focus_job_id: str = None):
+    """Most recent generation jobs of one kind for a client, `focus_job_id` (if any) first"""
+    try:
+        return bind_sql(f"""
+        SELECT job_id, job_kind, plan_week, start_date, status, result, error_message, created_at, finished_at
+        FROM TRAINING_DB.PUBLIC.generation_jobs
+        WHERE client_id = ? AND job_kind = ?
+        ORDER BY job_id = ? DESC, created_at DESC
+        LIMIT {int(limit)}
+        """, [client_id, kind, str(focus_job_id)]).to_pandas()
+    except Exception as e:
+        st.error(f"Error fetching generation jobs: {str(e)}")
+        return pd.DataFrame()
+
+# ============================================================================
+# Worker
+# ============================================================================
+
+def _client_row(client_id: str):
+    """The client's row as a dict (upper-case column names, as the prompt builders expect)"""
+    return bind_sql("""
+    SELECT * FROM TRAINING_DB.PUBLIC.clients WHERE client_id = ?
+    """, [client_id]).to_pandas().iloc[0].to_dict()
+
+def _finish_job(job_id: str, status: str, result: dict = None, error_message: str = None):
+    bind_sql("""
+    UPDATE TRAINING_DB.PUBLIC.generation_jobs
+    SET status = ?, result = PARSE_JSON(?), error_message = ?, finished_at = CURRENT_TIMESTAMP
+    WHERE job_id = ?
+    """, [status, json.dumps(result) if result is not None else None,
+          error_message[:2000] if error_message else None, job_id]).collect()
+
+def run_job(job_id: str, worker: str = 'app'):
+    """Claim a queued job, generate and save the plan; returns False if another worker owns it"""
+    claimed = bind_sql("""
+    UPDATE TRAINING_DB.PUBLIC.generation_jobs
+    SET status = 'RUNNING', worker = ?, started_at = CURRENT_TIMESTAMP
+    WHERE job_id = ? AND status = 'QUEUED'
+    """, [worker, job_id]).collect()
+    if not claimed or claimed[0][0] == 0:
+        return False
+
+    job = bind_sql("SELECT * FROM TRAINING_DB.PUBLIC.generation_jobs WHERE job_id = ?", [job_id]).collect()[0]
+    _complete_job(job)
+    return True
+
+def _complete_job(job, response=None):
+    """Build (or decode `response`, a completion the warehouse already ran), save and record a claimed job's plan"""
+    job_id = job['JOB_ID']
+    # Scheduled pre-generations are saved as drafts for the trainer to review
+    plan_status = 'DRAFT' if job['ORIGIN'] == 'schedule' else 'ACTIVE'
+    try:
+        # Validated before anything is saved, so a malformed response fails the job rather than a half-written plan
+        if job['JOB_KIND'] == 'workout_week' and job['CORTEX_MODEL'] == RULES_MODEL:
+            plan = build_week(_client_row(job['CLIENT_ID']), int(job['PLAN_WEEK']),
+                              recommendations=get_recommendations(job['CLIENT_ID']))
+            saved = save_weekly_workouts(job['CLIENT_ID'], plan, job['PROMPT'], start_date=job['START_DATE'],
+                                         job_id=job_id, plan_status=plan_status, model=RULES_MODEL)
+        elif job['JOB_KIND'] == 'workout_week':
+            if response is None:
+                response = complete_json(job['PROMPT'], job['CORTEX_MODEL'])
+            plan = resolve_week_exercises(decode_week(response, int(job['PLAN_WEEK'])))
+            saved = save_weekly_workouts(job['CLIENT_ID'], plan, job['PROMPT'], start_date=job['START_DATE'],
+                                         job_id=job_id, plan_status=plan_status)
+        else:
+            # Meal plans come from the recipe planner; the warehouse sweep never runs them (sql/08)
+            plan = plan_meals(_client_row(job['CLIENT_ID']), seed=job_id)
+            saved = save_meal_plan(job['CLIENT_ID'], plan, job['PROMPT'], int(job['PLAN_WEEK']), start_date=job['START_DATE'],
+                                   job_id=job_id, plan_status=plan_status, model=PLANNER_MODEL)
+        if not saved:
+            raise RuntimeError("Generated plan could not be saved")
+        _finish_job(job_id, 'SUCCEEDED', result=plan.to_dict())
+    except Exception as e:
+        _finish_job(job_id, 'FAILED', error_message=str(e))
+        log_event('generation_job_failed', client_id=job['CLIENT_ID'], message=f"Job {job_id} failed: {str(e)}")
+
+def finish_warehouse_jobs(claim: str):
+    """Validate, resolve and save the completions process_generation_jobs (sql/08) stored for `claim`
+
+    The warehouse runs Cortex for the whole batch in one statement; each response then
+    goes through the same decode_week / resolve_week_exercises path as the app's own
+    workers, so shortlist codes are saved as library ids and a malformed week fails its
+    job instead of being written. Returns the number of jobs finished.
+    """
+    claimed = bind_sql("""
+    SELECT * FROM TRAINING_DB.PUBLIC.generation_jobs
+    WHERE worker = ? AND status = 'RUNNING'
+    """, [claim]).collect()
+    for job in claimed:
+        # RESULT is NULL when the completion held no parseable JSON object; the decoder rejects it as such
+        _complete_job(job, response=job['RESULT'] if job['RESULT'] is not None else '')
+    return len(claimed)
+
+def main(session, claim: str):
+    """Stored procedure handler (finish_generation_jobs, sql/08); the Snowpark session is picked up through get_snowpark_session()"""
+    return f"{finish_warehouse_jobs(claim)} job(s) processed"
+
+def regenerate_days(job_id: str, days: list):
+    """Regenerate selected days of a finished workout week and update only those rows; returns the days replaced
+
+    One small completion with the rest of the week as context, instead of a full-week
+    generation. The job's stored result is patched too, so the revised week is what
+    later (coalesced) requests show.
+    """
+    try:
+        job = bind_sql("""
+        SELECT j.client_id, j.plan_week, j.start_date, j.result,
+               (SELECT MAX(w.plan_status) FROM TRAINING_DB.PUBLIC.generated_workouts w WHERE w.job_id = j.job_id) AS plan_status
+        FROM TRAINING_DB.PUBLIC.generation_jobs j
+        WHERE j.job_id = ? AND j.job_kind = 'workout_week' AND j.status = 'SUCCEEDED'
+        """, [job_id]).collect()
+        if not job or job[0]['PLAN_STATUS'] is None:
+            st.error("This week's saved workouts no longer exist - generate a new week instead.")
+            return []
+        job = job[0]
+        client_data = _client_row(job['CLIENT_ID'])
+        week_plan = decode_week(job['RESULT'], int(job['PLAN_WEEK']))
+        
+        prompt = build_day_regeneration_prompt(client_data, week_plan, days)
+        response = decode_week(complete_json(prompt), week_plan.week)
+        new_days = [day_plan for day_plan in response.days if day_plan.day in days]
+        if not new_days:
+            raise ValueError("The response did not contain any of the requested days")
+        
+        new_week = resolve_week_exercises(WeekPlan(week=week_plan.week, days=new_days))
+        saved = update_workout_days(job['CLIENT_ID'], job_id, new_week, prompt,
+                                    start_date=job['START_DATE'], plan_status=job['PLAN_STATUS'])
+        if not saved:
+            raise RuntimeError("Regenerated days could not be saved")
+        
+        week_plan = week_plan.with_days(new_days)
+        bind_sql("""
+        UPDATE TRAINING_DB.PUBLIC.generation_jobs
+        SET result = PARSE_JSON(?)
+        WHERE job_id = ?
+        """, [json.dumps(week_plan.to_dict()), job_id]).collect()
+        replaced = [day_plan.day for day_plan in new_days]
+        log_event('workout_days_regenerated', client_id=job['CLIENT_ID'],
+                  message=f"Job {job_id}: days {', '.join(str(day) for day in replaced)} regenerated")
+        return replaced
+    except Exception as e:
+        st.error(f"Error regenerating days: {str(e)}")
+        return []
+
+# ============================================================================
+# Draft Review
+# ============================================================================
+
+PLAN_TABLES = {'workout_week': 'generated_workouts', 'meal_plan': 'meal_plans'}
+
+def get_draft_jobs(client_id: str, kind: str):
+    """Pre-generated plans for a client whose saved rows are still DRAFT"""
+    try:
+        return bind_sql(f"""
+        SELECT j.job_id, j.plan_week, j.start_date, j.result, j.finished_at
+        FROM TRAINING_DB.PUBLIC.generation_jobs j
+        WHERE j.client_id = ? AND j.job_kind = ? AND j.status = 'SUCCEEDED'
+          AND EXISTS (
+            SELECT 1 FROM TRAINING_DB.PUBLIC.{PLAN_TABLES[kind]} p
+            WHERE p.job_id = j.job_id AND p.plan_status = 'DRAFT'
+          )
+        ORDER BY j.start_date
+        """, [client_id, kind]).to_pandas()
+    except Exception as e:
+        st.error(f"Error fetching draft plans: {str(e)}")
+        return pd.DataFrame()
+
+def approve_draft(client_id: str, kind: str, job_id: str):
+    """Make a pre-generated plan live"""
+    try:
+        bind_sql(f"""
+        UPDATE TRAINING_DB.PUBLIC.{PLAN_TABLES[kind]}
+        SET plan_status = 'ACTIVE'
+        WHERE job_id = ? AND plan_status = 'DRAFT'
+        """, [job_id]).collect()
+        log_event('draft_plan_approved', client_id=client_id, message=f"{kind} draft from job {job_id} approved")
+        return True
+    except Exception as e:
+        st.error(f"Error approving draft: {str(e)}")
+        return False
+
+def discard_draft(client_id: str, kind: str, job_id: str):
+    """Delete a pre-generated plan the trainer rejected"""
+    try:
+        bind_sql(f"""
+        DELETE FROM TRAINING_DB.PUBLIC.{PLAN_TABLES[kind]}
+        WHERE job_id = ? AND plan_status = 'DRAFT'
+        """, [job_id]).collect()
+        invalidate_client_snapshot(client_id)
+        log_event('draft_plan_discarded', client_id=client_id, message=f"{kind} draft from job {job_id} discarded")
+        return True
+    except Exception as e:
+        st.error(f"Error discarding draft: {str(e)}")
+        return False
+
+# ============================================================================
+# Status UI
+# ============================================================================
+
+# Decoded plans kept per session; older entries are dropped beyond this many
+DECODED_PLANS_KEPT = 20
+
+def decoded_plan(kind: str, job):
+    """Typed plan for a finished job, decoded once per session for each version of its result"""
+    raw = job['RESULT'] if isinstance(job['RESULT'], str) else json.dumps(job['RESULT'], sort_keys=True)
+    cache = st.session_state.setdefault('decoded_plans', {})
+    cache_key = (job['JOB_ID'], hash(raw))
+    if cache_key not in cache:
+        try:
+            cache[cache_key] = PLAN_DECODERS[kind](raw)
+        except PlanValidationError as e:
+            st.warning(f"Saved plan could not be displayed: {str(e)}")
+            return None
+        while len(cache) > DECODED_PLANS_KEPT:
+            cache.pop(next(iter(cache)))
+    return cache[cache_key]
+
+def job_status(client_id: str, kind: str, render_result):
+    """Show the requested (or latest) job for a client; polls while a job is pending and renders its result when it lands"""
+    pending_key = _pending_key(client_id, kind)
+    focus_key = _focus_key(client_id, kind)
+
+    @st.fragment(run_every=POLL_INTERVAL_S if st.session_state.get(pending_key) else None)
+    def status_panel():
+        jobs_df = get_client_jobs(client_id, kind, focus_job_id=st.session_state.get(focus_key))
+        if jobs_df.empty:
+            return
+
+        pending = bool(jobs_df['STATUS'].isin(PENDING_STATUSES).any())
+        if pending != bool(st.session_state.get(pending_key)):
+            # Start or stop polling (and refresh the rest of the page once the job lands)
+            st.session_state[pending_key] = pending
+            st.rerun()
+
+        latest = jobs_df.iloc[0]
+        if latest['STATUS'] in PENDING_STATUSES:
+            st.info(f"⏳ Week {latest['PLAN_WEEK']} is {latest['STATUS'].lower()} (queued {latest['CREATED_AT']:%H:%M:%S}). "
+                    "You can leave this page - the plan is saved when it lands.")
+        elif latest['STATUS'] == 'FAILED':
+            st.error(f"Generation for week {latest['PLAN_WEEK']} failed: {latest['ERROR_MESSAGE']}")
+        else:
+            st.success(f"✅ Week {latest['PLAN_WEEK']} generated and saved ({latest['START_DATE']} onwards)")
+            plan = decoded_plan(kind, latest)
+            if plan:
+                render_result(plan, latest, key=f"status_{latest['JOB_ID']}")
+
+        if len(jobs_df) > 1:
+            with st.expander("Recent generations"):
+                st.dataframe(
+                    jobs_df[['PLAN_WEEK', 'START_DATE', 'STATUS', 'CREATED_AT', 'FINISHED_AT', 'ERROR_MESSAGE']],
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+    status_panel()
+
+def draft_review(client_id: str, kind: str, render_result):
+    """List pre-generated drafts for a client with approve / discard actions"""
+    drafts_df = get_draft_jobs(client_id, kind)
+    if drafts_df.empty:
+        return
+
+    st.markdown(f"### 📝 Drafts Awaiting Review ({len(drafts_df)})")
+    st.caption("Generated overnight for the coming week. Approve to publish, or discard and generate a new version.")
+    for _, draft in drafts_df.iterrows():
+        with st.expander(f"Week {draft['PLAN_WEEK']} starting {draft['START_DATE']}"):
+            col1, col2 = st.columns(2)
+            if col1.button("✅ Approve", key=f"approve_{draft['JOB_ID']}", use_container_width=True):
+                if approve_draft(client_id, kind, draft['JOB_ID']):
+                    st.rerun()
+            if col2.button("🗑️ Discard", key=f"discard_{draft['JOB_ID']}", use_container_width=True):
+                if discard_draft(client_id, kind, draft['JOB_ID']):
+                    st.rerun()
+            plan = decoded_plan(kind, draft)
+            if plan:
+                render_result(plan, draft, key=f"draft_{draft['JOB_ID']}")
+    st.divider()
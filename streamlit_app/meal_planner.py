@@ -0,0 +1,205 @@
+"""
+Recipe-based meal planner: builds 7-day meal plans from the recipes table.
+
+Asking Cortex for a meal plan is slow and the totals it returns rarely add up. The
+planner instead picks one recipe per meal slot for each day so the day's calories and
+protein land on the client's targets. Every slot combination of the day's candidate
+recipes is scored in one vectorised pass. All of a day's meals share one portion size
+(in 0.05-serving steps), chosen to match the calorie target. Recipes that break the
+client's dietary preferences or allergies are never considered, and recipes already
+used earlier in the week are penalised so the days vary. The macros shown are the
+recipes' own values times the portion, so per-meal, daily and weekly figures always
+agree.
+"""
+
+import streamlit as st
+import re
+import zlib
+import numpy as np
+
+from data_access import bind_sql, variant_list
+from models import MacroTotals, Meal, MealDay, MealPlan
+
+# Meal slots in order, with the recipe tags that may fill each one
+MEAL_SLOTS = (
+    ('breakfast', ('breakfast',)),
+    ('lunch', ('lunch', 'dinner')),
+    ('dinner', ('dinner', 'lunch')),
+    ('snacks', ('snack',)),
+)
+
+# Recorded as the generating model on planner-built meal_plans rows
+PLANNER_MODEL = 'recipe-planner'
+
+# Targets used when a client has none recorded (same as the Cortex prompt)
+DEFAULT_TARGET_CALORIES = 2000
+DEFAULT_TARGET_PROTEIN_G = 150
+
+# Candidate recipes per slot each day; combinations scored = this ** len(MEAL_SLOTS)
+CANDIDATES_PER_SLOT = 12
+
+# Portion sizes a day may be scaled to, and the step they are rounded to
+PORTION_RANGE = (0.6, 1.8)
+PORTION_STEP = 0.05
+
+# Score weights: relative calorie error, relative protein shortfall / excess,
+# distance of the portion from one serving, and each earlier use of a recipe this week
+CALORIE_WEIGHT = 4.0
+PROTEIN_SHORT_WEIGHT = 2.0
+PROTEIN_OVER_WEIGHT = 0.5
+PORTION_WEIGHT = 0.1
+REPEAT_WEIGHT = 0.15
+
+# Free-text allergy words mapped onto the recipes' contains:<allergen> tags
+ALLERGEN_ALIASES = {
+    'nut': 'nuts', 'peanut': 'nuts', 'peanuts': 'nuts', 'tree nuts': 'nuts', 'almond': 'nuts', 'almonds': 'nuts',
+    'milk': 'dairy', 'lactose': 'dairy', 'cheese': 'dairy',
+    'eggs': 'egg',
+    'wheat': 'gluten', 'coeliac': 'gluten', 'celiac': 'gluten',
+    'shrimp': 'shellfish', 'prawn': 'shellfish', 'prawns': 'shellfish', 'crab': 'shellfish', 'lobster': 'shellfish',
+    'soya': 'soy', 'tofu': 'soy',
+}
+NO_RESTRICTION = {'', 'none', 'n/a', 'na', 'no', 'nil'}
+
+class MealPlanningError(ValueError):
+    """No meal plan can be built for the client's restrictions from the recipes available"""
+
+def _target(value, default: int):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if np.isnan(value) or value <= 0 else value
+
+def parse_allergies(allergies):
+    """Allergen words from the free-text allergies field: 'Peanuts and milk' -> {'nuts', 'dairy'}"""
+    words = set()
+    for part in re.split(r'[,;/&]|\band\b', str(allergies or '').lower()):
+        part = re.sub(r'\b(allergy|allergies|allergic|intolerance|intolerant|free)\b', '', part).strip(' .-')
+        if part not in NO_RESTRICTION:
+            words.add(ALLERGEN_ALIASES.get(part, part))
+    return words
+
+class RecipeBook:
+    """Recipe macros and tags as arrays, for filtering and scoring meal slot combinations"""
+
+    def __init__(self, recipes):
+        """`recipes`: recipes rows as dicts (recipe_id, recipe_name, total_calories, protein_g,
+        carbs_g, fat_g, ingredients, tags)"""
+        self.recipes = [dict(recipe) for recipe in recipes]
+        self.tags = [frozenset(tag.lower() for tag in variant_list(recipe.get('tags'))) for recipe in self.recipes]
+        self.ingredients = [' '.join(variant_list(recipe.get('ingredients'))).lower() for recipe in self.recipes]
+        self.known_tags = frozenset().union(*self.tags) if self.tags else frozenset()
+        # Columns: calories, protein, carbs, fat for one serving
+        self.macros = np.array([
+            [float(recipe.get(key) or 0) / max(float(recipe.get('servings') or 1), 1)
+             for key in ('total_calories', 'protein_g', 'carbs_g', 'fat_g')]
+            for recipe in self.recipes
+        ]).reshape(len(self.recipes), 4)
+
+    def allowed(self, dietary_preferences, allergies):
+        """Boolean mask of recipes that fit every dietary preference and contain no listed allergen"""
+        required = {pref.strip().lower().replace(' ', '-') for pref in variant_list(dietary_preferences)}
+        required = {tag for tag in required - NO_RESTRICTION if tag in self.known_tags}
+        allergens = parse_allergies(allergies)
+        return np.array([
+            required <= tags
+            and not any(f"contains:{allergen}" in tags or allergen in ingredients for allergen in allergens)
+            for tags, ingredients in zip(self.tags, self.ingredients)
+        ], dtype=bool)
+
+    def slot_pools(self, allowed):
+        """Indices of the allowed recipes for each meal slot"""
+        pools = []
+        for slot, slot_tags in MEAL_SLOTS:
+            pool = np.flatnonzero(allowed & np.array([bool(tags & set(slot_tags)) for tags in self.tags], dtype=bool))
+            if not len(pool):
+                raise MealPlanningError(f"No {slot} recipes fit the client's dietary preferences and allergies")
+            pools.append(pool)
+        return pools
+
+    def plan_day(self, pools, target_calories: float, target_protein: float, uses, rng):
+        """Best (recipe per slot, portion) for one day given how often each recipe was used so far"""
+        # Narrow each slot to its most protein-dense, least-used recipes (with a little jitter for variety)
+        density = self.macros[:, 1] / np.maximum(self.macros[:, 0], 1)
+        candidates = []
+        for pool in pools:
+            score = density[pool] / density[pool].max() - REPEAT_WEIGHT * uses[pool] + rng.uniform(0, 0.2, len(pool))
+            candidates.append(pool[np.argsort(-score, kind='stable')[:CANDIDATES_PER_SLOT]])
+
+        # Every combination of one candidate per slot: shape (combinations, slots)
+        combos = np.stack(np.meshgrid(*candidates, indexing='ij'), axis=-1).reshape(-1, len(candidates))
+        calories = self.macros[combos, 0].sum(axis=1)
+        protein = self.macros[combos, 1].sum(axis=1)
+
+        portion = np.clip(target_calories / np.maximum(calories, 1), *PORTION_RANGE)
+        portion = np.round(portion / PORTION_STEP) * PORTION_STEP
+        calorie_error = np.abs(portion * calories - target_calories) / target_calories
+        protein_gap = (portion * protein - target_protein) / target_protein
+        loss = (CALORIE_WEIGHT * calorie_error
+                + PROTEIN_SHORT_WEIGHT * np.maximum(-protein_gap, 0)
+                + PROTEIN_OVER_WEIGHT * np.maximum(protein_gap, 0)
+                + PORTION_WEIGHT * np.abs(portion - 1)
+                + REPEAT_WEIGHT * uses[combos].sum(axis=1))
+        # The same recipe twice in one day (lunch and dinner share a pool) is never chosen
+        sorted_combos = np.sort(combos, axis=1)
+        loss[(sorted_combos[:, 1:] == sorted_combos[:, :-1]).any(axis=1)] = np.inf
+
+        best = int(np.argmin(loss))
+        if not np.isfinite(loss[best]):
+            raise MealPlanningError("Not enough distinct recipes to fill a day")
+        return combos[best], float(portion[best])
+
+    def plan_week(self, client_data: dict, seed=None, days: int = 7):
+        """7-day MealPlan for a client row, hitting TARGET_CALORIES / TARGET_PROTEIN_G each day"""
+        target_calories = _target(client_data.get('TARGET_CALORIES'), DEFAULT_TARGET_CALORIES)
+        target_protein = _target(client_data.get('TARGET_PROTEIN_G'), DEFAULT_TARGET_PROTEIN_G)
+        pools = self.slot_pools(self.allowed(client_data.get('DIETARY_PREFERENCES'), client_data.get('ALLERGIES')))
+        # Any seed (e.g. the job id) gives a repeatable plan; different seeds vary the week
+        rng = np.random.default_rng(None if seed is None else zlib.crc32(str(seed).encode()))
+        uses = np.zeros(len(self.recipes))
+
+        meal_days, daily_totals = [], []
+        for day in range(1, days + 1):
+            chosen, portion = self.plan_day(pools, target_calories, target_protein, uses, rng)
+            uses[chosen] += 1
+            meals = []
+            for (slot, _), recipe_index in zip(MEAL_SLOTS, chosen):
+                recipe = self.recipes[recipe_index]
+                calories, protein, carbs, fat = (int(round(value)) for value in self.macros[recipe_index] * portion)
+                meals.append(Meal(
+                    meal_type=slot,
+                    foods=[recipe['recipe_name']] + variant_list(recipe.get('ingredients')),
+                    calories=calories, protein=protein, carbs=carbs, fat=fat,
+                    recipe_id=recipe['recipe_id'], servings=round(portion, 2),
+                ))
+            meal_days.append(MealDay(day=day, meals=meals))
+            daily_totals.append([sum(getattr(meal, key) for meal in meals) for key in ('calories', 'protein', 'carbs', 'fat')])
+
+        # Daily averages, as the weekly_totals the Cortex plans report
+        averages = np.round(np.mean(daily_totals, axis=0)).astype(int)
+        return MealPlan(weekly_totals=MacroTotals(*(int(value) for value in averages)), days=meal_days)
+
+@st.cache_resource(ttl=600)
+def get_recipe_book():
+    """Process-wide RecipeBook over the recipes table, refreshed every 10 minutes"""
+    rows = bind_sql("""
+    SELECT recipe_id, recipe_name, servings, total_calories, protein_g, carbs_g, fat_g, ingredients, tags
+    FROM TRAINING_DB.PUBLIC.recipes
+    ORDER BY recipe_name
+    """).collect()
+    return RecipeBook({key.lower(): value for key, value in row.as_dict().items()} for row in rows)
+
+def describe_plan(client_data: dict):
+    """One-line description of the planner's targets and restrictions, stored where a Cortex prompt would be"""
+    target_calories = _target(client_data.get('TARGET_CALORIES'), DEFAULT_TARGET_CALORIES)
+    target_protein = _target(client_data.get('TARGET_PROTEIN_G'), DEFAULT_TARGET_PROTEIN_G)
+    preferences = [pref for pref in variant_list(client_data.get('DIETARY_PREFERENCES'))
+                   if pref.strip().lower() not in NO_RESTRICTION]
+    allergens = sorted(parse_allergies(client_data.get('ALLERGIES')))
+    return (f"Recipe plan ({PLANNER_MODEL}): {target_calories:.0f} kcal and {target_protein:.0f} g protein a day; "
+            f"diet {', '.join(preferences) or 'any'}; excluding {', '.join(allergens) or 'nothing'}")
+
+def plan_meals(client_data: dict, seed=None):
+    """7-day MealPlan for a client row from the recipes table; raises MealPlanningError if none fits"""
+    return get_recipe_book().plan_week(client_data, seed=seed)
@@ -0,0 +1,277 @@
+"""
+Typed plan payloads: workout weeks and meal plans as produced by Cortex.
+
+Cortex output is decoded and validated in one pass into slotted dataclasses shared by
+the generators, the save functions and the pages. Defaults for optional fields are
+applied here once rather than with `.get(key, default)` at every use. Entries that
+cannot be used (a day without a valid day number, an exercise without a name) are
+dropped so the rest of the plan still saves; a payload with nothing usable raises
+PlanValidationError before anything is written.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+class PlanValidationError(ValueError):
+    """Cortex output that does not match the plan schema"""
+
+# ============================================================================
+# Field Decoders
+# ============================================================================
+
+def _int(value, default, name: str):
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        raise PlanValidationError(f"{name}: expected a number, got {value!r}")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return round(value)
+    if isinstance(value, str):
+        try:
+            return round(float(value.strip()))
+        except ValueError:
+            pass
+    raise PlanValidationError(f"{name}: expected a number, got {value!r}")
+
+def _float(value, default, name: str):
+    if value is None:
+        return default
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise PlanValidationError(f"{name}: expected a number, got {value!r}")
+
+def _str(value, default, name: str):
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise PlanValidationError(f"{name}: expected text, got {value!r}")
+
+def _bool(value, default, name: str):
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    raise PlanValidationError(f"{name}: expected true/false, got {value!r}")
+
+def _object(payload, name: str):
+    """Accept the raw completion text, a JSON string from a VARIANT column or an already-parsed dict"""
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError as e:
+            raise PlanValidationError(f"{name}: not valid JSON ({e})") from None
+    if not isinstance(payload, dict):
+        raise PlanValidationError(f"{name}: expected a JSON object")
+    return payload
+
+def _list(value, name: str):
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise PlanValidationError(f"{name}: expected a list")
+    return value
+
+def _valid(decode, items: list, name: str):
+    """Decode each item, dropping those that fail validation"""
+    decoded = []
+    for i, item in enumerate(items):
+        try:
+            decoded.append(decode(item, f"{name}[{i}]"))
+        except PlanValidationError:
+            continue
+    return decoded
+
+# ============================================================================
+# Workout Week
+# ============================================================================
+
+@dataclass(slots=True)
+class Exercise:
+    name: str
+    sets: int = 3
+    reps: int | str = '8-10'
+    rest_sec: int = 60
+    notes: str = ''
+    exercise_id: str | None = None  # exercises_library id, resolved from the name at save time
+
+    @classmethod
+    def decode(cls, obj, name: str = 'exercise'):
+        if not isinstance(obj, dict):
+            raise PlanValidationError(f"{name}: expected an object")
+        exercise_name = _str(obj.get('name'), '', f"{name}.name").strip()
+        if not exercise_name:
+            raise PlanValidationError(f"{name}: missing name")
+        reps = obj.get('reps')
+        if isinstance(reps, float):
+            reps = round(reps)
+        return cls(
+            name=exercise_name,
+            sets=max(1, _int(obj.get('sets'), 3, f"{name}.sets")),
+            reps=reps if isinstance(reps, (int, str)) and not isinstance(reps, bool) else '8-10',
+            rest_sec=max(0, _int(obj.get('rest_sec'), 60, f"{name}.rest_sec")),
+            notes=_str(obj.get('notes'), '', f"{name}.notes"),
+            exercise_id=_str(obj.get('exercise_id') or obj.get('id'), None, f"{name}.exercise_id"),
+        )
+
+@dataclass(slots=True)
+class DayPlan:
+    day: int
+    day_name: str
+    is_rest_day: bool = False
+    focus: str = 'Generated Workout'
+    warm_up: str = ''
+    exercises: list[Exercise] = field(default_factory=list)
+    cool_down: str = ''
+    recovery_tips: str = 'Rest day'
+
+    @property
+    def is_complete(self) -> bool:
+        """Rest days, or training days with at least one usable exercise"""
+        return self.is_rest_day or bool(self.exercises)
+
+    @classmethod
+    def decode(cls, obj, name: str = 'day'):
+        if not isinstance(obj, dict):
+            raise PlanValidationError(f"{name}: expected an object")
+        day = _int(obj.get('day'), None, f"{name}.day")
+        if day is None or not 1 <= day <= 7:
+            raise PlanValidationError(f"{name}: day must be 1-7, got {obj.get('day')!r}")
+        is_rest_day = _bool(obj.get('is_rest_day'), False, f"{name}.is_rest_day")
+        return cls(
+            day=day,
+            day_name=_str(obj.get('day_name'), DAY_NAMES[day - 1], f"{name}.day_name"),
+            is_rest_day=is_rest_day,
+            focus=_str(obj.get('focus'), 'Rest Day' if is_rest_day else 'Generated Workout', f"{name}.focus"),
+            warm_up=_str(obj.get('warm_up'), '', f"{name}.warm_up"),
+            exercises=_valid(Exercise.decode, _list(obj.get('exercises'), f"{name}.exercises"), f"{name}.exercises"),
+            cool_down=_str(obj.get('cool_down'), '', f"{name}.cool_down"),
+            recovery_tips=_str(obj.get('recovery_tips'), 'Rest day', f"{name}.recovery_tips"),
+        )
+
+@dataclass(slots=True)
+class WeekPlan:
+    week: int
+    days: list[DayPlan]
+
+    def incomplete_days(self) -> list:
+        """Day numbers (1-7) missing from the week, or training days without usable exercises"""
+        days = {day.day: day for day in self.days}
+        return [day_num for day_num in range(1, 8) if day_num not in days or not days[day_num].is_complete]
+
+    def with_days(self, new_days: list):
+        """Copy of the week with `new_days` replacing (or filling in) the days with the same number"""
+        replaced = {day.day for day in new_days}
+        kept = [day for day in self.days if day.day not in replaced]
+        return WeekPlan(week=self.week, days=sorted(kept + list(new_days), key=lambda day: day.day))
+
+    def to_dict(self):
+        return asdict(self)
+
+def decode_week(payload, week: int = 1):
+    """Decode and validate a full (or partial) week; `week` is used when the payload has none"""
+    obj = _object(payload, 'week')
+    days = {}
+    for day in _valid(DayPlan.decode, _list(obj.get('days'), 'days'), 'days'):
+        days.setdefault(day.day, day)
+    if not days:
+        raise PlanValidationError("week: no valid days in the response")
+    return WeekPlan(week=_int(obj.get('week'), week, 'week'), days=sorted(days.values(), key=lambda day: day.day))
+
+# ============================================================================
+# Meal Plan
+# ============================================================================
+
+@dataclass(slots=True)
+class Meal:
+    meal_type: str
+    foods: list[str]
+    calories: int | None = None
+    protein: int | None = None
+    carbs: int | None = None
+    fat: int | None = None
+    recipe_id: str | None = None  # recipes id and portion, set by the recipe planner
+    servings: float | None = None
+
+    @classmethod
+    def decode(cls, obj, name: str = 'meal'):
+        if not isinstance(obj, dict):
+            raise PlanValidationError(f"{name}: expected an object")
+        foods = obj.get('foods')
+        if isinstance(foods, str):
+            foods = [foods]
+        return cls(
+            meal_type=_str(obj.get('meal_type'), 'meal', f"{name}.meal_type"),
+            foods=[_str(food, '', f"{name}.foods") for food in _list(foods, f"{name}.foods")],
+            calories=_int(obj.get('calories'), None, f"{name}.calories"),
+            protein=_int(obj.get('protein'), None, f"{name}.protein"),
+            carbs=_int(obj.get('carbs'), None, f"{name}.carbs"),
+            fat=_int(obj.get('fat'), None, f"{name}.fat"),
+            recipe_id=_str(obj.get('recipe_id'), None, f"{name}.recipe_id"),
+            servings=_float(obj.get('servings'), None, f"{name}.servings"),
+        )
+
+@dataclass(slots=True)
+class MealDay:
+    day: int
+    meals: list[Meal] = field(default_factory=list)
+
+    @classmethod
+    def decode(cls, obj, name: str = 'day'):
+        if not isinstance(obj, dict):
+            raise PlanValidationError(f"{name}: expected an object")
+        day = _int(obj.get('day'), None, f"{name}.day")
+        if day is None or not 1 <= day <= 7:
+            raise PlanValidationError(f"{name}: day must be 1-7, got {obj.get('day')!r}")
+        return cls(day=day, meals=_valid(Meal.decode, _list(obj.get('meals'), f"{name}.meals"), f"{name}.meals"))
+
+@dataclass(slots=True)
+class MacroTotals:
+    calories: int | None = None
+    protein: int | None = None
+    carbs: int | None = None
+    fat: int | None = None
+
+    @classmethod
+    def decode(cls, obj, name: str = 'weekly_totals'):
+        if obj is None:
+            return cls()
+        if not isinstance(obj, dict):
+            raise PlanValidationError(f"{name}: expected an object")
+        return cls(**{key: _int(obj.get(key), None, f"{name}.{key}") for key in ('calories', 'protein', 'carbs', 'fat')})
+
+@dataclass(slots=True)
+class MealPlan:
+    weekly_totals: MacroTotals
+    days: list[MealDay]
+
+    def to_dict(self):
+        return asdict(self)
+
+def decode_meal_plan(payload):
+    """Decode and validate a 7-day meal plan"""
+    obj = _object(payload, 'meal_plan')
+    days = {}
+    for day in _valid(MealDay.decode, _list(obj.get('days'), 'days'), 'days'):
+        days.setdefault(day.day, day)
+    if not days:
+        raise PlanValidationError("meal_plan: no valid days in the response")
+    return MealPlan(
+        weekly_totals=MacroTotals.decode(obj.get('weekly_totals')),
+        days=sorted(days.values(), key=lambda day: day.day),
+    )
+
+PLAN_DECODERS = {'workout_week': decode_week, 'meal_plan': decode_meal_plan}
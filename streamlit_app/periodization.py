@@ -0,0 +1,230 @@
+"""
+Rule-based periodization: instant workout weeks without a Cortex call.
+
+Builds a WeekPlan from the client's days_per_week, fitness_level, fitness_goals and
+available_equipment. A split template fixes the training days and their focus; splits of
+three or more days include an easy run day, the two-day split ends its second session
+with conditioning work instead, and the one-day split is a single full-body session. Each
+exercise slot is filled from the exercise shortlist for its muscle group, so only
+exercises the client's equipment and level allow are used. Programs run in 4-week
+blocks: the exercises rotate at the start of each block, and within a block the target
+effort climbs for three weeks (RPE 6.5, 8, 9, with a set added in week 3) and drops back
+on the fourth (deload). Where the client has logged an exercise, its recent estimated
+1RM from the progression recommender sets the week's target load: the weight that
+leaves the week's reps in reserve at the top of the rep range, so loads rise through the
+block and carry the client's progress into the next. The same client, week and set
+history always give the same plan, which is what the "Instant" mode of the Workout
+Generator saves.
+"""
+
+import pandas as pd
+
+from data_access import variant_list
+from exercise_index import get_exercise_index
+from models import DAY_NAMES, DayPlan, Exercise, WeekPlan
+from progression import LIGHT_LOAD_KG, LIGHT_PLATE_KG, PLATE_KG
+
+# Recorded as the generating model on rule-based jobs and rows
+RULES_MODEL = 'periodization'
+
+# Training weekdays (1 = Monday) and each day's focus, per days_per_week
+SPLITS = {
+    1: [(1, 'Full Body')],
+    2: [(1, 'Full Body'), (4, 'Full Body & Conditioning')],
+    3: [(1, 'Full Body'), (3, 'Easy Run'), (5, 'Full Body')],
+    4: [(1, 'Upper Body'), (2, 'Lower Body'), (4, 'Easy Run'), (5, 'Full Body')],
+    5: [(1, 'Upper Body Push'), (2, 'Lower Body'), (3, 'Easy Run'), (5, 'Upper Body Pull'), (6, 'Legs & Core')],
+    6: [(1, 'Upper Body Push'), (2, 'Lower Body'), (3, 'Upper Body Pull'), (4, 'Easy Run'), (5, 'Legs & Core'),
+        (6, 'Full Body')],
+    7: [(1, 'Upper Body Push'), (2, 'Lower Body'), (3, 'Upper Body Pull'), (4, 'Easy Run'), (5, 'Legs & Core'),
+        (6, 'Full Body'), (7, 'Mobility & Recovery')],
+}
+
+# Shortlist group for each exercise slot of a focus, in priority order
+FOCUS_SLOTS = {
+    'Full Body': ['Legs', 'Push', 'Pull', 'Legs', 'Push', 'Pull', 'Core'],
+    'Full Body & Conditioning': ['Legs', 'Push', 'Pull', 'Core', 'Cardio', 'Legs', 'Pull'],
+    'Upper Body': ['Push', 'Pull', 'Push', 'Pull', 'Push', 'Pull', 'Core'],
+    'Upper Body Push': ['Push', 'Push', 'Push', 'Push', 'Core', 'Push', 'Core'],
+    'Upper Body Pull': ['Pull', 'Pull', 'Pull', 'Pull', 'Core', 'Pull', 'Core'],
+    'Lower Body': ['Legs', 'Legs', 'Legs', 'Legs', 'Core', 'Legs', 'Core'],
+    'Legs & Core': ['Legs', 'Legs', 'Core', 'Legs', 'Core', 'Legs', 'Core'],
+    'Easy Run': ['Cardio'],
+    'Mobility & Recovery': ['Mobility', 'Mobility', 'Core'],
+}
+
+# Order of groups within a day (main lifts first)
+GROUP_ORDER = {'Core': 1, 'Mobility': 1, 'Cardio': 2}
+
+# Gym-day exercise count: one per 10 minutes of the session, within these bounds
+MIN_EXERCISES = 5
+MAX_EXERCISES = 7
+
+# (reps, rest_sec) per goal; the first of the client's goals found here wins
+GOAL_SCHEMES = {
+    'Strength': ('4-6', 150),
+    'Muscle Gain': ('8-12', 90),
+    'Endurance': ('12-15', 45),
+    'Weight Loss': ('10-15', 45),
+    'General Fitness': ('8-12', 75),
+    'Flexibility': ('10-12', 60),
+}
+DEFAULT_SCHEME = GOAL_SCHEMES['General Fitness']
+BASE_SETS = {'Beginner': 2, 'Intermediate': 3, 'Advanced': 4}
+
+# Weeks per block, and per week of a block: extra sets, run minutes, target RPE (None = deload)
+# and the progression cue
+BLOCK_WEEKS = 4
+BLOCK_PROGRESSION = [
+    (0, 20, 6.5, "Leave 3-4 reps in reserve"),
+    (0, 25, 8.0, "Leave 2 reps in reserve"),
+    (1, 30, 9.0, "Leave 1 rep in reserve"),
+    (-1, 20, None, "Deload: about 60% of last week's load"),
+]
+# Deload load as a share of the block's hardest week
+DELOAD_FACTOR = 0.6
+
+# Exercises prescribed by time rather than reps
+TIMED_WORDS = ('plank', 'hold', 'stretch')
+
+RECOVERY_TIPS = [
+    "Light walk (20-30 min) and mobility work",
+    "Foam rolling and full-body stretching",
+    "Complete rest: prioritise sleep and hydration",
+]
+
+def _training_plan(client_data: dict):
+    """(days_per_week, level, goals, equipment) from a client row"""
+    days_per_week = min(max(int(client_data.get('DAYS_PER_WEEK') or 3), 1), 7)
+    level = client_data.get('FITNESS_LEVEL') or 'Beginner'
+    goals = variant_list(client_data.get('FITNESS_GOALS'))
+    equipment = variant_list(client_data.get('AVAILABLE_EQUIPMENT'))
+    return days_per_week, level, goals, equipment
+
+def _scheme(goals: list):
+    return next((GOAL_SCHEMES[goal] for goal in goals if goal in GOAL_SCHEMES), DEFAULT_SCHEME)
+
+def target_load(e1rm_kg: float, reps: str, rpe: float | None):
+    """Load for the top of a rep range ('8-12' -> 12) at `rpe` (reps in reserve = 10 - RPE), by
+    inverting Epley as the recommender's e1RM does; a deload (`rpe` None) is DELOAD_FACTOR of the
+    block's hardest week. Rounded to the recommender's plate steps."""
+    top_reps = int(str(reps).split('-')[-1])
+    hardest_rpe = max(week_rpe for *_, week_rpe, _ in BLOCK_PROGRESSION if week_rpe is not None)
+    load = e1rm_kg / (1 + (top_reps + 10 - (rpe or hardest_rpe)) / 30)
+    if rpe is None:
+        load *= DELOAD_FACTOR
+    step = LIGHT_PLATE_KG if load < LIGHT_LOAD_KG else PLATE_KG
+    return max(round(load / step) * step, step)
+
+def describe_program(client_data: dict, week: int):
+    """One-line description of the rule-based program, stored where a Cortex prompt would be"""
+    days_per_week, level, goals, equipment = _training_plan(client_data)
+    split = ', '.join(focus for _, focus in SPLITS[days_per_week])
+    block, block_week = divmod(week - 1, BLOCK_WEEKS)
+    return (f"Rule-based program ({RULES_MODEL}): week {week} (block {block + 1}, week {block_week + 1}/{BLOCK_WEEKS}); "
+            f"{level}; goals {', '.join(goals) or 'none'}; equipment {', '.join(equipment) or 'none'}; split {split}")
+
+def build_week(client_data: dict, week: int = 1, recommendations: pd.DataFrame = None):
+    """WeekPlan for a client row and program week, with library exercise ids filled in
+
+    `recommendations` is the client's progression.recommend() table; exercises it has an
+    e1RM for get a target load in their notes.
+    """
+    days_per_week, level, goals, equipment = _training_plan(client_data)
+    e1rm = {}
+    if recommendations is not None and not recommendations.empty:
+        known = recommendations.dropna(subset=['E1RM_KG'])
+        e1rm = dict(zip(known['EXERCISE_ID'], known['E1RM_KG'].astype(float)))
+    # Every exercise the client can do, ranked within its muscle group
+    index = get_exercise_index()
+    groups = {
+        group: [(index.code_to_id(code), name) for code, name in exercises]
+        for group, exercises in index.shortlist(equipment, level, per_focus=None).items()
+    }
+    if not groups:
+        raise ValueError("No library exercises fit the client's equipment and fitness level")
+    ranks = {exercise_id: rank for pool in groups.values() for rank, (exercise_id, _) in enumerate(pool)}
+
+    block, block_week = divmod(week - 1, BLOCK_WEEKS)
+    extra_sets, run_minutes, rpe, cue = BLOCK_PROGRESSION[block_week]
+    reps, rest_sec = _scheme(goals)
+    sets = max(1, BASE_SETS.get(level, 3) + extra_sets)
+    duration = int(client_data.get('WORKOUT_DURATION_MIN') or 60)
+    exercise_count = min(max(duration // 10, MIN_EXERCISES), MAX_EXERCISES)
+
+    # Each group hands out its exercises in turn, starting further along every block
+    split = SPLITS[days_per_week]
+    demand = {}
+    for _, focus in split:
+        for group in FOCUS_SLOTS[focus]:
+            demand[group] = demand.get(group, 0) + 1
+    handed_out = {group: 0 for group in demand}
+
+    def next_exercise(group: str, used: set):
+        pool = groups.get(group, [])
+        for _ in range(len(pool)):
+            exercise_id, name = pool[(block * demand[group] + handed_out[group]) % len(pool)]
+            handed_out[group] += 1
+            if exercise_id not in used:
+                return exercise_id, name
+        return None
+
+    training = dict(split)
+    days = []
+    for day_num in range(1, 8):
+        focus = training.get(day_num)
+        if focus is None:
+            days.append(DayPlan(day=day_num, day_name=DAY_NAMES[day_num - 1], is_rest_day=True, focus='Rest Day',
+                                recovery_tips=RECOVERY_TIPS[(day_num + block) % len(RECOVERY_TIPS)]))
+            continue
+
+        slots = FOCUS_SLOTS[focus]
+        target = len(slots) if focus in ('Easy Run', 'Mobility & Recovery') else exercise_count
+        used, picked = set(), []
+        for group in slots[:target]:
+            exercise = next_exercise(group, used)
+            if exercise:
+                used.add(exercise[0])
+                picked.append((group, *exercise))
+        # Small pools (e.g. bodyweight only): top up from the focus's other groups
+        while len(picked) < target:
+            before = len(picked)
+            for group in dict.fromkeys(slots):
+                exercise = next_exercise(group, used) if len(picked) < target else None
+                if exercise:
+                    used.add(exercise[0])
+                    picked.append((group, *exercise))
+            if len(picked) == before:
+                break
+        # Main lifts first, best-ranked first; core, then conditioning last
+        picked.sort(key=lambda item: (GROUP_ORDER.get(item[0], 0), ranks[item[1]]))
+
+        exercises = []
+        for group, exercise_id, name in picked:
+            if group == 'Cardio':
+                minutes = run_minutes if focus == 'Easy Run' else 10
+                exercises.append(Exercise(name=name, sets=1, reps=f"{minutes} min", rest_sec=0,
+                                          notes="Conversational pace" if focus == 'Easy Run' else "Hard but sustainable pace",
+                                          exercise_id=exercise_id))
+            elif group == 'Mobility' or any(word in name.lower() for word in TIMED_WORDS):
+                exercises.append(Exercise(name=name, sets=max(2, sets - 1), reps="30-45 sec", rest_sec=30,
+                                          notes="Controlled breathing, no pain", exercise_id=exercise_id))
+            else:
+                notes = cue if rpe is None else f"RPE {rpe:g}: {cue.lower()}"
+                if e1rm.get(exercise_id, 0) > 0:
+                    notes += f" - target {target_load(e1rm[exercise_id], reps, rpe):g} kg"
+                exercises.append(Exercise(name=name, sets=sets, reps=reps, rest_sec=rest_sec, notes=notes,
+                                          exercise_id=exercise_id))
+
+        days.append(DayPlan(
+            day=day_num,
+            day_name=DAY_NAMES[day_num - 1],
+            focus=focus,
+            warm_up="5 min brisk walk, leg swings and hip openers" if focus == 'Easy Run'
+                    else "5 min light cardio, dynamic stretches and 2 ramp-up sets of the first exercise",
+            exercises=exercises,
+            cool_down="5 min walk and calf / hip flexor stretches" if focus == 'Easy Run'
+                      else "5-10 min stretching of the muscles trained",
+        ))
+
+    return WeekPlan(week=week, days=days)
@@ -0,0 +1,89 @@
+"""
+Overnight pre-generation of next week's workouts and meal plans.
+
+Finds clients whose current plan ends within `horizon_days`, queues their next week as
+schedule-origin generation jobs and runs them off-peak. The plans are saved as DRAFTs
+that the trainer approves or discards on the generator pages, so Monday-morning
+requests become reads. Runs as the pregenerate_next_week stored procedure, scheduled
+by TASK_PREGENERATE_NEXT_WEEK (sql/09).
+"""
+
+from data_access import bind_sql, log_event
+from jobs import JOB_KINDS, create_job, run_job
+
+# Minutes before a job queued by the app is fair game for the warehouse run (as TASK_PROCESS_GENERATION_JOBS)
+STALE_AFTER_MINUTES = 5
+
+# Last planned day per client, and where the next week starts. Plans that lapsed in the
+# last week are picked up too, starting today, so one missed night does not drop a client.
+DUE_CLIENTS_SQL = {
+    'workout_week': """
+    SELECT c.*, LEAST(p.last_week + 1, 52) AS next_week,
+           GREATEST(DATEADD(DAY, 1, p.last_day)::DATE, CURRENT_DATE) AS next_start
+    FROM TRAINING_DB.PUBLIC.clients c
+    JOIN (
+        SELECT client_id, MAX(workout_week) AS last_week, MAX(workout_date) AS last_day
+        FROM TRAINING_DB.PUBLIC.generated_workouts
+        GROUP BY client_id
+    ) p ON p.client_id = c.client_id
+    WHERE p.last_day BETWEEN DATEADD(DAY, -7, CURRENT_DATE) AND DATEADD(DAY, ?, CURRENT_DATE)
+    """,
+    'meal_plan': """
+    SELECT c.*, LEAST(p.last_week + 1, 52) AS next_week,
+           GREATEST(DATEADD(DAY, 1, p.last_day)::DATE, CURRENT_DATE) AS next_start
+    FROM TRAINING_DB.PUBLIC.clients c
+    JOIN (
+        SELECT client_id, MAX(plan_week) AS last_week,
+               MAX(DATEADD(DAY, duration_days - 1, plan_start_date)::DATE) AS last_day
+        FROM TRAINING_DB.PUBLIC.meal_plans
+        GROUP BY client_id
+    ) p ON p.client_id = c.client_id
+    WHERE p.last_day BETWEEN DATEADD(DAY, -7, CURRENT_DATE) AND DATEADD(DAY, ?, CURRENT_DATE)
+    """,
+}
+
+def find_due_clients(kind: str, horizon_days: int):
+    """Clients whose latest plan of `kind` ends within `horizon_days`, with NEXT_WEEK / NEXT_START"""
+    return bind_sql(DUE_CLIENTS_SQL[kind], [int(horizon_days)]).to_pandas()
+
+def pregenerate(horizon_days: int = 3, run_in_warehouse: bool = False):
+    """Queue next week's plans for every due client and run them; returns counts per kind
+
+    With `run_in_warehouse` the queued workout jobs are run set-based by
+    process_generation_jobs (one Cortex statement for the whole batch, claiming only
+    schedule-origin jobs and stale ones, never those the app just queued for its own
+    workers), whose responses are validated and saved by jobs.finish_warehouse_jobs;
+    otherwise they are run one by one in this process. Meal plans are always built here by the recipe planner.
+    """
+    counts = {}
+    queued = {kind: [] for kind in JOB_KINDS}
+    for kind in JOB_KINDS:
+        due_df = find_due_clients(kind, horizon_days)
+        for client in due_df.to_dict('records'):
+            # Coalesced with any identical job, so reruns and trainer requests never duplicate a week
+            job_id, created = create_job(
+                client['CLIENT_ID'], kind, client, int(client['NEXT_WEEK']), client['NEXT_START'],
+                origin='schedule'
+            )
+            if created:
+                queued[kind].append(job_id)
+        counts[kind] = {'due': len(due_df), 'queued': len(queued[kind])}
+
+    # Meal plans come from the local recipe planner, so they always run here
+    for job_id in queued['meal_plan']:
+        run_job(job_id, worker='schedule')
+    if run_in_warehouse:
+        if queued['workout_week']:
+            bind_sql("CALL TRAINING_DB.PUBLIC.process_generation_jobs(?, ?)",
+                     [STALE_AFTER_MINUTES, 'schedule']).collect()
+    else:
+        for job_id in queued['workout_week']:
+            run_job(job_id, worker='schedule')
+
+    total = sum(len(job_ids) for job_ids in queued.values())
+    log_event('plans_pregenerated', message=f"{total} draft plan(s) pre-generated", context=counts)
+    return counts
+
+def main(session, horizon_days: int = 3):
+    """Stored procedure handler; the Snowpark session is picked up through get_snowpark_session()"""
+    return pregenerate(int(horizon_days), run_in_warehouse=True)
@@ -0,0 +1,184 @@
+"""
+Progressive-overload recommender over a client's logged sets.
+
+Loads the client's recent exercise_results in one query and, for every exercise at
+once, works out the recent estimated 1RM (Epley), the e1RM and RPE trends across
+sessions, whether progress has stalled, and the load / reps (or time, for timed sets
+such as runs) to aim for next time. All
+of it is pandas group operations over the set rows, so it stays fast for clients with
+tens of thousands of logged sets. The table feeds the workout prompt (as "recent loads")
+and pre-fills the set-entry form.
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from data_access import bind_sql, lookback_start
+
+# History considered, and sessions used for the trend lines
+RECENT_WEEKS = 12
+TREND_SESSIONS = 6
+
+# No new e1RM high in this many sessions (with earlier history to compare) = stalled
+STALL_SESSIONS = 3
+
+# RPE at or below which load goes up, and at or above which the session is repeated;
+# in between a rep is added. Sets logged without RPE count as DEFAULT_RPE.
+ADD_LOAD_RPE = 8.0
+REPEAT_RPE = 9.5
+DEFAULT_RPE = 8.5
+
+# Load steps: plate increment (smaller below LIGHT_LOAD_KG) and the deload when stalled
+# at a hard effort (a stall at an easy effort adds load instead)
+PLATE_KG = 2.5
+LIGHT_PLATE_KG = 1.0
+LIGHT_LOAD_KG = 20.0
+DELOAD_FACTOR = 0.9
+
+# Seconds a client's recommendations stay cached (saving or importing their sets clears them sooner)
+RECOMMENDATIONS_CACHE_SEC = 300
+
+# Timed sets without load (runs, holds) progress by time, rounded to TIME_STEP_SEC
+TIME_FACTOR = 1.1
+TIME_STEP_SEC = 15
+
+SET_COLUMNS = ['EXERCISE_ID', 'PERFORMED_DATE', 'SET_NUMBER', 'REPS', 'WEIGHT_KG', 'RPE', 'DURATION_SECONDS']
+RECOMMENDATION_COLUMNS = [
+    'EXERCISE_ID', 'SESSIONS', 'LAST_DATE', 'LAST_WEIGHT_KG', 'LAST_REPS', 'LAST_DURATION_SEC', 'LAST_RPE',
+    'E1RM_KG', 'E1RM_TREND', 'RPE_TREND', 'STALLED', 'ACTION', 'NEXT_WEIGHT_KG', 'NEXT_REPS', 'NEXT_DURATION_SEC',
+]
+
+def _fetch_recent_sets(client_id: str, weeks: int):
+    return bind_sql("""
+    SELECT exercise_id, performed_date, set_number, reps, weight_kg, rpe, duration_seconds
+    FROM TRAINING_DB.PUBLIC.exercise_results
+    WHERE client_id = ?
+      AND performed_date >= ?
+    """, [client_id, lookback_start(weeks)]).to_pandas()
+
+def get_recent_sets(client_id: str, weeks: int = RECENT_WEEKS):
+    """All sets a client logged in the last `weeks` weeks, every exercise, in one query"""
+    try:
+        return _fetch_recent_sets(client_id, weeks)
+    except Exception as e:
+        st.warning(f"Could not fetch recent sets: {str(e)}")
+        return pd.DataFrame(columns=SET_COLUMNS)
+
+def _slopes(keys, x, y):
+    """Least-squares slope of y on x within each key (rows with missing y ignored)"""
+    frame = pd.DataFrame({'key': keys, 'x': x, 'y': y}).dropna()
+    frame['xy'] = frame['x'] * frame['y']
+    frame['xx'] = frame['x'] ** 2
+    sums = frame.groupby('key').agg(n=('x', 'size'), sx=('x', 'sum'), sy=('y', 'sum'), sxy=('xy', 'sum'), sxx=('xx', 'sum'))
+    denominator = sums['n'] * sums['sxx'] - sums['sx'] ** 2
+    return (sums['n'] * sums['sxy'] - sums['sx'] * sums['sy']) / denominator.where(denominator != 0)
+
+def _round_load(weight, step):
+    return np.round(weight / step) * step
+
+def recommend(sets_df: pd.DataFrame):
+    """One row per exercise: recent e1RM, trends, stall flag and the next load / rep target"""
+    if sets_df.empty:
+        return pd.DataFrame(columns=RECOMMENDATION_COLUMNS)
+
+    sets = sets_df[SET_COLUMNS].copy()
+    for column in ('REPS', 'WEIGHT_KG', 'RPE', 'DURATION_SECONDS'):
+        sets[column] = pd.to_numeric(sets[column], errors='coerce')
+    sets['E1RM'] = sets['WEIGHT_KG'] * (1 + sets['REPS'] / 30.0)
+
+    # One row per session; the top set is the heaviest, then the most reps at that weight
+    sets = sets.sort_values(['EXERCISE_ID', 'PERFORMED_DATE', 'WEIGHT_KG', 'REPS'], na_position='first')
+    sessions = sets.groupby(['EXERCISE_ID', 'PERFORMED_DATE'], sort=True).agg(
+        TOP_WEIGHT_KG=('WEIGHT_KG', 'last'),
+        TOP_REPS=('REPS', 'last'),
+        DURATION_SEC=('DURATION_SECONDS', 'max'),
+        E1RM=('E1RM', 'max'),
+        RPE=('RPE', 'mean'),
+    ).reset_index()
+    # 0 = the latest session of each exercise
+    sessions['AGO'] = sessions.groupby('EXERCISE_ID').cumcount(ascending=False)
+
+    last = sessions[sessions['AGO'] == 0].set_index('EXERCISE_ID')
+    recent = sessions[sessions['AGO'] < STALL_SESSIONS].groupby('EXERCISE_ID')['E1RM'].max()
+    earlier = sessions[sessions['AGO'] >= STALL_SESSIONS].groupby('EXERCISE_ID')['E1RM'].max().reindex(recent.index)
+    stalled = (recent <= earlier).reindex(last.index, fill_value=False).astype(bool)
+
+    trend = sessions[sessions['AGO'] < TREND_SESSIONS]
+    e1rm_trend = _slopes(trend['EXERCISE_ID'], -trend['AGO'], trend['E1RM']).reindex(last.index)
+    rpe_trend = _slopes(trend['EXERCISE_ID'], -trend['AGO'], trend['RPE']).reindex(last.index)
+
+    weight = last['TOP_WEIGHT_KG']
+    reps = last['TOP_REPS']
+    rpe = last['RPE'].fillna(DEFAULT_RPE)
+    duration = last['DURATION_SEC']
+    loaded = weight.notna()
+    timed = ~loaded & duration.notna()
+    step = np.where(weight < LIGHT_LOAD_KG, LIGHT_PLATE_KG, PLATE_KG)
+    action = np.select(
+        [stalled & loaded & (rpe > ADD_LOAD_RPE), rpe >= REPEAT_RPE, loaded & (rpe <= ADD_LOAD_RPE), timed],
+        ['Deload', 'Repeat', 'Add load', 'Add time'],
+        default='Add a rep',
+    )
+    next_weight = np.select(
+        [action == 'Deload', action == 'Add load'],
+        [np.maximum(_round_load(weight * DELOAD_FACTOR, step), step), weight + step],
+        default=weight,
+    )
+    next_reps = np.where(action == 'Add a rep', reps + 1, reps)
+    next_duration = np.where(action == 'Add time', _round_load(duration * TIME_FACTOR, TIME_STEP_SEC), duration)
+
+    return pd.DataFrame({
+        'EXERCISE_ID': last.index,
+        'SESSIONS': sessions.groupby('EXERCISE_ID').size().reindex(last.index).to_numpy(),
+        'LAST_DATE': last['PERFORMED_DATE'].to_numpy(),
+        'LAST_WEIGHT_KG': weight.to_numpy(),
+        'LAST_REPS': reps.to_numpy(),
+        'LAST_DURATION_SEC': duration.to_numpy(),
+        'LAST_RPE': last['RPE'].to_numpy(),
+        'E1RM_KG': recent.reindex(last.index).to_numpy(),
+        'E1RM_TREND': e1rm_trend.to_numpy(),
+        'RPE_TREND': rpe_trend.to_numpy(),
+        'STALLED': stalled.to_numpy(),
+        'ACTION': action,
+        'NEXT_WEIGHT_KG': next_weight,
+        'NEXT_REPS': next_reps,
+        'NEXT_DURATION_SEC': next_duration,
+    })
+
+@st.cache_data(ttl=RECOMMENDATIONS_CACHE_SEC, show_spinner=False)
+def _fetch_recommendations(client_id: str, weeks: int):
+    return recommend(_fetch_recent_sets(client_id, weeks))
+
+def get_recommendations(client_id: str, weeks: int = RECENT_WEEKS):
+    """Next-session targets for every exercise the client logged recently, cached per client"""
+    try:
+        return _fetch_recommendations(client_id, weeks)
+    except Exception as e:
+        st.warning(f"Could not fetch recent sets: {str(e)}")
+        return recommend(pd.DataFrame(columns=SET_COLUMNS))
+
+def clear_recommendations(client_id: str):
+    """Drop a client's cached targets so the next read sees the sets just saved"""
+    _fetch_recommendations.clear(client_id, RECENT_WEEKS)
+
+def _describe_set(weight, reps, duration):
+    if pd.notna(weight):
+        return f"{weight:g} kg x {reps:.0f}"
+    if pd.notna(duration):
+        return f"{duration / 60:g} min" if duration >= 60 else f"{duration:.0f} sec"
+    return f"{reps:.0f} reps"
+
+def describe_recommendation(row, name: str = None):
+    """'Back Squat: last 100 kg x 5 @ RPE 7.5, e1RM 117 kg (+1.2/session) -> 102.5 kg x 5 (add load)'"""
+    last = _describe_set(row['LAST_WEIGHT_KG'], row['LAST_REPS'], row['LAST_DURATION_SEC'])
+    if pd.notna(row['LAST_RPE']):
+        last += f" @ RPE {row['LAST_RPE']:.1f}"
+    e1rm = ""
+    if pd.notna(row['E1RM_KG']):
+        e1rm = f", e1RM {row['E1RM_KG']:.0f} kg"
+        if pd.notna(row['E1RM_TREND']):
+            e1rm += f" ({row['E1RM_TREND']:+.1f}/session)"
+    target = _describe_set(row['NEXT_WEIGHT_KG'], row['NEXT_REPS'], row['NEXT_DURATION_SEC'])
+    action = row['ACTION'].lower() + (", stalled" if row['STALLED'] else "")
+    return f"{name or row['EXERCISE_ID']}: last {last}{e1rm} -> {target} ({action})"
@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the unit tests.
+
+The app modules import each other by bare name (as Streamlit runs them from
+streamlit_app/), so that directory goes on sys.path. The exercise library and
+recipes are the local_dev fixtures the DuckDB backend is seeded from; tests that
+need a database use `local_session`, the local backend with a small generated dataset.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(REPO_ROOT), str(REPO_ROOT / 'streamlit_app')]
+
+FIXTURES = REPO_ROOT / 'local_dev' / 'fixtures'
+
+@pytest.fixture(scope='session')
+def exercise_library():
+    with open(FIXTURES / 'exercises_library.json') as f:
+        return json.load(f)
+
+@pytest.fixture(scope='session')
+def exercise_index(exercise_library):
+    from exercise_index import ExerciseIndex
+    return ExerciseIndex(exercise_library)
+
+@pytest.fixture(scope='session')
+def recipes():
+    with open(FIXTURES / 'recipes.json') as f:
+        return json.load(f)
+
+@pytest.fixture(scope='session')
+def recipe_book(recipes):
+    from meal_planner import RecipeBook
+    return RecipeBook(recipes)
+
+@pytest.fixture(scope='session')
+def local_session():
+    from local_dev import datagen, install
+    session = install()
+    datagen.run(datagen.SessionSink(session), clients=3, weeks=2, seed=7)
+    return session
+
+@pytest.fixture
+def client_row(local_session):
+    """A generated client's row as a dict (upper-case column names, as the app reads it)"""
+    return local_session.sql("SELECT * FROM TRAINING_DB.PUBLIC.clients ORDER BY client_id LIMIT 1").to_pandas().iloc[0].to_dict()
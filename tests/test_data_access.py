@@ -0,0 +1,15 @@
+import pytest
+
+from data_access import canonical_sql
+
+@pytest.mark.parametrize("query, canonical", [
+    ("\n    SELECT *\n    FROM clients\n    WHERE client_id = ?\n", "SELECT * FROM clients WHERE client_id = ?"),
+    ("SELECT\t1", "SELECT 1"),
+    ("SELECT 'a  b\n c' AS x,  2", "SELECT 'a  b\n c' AS x, 2"),
+    ("SELECT 'it''s'   FROM t", "SELECT 'it''s' FROM t"),
+])
+def test_canonical_sql(query, canonical):
+    assert canonical_sql(query) == canonical
+
+def test_canonical_sql_matches_across_call_sites():
+    assert canonical_sql("SELECT a,\n       b\n  FROM t") == canonical_sql("SELECT a, b FROM t")
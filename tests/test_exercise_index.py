@@ -0,0 +1,52 @@
+import pytest
+
+from exercise_index import ExerciseIndex, normalize_name
+
+def library_id(exercise_library, name):
+    return next(exercise['exercise_id'] for exercise in exercise_library if exercise['exercise_name'] == name)
+
+@pytest.mark.parametrize("raw, normalized", [
+    ("DB Push-Ups", "dumbbell push up"),
+    ("Lateral Raises", "lateral raise"),
+    ("Bench Press", "bench press"),
+])
+def test_normalize_name(raw, normalized):
+    assert normalize_name(raw) == normalized
+
+@pytest.mark.parametrize("name, expected", [
+    ("Barbell Back Squat", "Barbell Back Squat"),
+    ("back squat", "Barbell Back Squat"),
+    ("Lat Pull Down", "Lat Pulldown"),
+    ("DB RDL", "Dumbbell Romanian Deadlift"),
+    ("Push Ups", "Push-Up"),
+    ("Seated Dumbbell Shoulder Press", "Dumbbell Shoulder Press"),
+])
+def test_resolve_hits(exercise_index, exercise_library, name, expected):
+    assert exercise_index.resolve(name) == library_id(exercise_library, expected)
+
+@pytest.mark.parametrize("name", ["Squat Jump", "Dumbbell Fly", "Burpee", ""])
+def test_resolve_misses(exercise_index, name):
+    assert exercise_index.resolve(name) is None
+
+def test_resolved_names_are_bounded(exercise_library, monkeypatch):
+    monkeypatch.setattr('exercise_index.RESOLVED_NAMES_KEPT', 3)
+    index = ExerciseIndex(exercise_library)
+    for name in ["Squat", "Deadlift", "Bench Press", "Plank", "Burpee"]:
+        index.resolve(name)
+    assert list(index._resolved) == ["bench press", "plank", "burpee"]
+
+def test_code_to_id(exercise_index, exercise_library):
+    exercise_id = library_id(exercise_library, "Plank")
+    code = exercise_index.codes[[exercise['exercise_id'] for exercise in exercise_index.library].index(exercise_id)]
+    assert exercise_index.code_to_id(code) == exercise_id
+    assert exercise_index.code_to_id(exercise_id) == exercise_id
+    assert exercise_index.code_to_id("nope") is None
+
+def test_shortlist_respects_equipment_and_level(exercise_index, exercise_library):
+    by_name = {exercise['exercise_name']: exercise for exercise in exercise_library}
+    shortlist = exercise_index.shortlist(['Dumbbells'], 'Beginner', per_focus=None)
+    names = [name for exercises in shortlist.values() for _, name in exercises]
+    assert names and len(names) == len(set(names))
+    for name in names:
+        assert set(by_name[name]['equipment_required']) <= {'Dumbbells', 'Bodyweight Only'}
+        assert by_name[name]['difficulty_level'] == 'Beginner'
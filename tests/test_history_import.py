@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+import pytest
+
+import history_import
+from history_import import HistoryImportError, normalize_results, normalize_weigh_ins, read_upload
+
+@pytest.fixture(autouse=True)
+def resolver(monkeypatch):
+    library = {'back squat': 'ex-squat', 'bench press': 'ex-bench'}
+    monkeypatch.setattr(history_import, 'resolve_exercise_id', lambda name, default=None: library.get(name.lower(), default))
+
+def upload(text):
+    return read_upload(text.encode())
+
+def test_alias_headers_and_units():
+    raw = upload("Date;Exercise Name;Weight;Reps;RPE\n"
+                 "2026-01-05;Back Squat;225 lbs;5;8\n"
+                 "2026-01-05;Back Squat;225;5;8,5\n"
+                 "2026-01-05;Zercher Squat;135;5;\n")
+    rows, rejected = normalize_results(raw, weight_unit='lb')
+    assert rejected.empty
+    assert list(rows['exercise_id']) == ['ex-squat', 'ex-squat', 'Zercher Squat']
+    assert list(rows['set_number']) == [1, 2, 1]
+    assert list(rows['weight_kg']) == [102.058, 102.058, 61.235]
+    assert list(rows['rpe'].fillna(-1)) == [8, 8.5, -1]
+    assert rows.attrs['unresolved'] == ['Zercher Squat']
+
+def test_zero_based_set_numbers_are_shifted():
+    rows, _ = normalize_results(upload("date,exercise,set,reps\n2026-01-05,Bench Press,0,5\n2026-01-05,Bench Press,1,5\n"))
+    assert list(rows['set_number']) == [1, 2]
+
+def test_timed_sets_count_as_one_rep():
+    rows, rejected = normalize_results(upload("date,exercise,duration\n2026-01-05,Running,1800\n"))
+    assert rejected.empty and list(rows['reps']) == [1]
+
+def test_bad_rows_are_rejected_with_line_and_reason():
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    raw = upload("date,exercise,reps,weight,rpe\n"
+                 "2026-01-05,Bench Press,5,80,8\n"
+                 "yesterday,Bench Press,5,80,8\n"
+                 f"{tomorrow},Bench Press,5,80,8\n"
+                 "2026-01-05,,5,80,8\n"
+                 "2026-01-05,Bench Press,,80,8\n"
+                 "2026-01-05,Bench Press,5000,80,8\n"
+                 "2026-01-05,Bench Press,5,-80,8\n"
+                 "2026-01-05,Bench Press,5,80,11\n")
+    rows, rejected = normalize_results(raw)
+    assert len(rows) == 1
+    assert rejected.to_dict('records') == [
+        {'line': 3, 'reason': 'invalid date'},
+        {'line': 4, 'reason': 'date out of range'},
+        {'line': 5, 'reason': 'missing exercise'},
+        {'line': 6, 'reason': 'missing reps'},
+        {'line': 7, 'reason': 'reps out of range'},
+        {'line': 8, 'reason': 'weight out of range'},
+        {'line': 9, 'reason': 'rpe out of range'},
+    ]
+
+def test_weigh_ins():
+    raw = upload("Measured At,Body Weight,Body Fat\n"
+                 "2026-01-05,82.4,18\n"
+                 "2026-01-06,,18\n"
+                 "2026-01-07,820,18\n"
+                 "2026-01-08,82,90\n")
+    rows, rejected = normalize_weigh_ins(raw)
+    assert list(rows['weight_kg']) == [82.4]
+    assert list(rejected['reason']) == ['missing weight', 'weight out of range', 'body fat out of range']
+
+def test_missing_required_column():
+    with pytest.raises(HistoryImportError, match='performed_date'):
+        normalize_results(upload("exercise,reps\nBench Press,5\n"))
@@ -0,0 +1,133 @@
+import json
+from datetime import date
+
+import pytest
+
+import jobs
+from exercise_index import get_exercise_index
+from generation import CORTEX_MODEL
+from meal_planner import PLANNER_MODEL
+from periodization import RULES_MODEL
+
+START = date(2030, 1, 7)
+
+@pytest.fixture(autouse=True)
+def no_worker_threads(monkeypatch):
+    # Jobs are run by the test itself, not the in-process pool
+    monkeypatch.setattr(jobs, 'JOB_WORKERS', 0)
+
+def job_status(local_session, job_id):
+    return local_session.sql(f"SELECT status FROM TRAINING_DB.PUBLIC.generation_jobs WHERE job_id = '{job_id}'").collect()[0][0]
+
+def test_duplicate_request_returns_the_same_job(client_row):
+    client_id = client_row['CLIENT_ID']
+    job_id, created = jobs.enqueue_job(client_id, 'workout_week', client_row, 40, START)
+    assert created
+    assert jobs.enqueue_job(client_id, 'workout_week', client_row, 40, START) == (job_id, False)
+    assert jobs.enqueue_job(client_id, 'workout_week', client_row, 41, START)[0] != job_id
+
+def test_succeeded_job_is_reused_unless_asked_not_to(client_row):
+    client_id = client_row['CLIENT_ID']
+    job_id, _ = jobs.enqueue_job(client_id, 'workout_week', client_row, 42, START)
+    assert jobs.run_job(job_id)
+    assert jobs.enqueue_job(client_id, 'workout_week', client_row, 42, START) == (job_id, False)
+    new_job_id, created = jobs.enqueue_job(client_id, 'workout_week', client_row, 42, START, reuse_result=False)
+    assert created and new_job_id != job_id
+
+def test_different_model_gets_its_own_job(client_row):
+    client_id = client_row['CLIENT_ID']
+    cortex_job, _ = jobs.enqueue_job(client_id, 'workout_week', client_row, 43, START, model=CORTEX_MODEL)
+    rules_job, created = jobs.enqueue_job(client_id, 'workout_week', client_row, 43, START, model=RULES_MODEL)
+    assert created and rules_job != cortex_job
+    assert jobs.enqueue_job(client_id, 'workout_week', client_row, 43, START, model=RULES_MODEL) == (rules_job, False)
+
+def test_meal_plan_job_records_the_planner(client_row, local_session):
+    job_id, created = jobs.enqueue_job(client_row['CLIENT_ID'], 'meal_plan', client_row, 43, START)
+    assert created
+    job = local_session.sql(f"""
+    SELECT status, cortex_model, prompt FROM TRAINING_DB.PUBLIC.generation_jobs WHERE job_id = '{job_id}'
+    """).collect()[0]
+    assert job['STATUS'] == 'SUCCEEDED' and job['CORTEX_MODEL'] == PLANNER_MODEL
+    assert job['PROMPT'].startswith(f"Recipe plan ({PLANNER_MODEL})")
+    assert jobs.enqueue_job(client_row['CLIENT_ID'], 'meal_plan', client_row, 43, START) == (job_id, False)
+
+def test_run_job_saves_the_week_once(client_row, local_session):
+    client_id = client_row['CLIENT_ID']
+    start = date(2031, 1, 6)
+    job_id, _ = jobs.enqueue_job(client_id, 'workout_week', client_row, 44, start)
+    assert job_status(local_session, job_id) == 'QUEUED'
+
+    assert jobs.run_job(job_id)
+    assert not jobs.run_job(job_id)
+    assert job_status(local_session, job_id) == 'SUCCEEDED'
+    days = local_session.sql(f"""
+    SELECT workout_day FROM TRAINING_DB.PUBLIC.generated_workouts
+    WHERE client_id = '{client_id}' AND workout_date >= '{start}'
+    ORDER BY workout_day
+    """).to_pandas()['WORKOUT_DAY']
+    assert list(days) == list(range(1, 8))
+
+def test_failed_generation_fails_the_job(client_row, local_session, monkeypatch):
+    def no_response(prompt, model):
+        raise ValueError("Cortex unavailable")
+    monkeypatch.setattr(jobs, 'complete_json', no_response)
+    job_id, _ = jobs.enqueue_job(client_row['CLIENT_ID'], 'workout_week', client_row, 46, START)
+
+    assert jobs.run_job(job_id)
+    assert job_status(local_session, job_id) == 'FAILED'
+
+def test_regenerate_days_replaces_only_the_chosen_days(client_row, local_session):
+    def rows(job_id):
+        return local_session.sql(f"""
+        SELECT workout_day, workout_id, workout_focus, exercises::VARCHAR AS exercises
+        FROM TRAINING_DB.PUBLIC.generated_workouts
+        WHERE job_id = '{job_id}'
+        ORDER BY workout_day
+        """).to_pandas().set_index('WORKOUT_DAY')
+
+    job_id, _ = jobs.enqueue_job(client_row['CLIENT_ID'], 'workout_week', client_row, 45, START)
+    jobs.run_job(job_id)
+    before = rows(job_id)
+
+    assert jobs.regenerate_days(job_id, [1]) == [1]
+    after = rows(job_id)
+    assert list(after['WORKOUT_ID']) == list(before['WORKOUT_ID'])
+    assert after.loc[1, 'WORKOUT_FOCUS'] != before.loc[1, 'WORKOUT_FOCUS']
+    assert after.drop(index=1).equals(before.drop(index=1))
+
+def warehouse_job(local_session, client_row, week, result):
+    """A schedule job claimed by process_generation_jobs with `result` as its stored completion"""
+    job_id, _ = jobs.create_job(client_row['CLIENT_ID'], 'workout_week', client_row, week, START, origin='schedule')
+    local_session.sql(f"""
+    UPDATE TRAINING_DB.PUBLIC.generation_jobs
+    SET status = 'RUNNING', worker = 'task:test-{week}', result = PARSE_JSON($${json.dumps(result)}$$)
+    WHERE job_id = '{job_id}'
+    """).collect()
+    return job_id, f"task:test-{week}"
+
+def test_warehouse_completion_is_validated_and_resolved(client_row, local_session):
+    index = get_exercise_index()
+    code = index.codes[0]
+    payload = {'week': 47, 'days': [{'day': 1, 'focus': 'Full Body', 'exercises': [
+        {'exercise_id': code, 'name': 'Listed exercise', 'sets': 3, 'reps': '8-10'},
+    ]}]}
+    job_id, claim = warehouse_job(local_session, client_row, 47, payload)
+
+    assert jobs.finish_warehouse_jobs(claim) == 1
+    assert job_status(local_session, job_id) == 'SUCCEEDED'
+    saved = local_session.sql(f"""
+    SELECT exercises::VARCHAR AS exercises, plan_status
+    FROM TRAINING_DB.PUBLIC.generated_workouts
+    WHERE job_id = '{job_id}'
+    """).collect()
+    assert len(saved) == 1 and saved[0]['PLAN_STATUS'] == 'DRAFT'
+    assert json.loads(saved[0]['EXERCISES'])[0]['exercise_id'] == index.code_to_id(code)
+
+def test_warehouse_completion_failing_validation_fails_the_job(client_row, local_session):
+    job_id, claim = warehouse_job(local_session, client_row, 48, {'week': 48, 'days': [{'day': 9}]})
+
+    assert jobs.finish_warehouse_jobs(claim) == 1
+    assert job_status(local_session, job_id) == 'FAILED'
+    assert not local_session.sql(f"""
+    SELECT 1 FROM TRAINING_DB.PUBLIC.generated_workouts WHERE job_id = '{job_id}'
+    """).collect()
@@ -0,0 +1,60 @@
+import pytest
+
+from meal_planner import MEAL_SLOTS, PLANNER_MODEL, MealPlanningError, RecipeBook, describe_plan, parse_allergies
+
+CLIENT = {'TARGET_CALORIES': 2200, 'TARGET_PROTEIN_G': 160, 'DIETARY_PREFERENCES': [], 'ALLERGIES': 'None'}
+
+def tags_by_id(recipes):
+    return {recipe['recipe_id']: set(recipe['tags']) for recipe in recipes}
+
+def planned_ids(plan):
+    return [meal.recipe_id for day in plan.days for meal in day.meals]
+
+@pytest.mark.parametrize("allergies, allergens", [
+    ("Peanuts and milk", {'nuts', 'dairy'}),
+    ("Shellfish allergy; eggs", {'shellfish', 'egg'}),
+    ("None", set()),
+    (None, set()),
+])
+def test_parse_allergies(allergies, allergens):
+    assert parse_allergies(allergies) == allergens
+
+def test_describe_plan():
+    description = describe_plan({**CLIENT, 'DIETARY_PREFERENCES': ['Vegetarian'], 'ALLERGIES': 'Peanuts and milk'})
+    assert description == (f"Recipe plan ({PLANNER_MODEL}): 2200 kcal and 160 g protein a day; "
+                           "diet Vegetarian; excluding dairy, nuts")
+
+def test_plan_week_fills_every_slot(recipe_book):
+    plan = recipe_book.plan_week(CLIENT, seed='job-1')
+    assert [day.day for day in plan.days] == list(range(1, 8))
+    for day in plan.days:
+        assert [meal.meal_type for meal in day.meals] == [slot for slot, _ in MEAL_SLOTS]
+        assert len({meal.recipe_id for meal in day.meals}) == len(MEAL_SLOTS)
+    assert abs(plan.weekly_totals.calories - 2200) / 2200 < 0.15
+
+def test_plan_week_is_repeatable_per_seed(recipe_book):
+    assert recipe_book.plan_week(CLIENT, seed='job-1') == recipe_book.plan_week(CLIENT, seed='job-1')
+
+def test_plan_week_excludes_allergens(recipes, recipe_book):
+    plan = recipe_book.plan_week({**CLIENT, 'ALLERGIES': 'Peanuts and milk'}, seed=1)
+    tags = tags_by_id(recipes)
+    for recipe_id in planned_ids(plan):
+        assert not tags[recipe_id] & {'contains:nuts', 'contains:dairy'}
+
+def test_plan_week_keeps_dietary_preferences(recipes, recipe_book):
+    plan = recipe_book.plan_week({**CLIENT, 'DIETARY_PREFERENCES': ['Vegetarian']}, seed=1)
+    tags = tags_by_id(recipes)
+    assert all('vegetarian' in tags[recipe_id] for recipe_id in planned_ids(plan))
+
+def test_unknown_preferences_are_ignored(recipe_book):
+    assert recipe_book.allowed(['Paleo-ish'], '').all()
+
+def test_nothing_fits_raises(recipes):
+    book = RecipeBook([recipe for recipe in recipes if 'breakfast' not in recipe['tags']])
+    with pytest.raises(MealPlanningError):
+        book.plan_week(CLIENT)
+
+def test_allergen_excluding_a_whole_slot_raises(recipe_book):
+    with pytest.raises(MealPlanningError):
+        recipe_book.plan_week({**CLIENT, 'DIETARY_PREFERENCES': ['Vegan', 'Keto'],
+                               'ALLERGIES': 'nuts, soy, gluten, dairy, egg, fish, shellfish'})
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from models import PlanValidationError, WeekPlan, decode_meal_plan, decode_week
+
+WEEK = {
+    "week": 2,
+    "days": [
+        {"day": 1, "day_name": "Monday", "focus": "Upper Body Push",
+         "exercises": [{"name": "Bench Press", "sets": "4", "reps": 8, "rest_sec": 90.0}]},
+        {"day": 2, "is_rest_day": "true", "recovery_tips": "Walk"},
+    ],
+}
+
+def test_decode_week_applies_types_and_defaults():
+    plan = decode_week(WEEK)
+    assert plan.week == 2
+    monday, tuesday = plan.days
+    assert monday.exercises[0].sets == 4
+    assert monday.exercises[0].rest_sec == 90
+    assert monday.exercises[0].notes == ''
+    assert tuesday.is_rest_day and tuesday.focus == 'Rest Day' and tuesday.day_name == 'Tuesday'
+
+def test_decode_week_accepts_completion_json_text():
+    assert decode_week(json.dumps(WEEK)) == decode_week(WEEK)
+
+def test_decode_week_uses_given_week_when_missing():
+    assert decode_week({"days": WEEK["days"]}, week=5).week == 5
+
+def test_decode_week_drops_unusable_entries():
+    plan = decode_week({"days": [
+        {"day": 9, "focus": "Out of range"},
+        {"day": "x"},
+        {"day": 1, "exercises": [{"sets": 3}, {"name": "  "}, {"name": "Squat"}, "not an object"]},
+        {"day": 1, "focus": "Duplicate day"},
+    ]})
+    assert [day.day for day in plan.days] == [1]
+    assert [exercise.name for exercise in plan.days[0].exercises] == ["Squat"]
+
+def test_incomplete_days_lists_missing_and_empty_days():
+    plan = decode_week({"days": [{"day": 1, "exercises": []}, {"day": 2, "is_rest_day": True}]})
+    assert plan.incomplete_days() == [1, 3, 4, 5, 6, 7]
+
+def test_with_days_replaces_by_day_number():
+    plan = decode_week(WEEK)
+    new_day = decode_week({"days": [{"day": 2, "focus": "Legs", "exercises": [{"name": "Squat"}]}]}).days[0]
+    revised = plan.with_days([new_day])
+    assert isinstance(revised, WeekPlan)
+    assert [day.focus for day in revised.days] == ["Upper Body Push", "Legs"]
+
+@pytest.mark.parametrize("payload", [
+    "not json",
+    "[1, 2]",
+    {"days": []},
+    {"days": "Monday"},
+    {"days": [{"day": 0}]},
+    {"week": True, "days": [{"day": 1}]},
+])
+def test_decode_week_rejects_invalid_payloads(payload):
+    with pytest.raises(PlanValidationError):
+        decode_week(payload)
+
+def test_decode_meal_plan():
+    plan = decode_meal_plan({
+        "weekly_totals": {"calories": "2100", "protein": 150.4},
+        "days": [{"day": 1, "meals": [{"meal_type": "breakfast", "foods": "Oats", "calories": 400}]}],
+    })
+    assert plan.weekly_totals.calories == 2100 and plan.weekly_totals.protein == 150
+    assert plan.days[0].meals[0].foods == ["Oats"]
+
+@pytest.mark.parametrize("payload", [
+    {"days": []},
+    {"weekly_totals": "lots", "days": [{"day": 1}]},
+    {"weekly_totals": {"calories": "many"}, "days": [{"day": 1}]},
+])
+def test_decode_meal_plan_rejects_invalid_payloads(payload):
+    with pytest.raises(PlanValidationError):
+        decode_meal_plan(payload)
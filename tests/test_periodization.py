@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+import periodization
+from periodization import BASE_SETS, build_week, target_load
+
+CLIENT = {
+    'DAYS_PER_WEEK': 4,
+    'FITNESS_LEVEL': 'Intermediate',
+    'FITNESS_GOALS': ['Muscle Gain'],
+    'AVAILABLE_EQUIPMENT': ['Full Gym'],
+    'WORKOUT_DURATION_MIN': 60,
+}
+
+@pytest.fixture(autouse=True)
+def library(monkeypatch, exercise_index):
+    monkeypatch.setattr(periodization, 'get_exercise_index', lambda: exercise_index)
+
+def training_days(plan):
+    return [day for day in plan.days if not day.is_rest_day]
+
+def main_lifts(plan):
+    return [exercise for day in training_days(plan) for exercise in day.exercises if exercise.reps == '8-12']
+
+@pytest.mark.parametrize("rpe, load", [(6.5, 65.0), (8.0, 67.5), (9.0, 70.0), (None, 42.5)])
+def test_target_load(rpe, load):
+    assert target_load(100, '8-12', rpe) == load
+
+def test_target_load_uses_light_plates():
+    assert target_load(20, '8-12', 8.0) == 14.0
+
+@pytest.mark.parametrize("days_per_week", range(1, 8))
+def test_split_matches_days_per_week(days_per_week):
+    plan = build_week({**CLIENT, 'DAYS_PER_WEEK': days_per_week}, week=1)
+    assert [day.day for day in plan.days] == list(range(1, 8))
+    assert len(training_days(plan)) == days_per_week
+    assert any(day.focus == 'Easy Run' for day in plan.days) == (days_per_week >= 3)
+    for day in training_days(plan):
+        assert day.exercises
+        assert all(exercise.exercise_id for exercise in day.exercises)
+        assert len({exercise.exercise_id for exercise in day.exercises}) == len(day.exercises)
+
+def test_block_progression_sets():
+    base = BASE_SETS['Intermediate']
+    sets = {week: {exercise.sets for exercise in main_lifts(build_week(CLIENT, week))} for week in (1, 3, 4, 5)}
+    assert sets == {1: {base}, 3: {base + 1}, 4: {base - 1}, 5: {base}}
+
+def test_target_loads_rise_through_the_block_and_drop_on_deload():
+    week_one = build_week(CLIENT, 1)
+    exercise_id = main_lifts(week_one)[0].exercise_id
+    recommendations = pd.DataFrame({'EXERCISE_ID': [exercise_id], 'E1RM_KG': [100.0]})
+    notes = [
+        next(exercise.notes for exercise in main_lifts(build_week(CLIENT, week, recommendations))
+             if exercise.exercise_id == exercise_id)
+        for week in (1, 2, 3, 4)
+    ]
+    assert [note.rsplit('target ', 1)[-1] for note in notes] == ['65 kg', '67.5 kg', '70 kg', '42.5 kg']
+
+def test_bodyweight_only_client_still_gets_a_full_week():
+    plan = build_week({**CLIENT, 'AVAILABLE_EQUIPMENT': ['Bodyweight Only'], 'FITNESS_LEVEL': 'Beginner'}, 1)
+    assert all(day.exercises for day in training_days(plan))
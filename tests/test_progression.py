@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pandas as pd
+
+from data_access import insert_exercise_results
+from progression import SET_COLUMNS, clear_recommendations, get_recommendations, recommend
+
+def sessions(exercise_id, rows):
+    """Sets frame from (date, weight, reps, rpe, duration) per session (one set each)"""
+    return pd.DataFrame(
+        [(exercise_id, pd.Timestamp(day), 1, reps, weight, rpe, duration) for day, weight, reps, rpe, duration in rows],
+        columns=SET_COLUMNS,
+    )
+
+def action(sets_df):
+    return recommend(sets_df).set_index('EXERCISE_ID')[['ACTION', 'NEXT_WEIGHT_KG', 'NEXT_REPS', 'NEXT_DURATION_SEC']]
+
+def test_empty_history():
+    assert recommend(pd.DataFrame(columns=SET_COLUMNS)).empty
+
+def test_easy_top_set_adds_load():
+    sets = sessions('squat', [('2026-01-01', 100, 5, 7, None), ('2026-01-03', 102.5, 5, 7.5, None)])
+    row = action(sets).loc['squat']
+    assert row['ACTION'] == 'Add load' and row['NEXT_WEIGHT_KG'] == 105
+
+def test_light_loads_step_by_one_kg():
+    row = action(sessions('curl', [('2026-01-01', 12, 10, 7, None)])).loc['curl']
+    assert row['ACTION'] == 'Add load' and row['NEXT_WEIGHT_KG'] == 13
+
+def test_near_failure_repeats():
+    row = action(sessions('bench', [('2026-01-01', 80, 5, 9.5, None)])).loc['bench']
+    assert row['ACTION'] == 'Repeat' and row['NEXT_WEIGHT_KG'] == 80
+
+def test_stalled_and_hard_deloads():
+    sets = sessions('deadlift', [
+        ('2026-01-01', 140, 5, 8.5, None),
+        ('2026-01-03', 140, 5, 8.5, None),
+        ('2026-01-05', 140, 5, 9, None),
+        ('2026-01-07', 140, 4, 9, None),
+    ])
+    row = action(sets).loc['deadlift']
+    assert row['ACTION'] == 'Deload' and row['NEXT_WEIGHT_KG'] == 125
+
+def test_timed_sets_add_time():
+    row = action(sessions('plank', [('2026-01-01', None, 1, 7, 300)])).loc['plank']
+    assert row['ACTION'] == 'Add time' and row['NEXT_DURATION_SEC'] == 330
+
+def test_bodyweight_reps_add_a_rep():
+    row = action(sessions('push up', [('2026-01-01', None, 12, 8.5, None)])).loc['push up']
+    assert row['ACTION'] == 'Add a rep' and row['NEXT_REPS'] == 13
+
+def test_top_set_is_heaviest_of_the_session():
+    sets = pd.DataFrame([
+        ('row', pd.Timestamp('2026-01-01'), 1, 10, 60, 7, None),
+        ('row', pd.Timestamp('2026-01-01'), 2, 6, 70, 7, None),
+    ], columns=SET_COLUMNS)
+    result = recommend(sets).iloc[0]
+    assert result['LAST_WEIGHT_KG'] == 70 and result['LAST_REPS'] == 6
+    assert result['E1RM_KG'] == 70 * (1 + 6 / 30)
+
+def test_recommendations_are_cached_until_cleared(client_row):
+    client_id = client_row['CLIENT_ID']
+    assert 'cache-test' not in set(get_recommendations(client_id)['EXERCISE_ID'])
+    assert insert_exercise_results(client_id, 'w-cache-test', 'cache-test', datetime.now(),
+                                   [{'set_number': 1, 'reps': 5, 'weight_kg': 60.0, 'rpe': 7.0}]) == 1
+
+    assert 'cache-test' not in set(get_recommendations(client_id)['EXERCISE_ID'])
+    clear_recommendations(client_id)
+    assert 'cache-test' in set(get_recommendations(client_id)['EXERCISE_ID'])
@@ -0,0 +1,85 @@
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+import data_access
+import history_import
+from models import DayPlan, Exercise, WeekPlan
+
+START = date(2030, 3, 4)
+
+@pytest.fixture
+def client_id(local_session):
+    return local_session.sql("SELECT MAX(client_id) FROM TRAINING_DB.PUBLIC.clients").collect()[0][0]
+
+def base_counts(local_session, client_id):
+    return local_session.sql(f"""
+    SELECT COUNT(*), MAX(performed_date) FROM TRAINING_DB.PUBLIC.exercise_results WHERE client_id = '{client_id}'
+    """).collect()[0]
+
+def week(number, focus):
+    return WeekPlan(week=number, days=[
+        DayPlan(day=1, day_name='Monday', focus=focus, exercises=[Exercise(name='Barbell Back Squat')]),
+        DayPlan(day=2, day_name='Tuesday', is_rest_day=True, focus='Rest Day'),
+    ])
+
+def test_first_read_builds_from_the_base_tables(local_session, client_id):
+    data_access.invalidate_client_snapshot(client_id)
+    snapshot = data_access.get_client_snapshot(client_id)
+    sets_logged, last_performed = base_counts(local_session, client_id)
+    assert snapshot['sets_logged'] == sets_logged
+    assert pd.Timestamp(snapshot['last_performed_date']) == pd.Timestamp(last_performed)
+    assert data_access._read_client_snapshot(client_id) == snapshot
+
+def test_saved_workouts_and_results_update_the_snapshot(local_session, client_id):
+    before = data_access.get_client_snapshot(client_id)
+    assert data_access.save_weekly_workouts(client_id, week(50, 'Lower Body'), 'test week', start_date=START) == 2
+    assert data_access.insert_exercise_results(client_id, 'w-test', 'squat', datetime(2030, 3, 4), [
+        {'set_number': 1, 'reps': 5, 'weight_kg': 100.0},
+        {'set_number': 2, 'reps': 5, 'weight_kg': 100.0},
+    ]) == 2
+
+    snapshot = data_access.get_client_snapshot(client_id)
+    assert snapshot['current_week'] == 50
+    assert pd.Timestamp(snapshot['last_workout_date']) == pd.Timestamp(2030, 3, 5)
+    assert snapshot['sets_logged'] == before['sets_logged'] + 2
+    assert pd.Timestamp(snapshot['last_performed_date']) == pd.Timestamp(2030, 3, 4)
+    assert sorted(snapshot['recent_workouts'][:2], key=lambda workout: workout['day']) == [
+        {'week': 50, 'day': 1, 'focus': 'Lower Body', 'duration_min': 60},
+        {'week': 50, 'day': 2, 'focus': 'Rest Day', 'duration_min': 0},
+    ]
+
+    # The incrementally updated row matches one rebuilt from scratch
+    data_access.invalidate_client_snapshot(client_id)
+    assert data_access.get_client_snapshot(client_id) | {'updated_at': None} == snapshot | {'updated_at': None}
+
+def test_recent_workouts_keep_days_another_writer_saved(local_session, client_id):
+    data_access.get_client_snapshot(client_id)
+    # A concurrent save (e.g. a job worker) whose snapshot update this session never saw
+    local_session.sql(f"""
+    INSERT INTO TRAINING_DB.PUBLIC.generated_workouts
+    (workout_id, client_id, workout_date, workout_week, workout_day, workout_focus, duration_min,
+     warm_up, exercises, cool_down, plan_status)
+    SELECT 'w-other-writer', '{client_id}', '2030-03-13', 51, 3, 'Upper Body', 45,
+           'Warm up', PARSE_JSON('[]'), 'Cool down', 'ACTIVE'
+    """).collect()
+    data_access.save_weekly_workouts(client_id, week(51, 'Full Body'), 'test week', start_date=date(2030, 3, 11))
+
+    recent = data_access.get_client_snapshot(client_id)['recent_workouts']
+    assert {'week': 51, 'day': 3, 'focus': 'Upper Body', 'duration_min': 45} in recent
+    assert {'week': 51, 'day': 1, 'focus': 'Full Body', 'duration_min': 60} in recent
+
+def test_import_invalidates_the_snapshot(local_session, client_id, monkeypatch):
+    monkeypatch.setattr(history_import, 'resolve_exercise_id', lambda name, default=None: default)
+    data_access.get_client_snapshot(client_id)
+    rows, _ = history_import.normalize_results(pd.DataFrame({
+        'date': ['2020-03-20', '2020-03-20'], 'exercise': ['Front Squat', 'Front Squat'], 'reps': ['3', '3'],
+    }))
+    assert history_import.import_exercise_results(client_id, rows)['inserted'] == 2
+
+    assert data_access._read_client_snapshot(client_id) is None
+    sets_logged, last_performed = base_counts(local_session, client_id)
+    snapshot = data_access.get_client_snapshot(client_id)
+    assert snapshot['sets_logged'] == sets_logged
+    assert pd.Timestamp(snapshot['last_performed_date']) == pd.Timestamp(last_performed)